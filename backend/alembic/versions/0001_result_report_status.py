@@ -0,0 +1,30 @@
+"""Track PDF report status on results
+
+Revision ID: 0001_result_report_status
+Revises:
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001_result_report_status"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _columns(table: str) -> set[str]:
+    return {column["name"] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade() -> None:
+    # Tables are bootstrapped by init_db's create_all, which already includes the
+    # column on fresh databases; only older databases need it added.
+    if "report_status" not in _columns("results"):
+        op.add_column("results", sa.Column("report_status", sa.String(16), nullable=False, server_default="ready"))
+
+
+def downgrade() -> None:
+    op.drop_column("results", "report_status")
@@ -0,0 +1,39 @@
+"""Packed float64 storage for pump and system curve points
+
+Revision ID: 0002_packed_curve_points
+Revises: 0001_result_report_status
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002_packed_curve_points"
+down_revision = "0001_result_report_status"
+branch_labels = None
+depends_on = None
+
+
+def _columns(table: str) -> dict[str, dict]:
+    return {column["name"]: column for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade() -> None:
+    pumps = _columns("pumps")
+    # batch_alter_table lets SQLite drop the NOT NULL by rebuilding the table.
+    with op.batch_alter_table("pumps") as batch:
+        if "curve_blob" not in pumps:
+            batch.add_column(sa.Column("curve_blob", sa.LargeBinary(), nullable=True))
+        if not pumps["curve_points"]["nullable"]:
+            batch.alter_column("curve_points", existing_type=sa.JSON(), nullable=True)
+    if "csv_blob" not in _columns("system_curves"):
+        op.add_column("system_curves", sa.Column("csv_blob", sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    # Rows stored only as blobs must be unpacked first: python -m app.scripts.pack_curves --unpack
+    op.drop_column("system_curves", "csv_blob")
+    with op.batch_alter_table("pumps") as batch:
+        batch.alter_column("curve_points", existing_type=sa.JSON(), nullable=False)
+        batch.drop_column("curve_blob")
@@ -0,0 +1,30 @@
+"""Index users.email explicitly
+
+Revision ID: 0003_users_email_index
+Revises: 0002_packed_curve_points
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003_users_email_index"
+down_revision = "0002_packed_curve_points"
+branch_labels = None
+depends_on = None
+
+
+def _indexes(table: str) -> set[str]:
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade() -> None:
+    # Field(index=True) was ignored next to sa_column, so older databases only carry the
+    # unique constraint; fresh create_all databases already have the index.
+    if "ix_users_email" not in _indexes("users"):
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_email", table_name="users")
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from .units import UnitSystem
 
@@ -42,6 +42,30 @@ class PumpRead(PumpCreate):
     created_at: datetime
 
 
+class PumpSummary(BaseModel):
+    id: int
+    version: int
+    name: str
+    rated_speed_rpm: float
+    unit_system: UnitSystem
+    flow_unit: str
+    head_unit: str
+    created_at: datetime
+
+
+class PumpImportItem(BaseModel):
+    id: int
+    name: str
+    version: int
+    source: str
+    points: int
+
+
+class PumpImportRead(BaseModel):
+    imported: int
+    pumps: List[PumpImportItem]
+
+
 class PumpVersionRead(BaseModel):
     pump_id: int
     version: int
@@ -81,6 +105,31 @@ class SystemCurveRead(SystemCurveCreate):
     created_at: datetime
 
 
+class SystemCurveSummary(BaseModel):
+    id: int
+    version: int
+    name: str
+    unit_system: UnitSystem
+    flow_unit: str
+    head_unit: str
+    created_at: datetime
+
+
+class SampledCurve(BaseModel):
+    name: str
+    kind: str = Field(pattern="^(pump|system|aggregate)$")
+    speed_ratio: Optional[float] = None
+    flow: List[float]
+    head: List[float]
+    efficiency: Optional[List[float]] = None
+    power: Optional[List[float]] = None
+
+
+class ScenarioCurvesRead(BaseModel):
+    scenario_id: int
+    curves: List[SampledCurve]
+
+
 class ScenarioPumpConfig(BaseModel):
     pump_id: int
     version: Optional[int] = None
@@ -104,6 +153,152 @@ class ScenarioRead(ScenarioCreate):
     created_at: datetime
 
 
+class SpeedOptimizationRequest(BaseModel):
+    target_flow: Optional[float] = Field(default=None, ge=0)
+    target_head: Optional[float] = Field(default=None, ge=0)
+    flow_unit: str = "meter**3/second"
+    head_unit: str = "meter"
+    min_speed_ratio: float = Field(ge=0.3, le=1.2, default=0.3)
+    max_speed_ratio: float = Field(ge=0.3, le=1.2, default=1.2)
+
+    @model_validator(mode="after")
+    def check_target(self) -> "SpeedOptimizationRequest":
+        if (self.target_flow is None) == (self.target_head is None):
+            raise ValueError("Provide exactly one of target_flow or target_head")
+        if self.min_speed_ratio > self.max_speed_ratio:
+            raise ValueError("min_speed_ratio must not exceed max_speed_ratio")
+        return self
+
+
+class SpeedOptimizationOption(BaseModel):
+    pump_id: int
+    configuration: str
+    running: int
+    speed_ratio: float
+    flow: float
+    head: float
+    power: float
+    efficiency: Optional[float] = None
+
+
+class SpeedOptimizationRead(BaseModel):
+    scenario_id: int
+    flow: float
+    head: float
+    options: List[SpeedOptimizationOption]
+
+
+class StagingPoint(BaseModel):
+    flow: float
+    feasible: bool
+    pump_id: Optional[int] = None
+    configuration: Optional[str] = None
+    running: int = 0
+    speed_ratio: Optional[float] = None
+    head: Optional[float] = None
+    power: Optional[float] = None
+
+
+class StagingRead(BaseModel):
+    scenario_id: int
+    flow_unit: str
+    max_flow: float
+    table_points: int
+    points: List[StagingPoint]
+
+
+class DutyBin(BaseModel):
+    flow: float = Field(ge=0)
+    hours: float = Field(ge=0)
+
+
+class LifecycleCostRequest(BaseModel):
+    pump_ids: List[int] = Field(min_length=1, max_length=500)
+    system_curve_id: int
+    duty: List[DutyBin] = Field(min_length=1)
+    flow_unit: str = "meter**3/second"
+    max_running: int = Field(default=1, ge=1, le=12)
+    arrangement: str = Field(default="parallel", pattern="^(parallel|series)$")
+    min_speed_ratio: float = Field(ge=0.3, le=1.2, default=0.3)
+    max_speed_ratio: float = Field(ge=0.3, le=1.2, default=1.2)
+    energy_price: float = Field(gt=0, description="currency per kWh")
+    demand_charge: float = Field(default=0.0, ge=0, description="currency per kW of annual peak")
+    escalation: float = Field(default=0.0, ge=-0.5, le=1.0)
+    discount_rate: float = Field(default=0.05, ge=0, le=1.0)
+    years: int = Field(default=20, ge=1, le=60)
+    capital_costs: dict[int, float] = Field(default_factory=dict, description="purchase cost by pump id")
+
+    @model_validator(mode="after")
+    def check_duty(self) -> "LifecycleCostRequest":
+        if sum(duty_bin.hours for duty_bin in self.duty) > 8784:
+            raise ValueError("Duty hours exceed one year")
+        if self.min_speed_ratio > self.max_speed_ratio:
+            raise ValueError("min_speed_ratio must not exceed max_speed_ratio")
+        return self
+
+
+class LifecycleCandidate(BaseModel):
+    pump_id: int
+    name: str
+    version: int
+    annual_energy_kwh: float
+    peak_power_kw: float
+    annual_cost: float
+    capital_cost: float
+    npv: float
+    unmet_hours: float
+    feasible: bool
+
+
+class LifecycleCostRead(BaseModel):
+    system_curve_id: int
+    years: int
+    discount_rate: float
+    candidates: List[LifecycleCandidate]
+
+
+class LifecycleCostStatus(BaseModel):
+    task_id: str
+    state: str
+    result: Optional[LifecycleCostRead] = None
+    error: Optional[str] = None
+
+
+class SimulationTotals(BaseModel):
+    configuration: str
+    pump_id: int
+    steps: int
+    energy_kwh: float
+    pumped_m3: float
+    specific_energy_kwh_per_m3: Optional[float] = None
+    peak_power_kw: float
+    run_hours: float
+    unmet_steps: int
+    unmet_hours: float
+
+
+class SimulationRead(BaseModel):
+    scenario_id: int
+    steps: int
+    series_path: str
+    entries: List[SimulationTotals]
+
+
+class SimulationStatus(BaseModel):
+    task_id: str
+    state: str
+    done: int = 0
+    total: int = 0
+    result: Optional[SimulationRead] = None
+    error: Optional[str] = None
+
+
+class Crossing(BaseModel):
+    flow: float
+    head: float
+    unstable: bool = False
+
+
 class OperatingPoint(BaseModel):
     configuration: str
     speed_ratio: float
@@ -111,6 +306,12 @@ class OperatingPoint(BaseModel):
     head: float
     efficiency: Optional[float] = None
     power: Optional[float] = None
+    # Unset on results stored before the solver reported every crossing. ``calls`` is
+    # shared by all speeds of one entry.
+    unstable: Optional[bool] = None
+    intersections: Optional[List[Crossing]] = None
+    evaluations: Optional[int] = None
+    calls: Optional[int] = None
 
 
 class ResultRead(BaseModel):
@@ -119,6 +320,7 @@ class ResultRead(BaseModel):
     operating_points: List[OperatingPoint]
     csv_path: str
     pdf_path: str
+    report_status: str = "ready"
     created_at: datetime
 
 
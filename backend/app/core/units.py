@@ -1,16 +1,45 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Iterable, Literal, Tuple
+from typing import TYPE_CHECKING, Iterable, Literal, Tuple
 
 import numpy as np
-from pint import Quantity, UnitRegistry
+
+if TYPE_CHECKING:
+    from pint import Quantity, UnitRegistry
 
 UnitSystem = Literal["si", "us"]
 
+_US_GALLON = 231 * 0.0254 ** 3  # m^3
+_FOOT = 0.3048  # m
+_HORSEPOWER = 550 * _FOOT * 0.45359237 * 9.80665  # W
+
+# Exact SI factors for the units the API always sees, so the common paths never load
+# pint. tests/test_units.py checks every entry against pint.
+_SI_FACTORS = {
+    "meter**3/second": {
+        "meter**3/second": 1.0,
+        "m**3/s": 1.0,
+        "gpm": _US_GALLON / 60,
+        "gallon_us/minute": _US_GALLON / 60,
+        "meter**3/hour": 1 / 3600,
+        "m**3/hour": 1 / 3600,
+        "liter/second": 1e-3,
+        "L/s": 1e-3,
+    },
+    "meter": {"meter": 1.0, "m": 1.0, "foot": _FOOT, "ft": _FOOT},
+    "watt": {"watt": 1.0, "W": 1.0, "kilowatt": 1e3, "kW": 1e3, "horsepower": _HORSEPOWER, "hp": _HORSEPOWER},
+    "dimensionless": {"percent": 0.01, "%": 0.01},
+}
+COMMON_CONVERSIONS: dict[Tuple[str, str], Tuple[float, float]] = {
+    (source, target): (scale, 0.0) for target, sources in _SI_FACTORS.items() for source, scale in sources.items()
+}
+
 
 @lru_cache(maxsize=1)
 def get_unit_registry() -> UnitRegistry:
+    from pint import UnitRegistry
+
     ureg = UnitRegistry(autoconvert_offset_to_baseunit=True)
     ureg.define("percent = 0.01 dimensionless = %")
     ureg.define("gallon_us = gallon")
@@ -20,6 +49,8 @@ def get_unit_registry() -> UnitRegistry:
 
 
 def format_units(unit: Quantity | str) -> str:
+    from pint import Quantity
+
     if isinstance(unit, Quantity):
         unit = unit.units
     return f"{unit:~P}"
@@ -44,10 +75,36 @@ def parse_value(value: float, unit: str) -> Quantity:
     return value * ureg(unit)
 
 
+@lru_cache(maxsize=256)
+def conversion_factors(from_unit: str, to_unit: str) -> Tuple[float, float] | None:
+    """(scale, offset) such that ``value_to = value_from * scale + offset``.
+
+    Common pairs come from ``COMMON_CONVERSIONS``; anything else is resolved through
+    pint once per unit pair. Returns None for conversions that are not affine (e.g.
+    logarithmic units), which must go through pint every time.
+    """
+    factors = COMMON_CONVERSIONS.get((from_unit, to_unit))
+    if factors is not None:
+        return factors
+    ureg = get_unit_registry()
+    probe = np.array([0.0, 1.0, 1000.0]) * ureg(from_unit)
+    y0, y1, y2 = probe.to(ureg(to_unit)).magnitude
+    scale, offset = float((y2 - y0) / 1000.0), float(y0)
+    if not np.isclose(y1, scale + offset, rtol=1e-9, atol=1e-12 * abs(offset)):
+        return None
+    return scale, offset
+
+
 def convert_array(values: Iterable[float], from_unit: str, to_unit: str) -> np.ndarray:
-    quantity = ensure_quantity(values, from_unit)
-    converted = convert(quantity, to_unit)
-    return np.asarray(converted.magnitude, dtype=float)
+    factors = conversion_factors(from_unit, to_unit)
+    if factors is None:
+        quantity = ensure_quantity(values, from_unit)
+        return np.asarray(convert(quantity, to_unit).magnitude, dtype=float)
+    scale, offset = factors
+    converted = np.asarray(values, dtype=float) * scale
+    if offset:
+        converted += offset
+    return converted
 
 
 def unit_system_defaults(system: UnitSystem) -> Tuple[str, str]:
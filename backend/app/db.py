@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import os
 from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Literal
 
 from pydantic_settings import BaseSettings
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
 from sqlalchemy import create_engine
-from sqlmodel import SQLModel
+from sqlmodel import Session, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 
 class Settings(BaseSettings):
@@ -17,6 +19,21 @@ class Settings(BaseSettings):
     secret_key: str = "change-me"
     access_token_expiry_minutes: int = 30
     refresh_token_expiry_minutes: int = 60 * 24 * 14
+    result_cache_size: int = 1024
+    result_cache_ttl_seconds: int = 60 * 60 * 24 * 7
+    curve_cache_size: int = 256
+    staging_cache_size: int = 64
+    # Staging tables kept on disk for restarts; the least recently used files are removed.
+    staging_files_max: int = 256
+    # "binary" stores new curves as packed float64 blobs instead of JSON lists.
+    curve_storage: Literal["json", "binary"] = "json"
+    # Connection pools: the sync pool serves threadpool routes and Celery workers, the
+    # async pool serves the read routes on the event loop.
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    async_db_pool_size: int = 20
+    async_db_max_overflow: int = 40
+    db_pool_timeout: float = 30.0
 
     class Config:
         env_prefix = "APP_"
@@ -26,11 +43,29 @@ class Settings(BaseSettings):
 
 settings = Settings()
 
-async_engine = create_async_engine(settings.database_url, echo=False, future=True)
-async_session_factory = async_sessionmaker(async_engine, expire_on_commit=False)
 
-sync_engine = create_engine(settings.sync_database_url, future=True)
-session_factory = sessionmaker(bind=sync_engine, autoflush=False, expire_on_commit=False)
+
+def _pool_options(url: str, pool_size: int, max_overflow: int) -> dict[str, Any]:
+    # SQLite pools (used in tests) take no sizing arguments.
+    if url.startswith("sqlite"):
+        return {}
+    return {"pool_size": pool_size, "max_overflow": max_overflow, "pool_timeout": settings.db_pool_timeout, "pool_pre_ping": True}
+
+
+async_engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    future=True,
+    **_pool_options(settings.database_url, settings.async_db_pool_size, settings.async_db_max_overflow),
+)
+async_session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+sync_engine = create_engine(
+    settings.sync_database_url,
+    future=True,
+    **_pool_options(settings.sync_database_url, settings.db_pool_size, settings.db_max_overflow),
+)
+session_factory = sessionmaker(bind=sync_engine, class_=Session, autoflush=False, expire_on_commit=False)
 
 
 async def init_db() -> None:
@@ -51,6 +86,12 @@ async def get_async_session() -> AsyncSession:
         await session.close()
 
 
+async def get_async_read_session() -> AsyncIterator[AsyncSession]:
+    """Async session for read-only routes; nothing is committed."""
+    async with async_session_factory() as session:
+        yield session
+
+
 def get_session() -> Session:
     session: Session = session_factory()
     try:
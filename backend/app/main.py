@@ -5,7 +5,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from .db import init_db
-from .routers import auth, pumps, results, scenarios, system_curves
+from .routers import auth, lifecycle, pumps, results, scenarios, simulations, system_curves
+from .tasks.compute import curve_cache, result_cache
 
 app = FastAPI(title="Hydraulic Toolbox API")
 
@@ -15,6 +16,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -28,10 +30,20 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/health/cache")
+def cache_health() -> dict[str, dict[str, int]]:
+    # Process-local counters for this API instance; workers report theirs through
+    # `celery inspect curve_cache_stats`.
+    return {"curve_cache": curve_cache.stats(), "result_cache": result_cache.local.stats()}
+
+
 app.include_router(auth.router)
 app.include_router(pumps.router)
 app.include_router(system_curves.router)
 app.include_router(scenarios.router)
+app.include_router(simulations.router)
+app.include_router(lifecycle.router)
 app.include_router(results.router)
+app.include_router(results.files_router)
 app.mount("/files", StaticFiles(directory="data/exports"), name="exports")
 
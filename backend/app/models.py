@@ -1,9 +1,7 @@
-from __future__ import annotations
-
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, JSON, String, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, JSON, LargeBinary, String, UniqueConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -27,7 +25,10 @@ class Pump(SQLModel, table=True):
     power_unit: Optional[str] = None
     npshr_unit: Optional[str] = None
     metadata_json: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON, nullable=False))
-    curve_points: Dict[str, Any] = Field(sa_column=Column(JSON, nullable=False))
+    # Curve columns are stored either as JSON lists or packed into curve_blob; see
+    # services/packing.decode_points for the dual read.
+    curve_points: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON, nullable=True))
+    curve_blob: Optional[bytes] = Field(default=None, sa_column=Column(LargeBinary, nullable=True))
     created_at: datetime = Field(default_factory=datetime.utcnow, sa_column=Column(DateTime(timezone=False), nullable=False))
 
 
@@ -47,6 +48,7 @@ class SystemCurve(SQLModel, table=True):
     head_unit: str
     extra_terms: Dict[str, Any] = Field(sa_column=Column(JSON, nullable=False))
     csv_points: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
+    csv_blob: Optional[bytes] = Field(default=None, sa_column=Column(LargeBinary, nullable=True))
     created_at: datetime = Field(default_factory=datetime.utcnow, sa_column=Column(DateTime(timezone=False), nullable=False))
 
 
@@ -75,6 +77,7 @@ class Result(SQLModel, table=True):
     operating_points: Dict[str, Any] = Field(sa_column=Column(JSON, nullable=False))
     csv_path: str
     pdf_path: str
+    report_status: str = Field(default="pending", sa_column=Column(String(16), nullable=False, server_default="ready"))
     created_at: datetime = Field(default_factory=datetime.utcnow, sa_column=Column(DateTime(timezone=False), nullable=False))
 
     scenario: Scenario = Relationship(back_populates="results")
@@ -84,7 +87,7 @@ class User(SQLModel, table=True):
     __tablename__ = "users"
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    email: str = Field(index=True, sa_column=Column(String(255), unique=True, nullable=False))
+    email: str = Field(sa_column=Column(String(255), unique=True, index=True, nullable=False))
     hashed_password: str = Field(sa_column=Column(String(255), nullable=False))
     created_at: datetime = Field(default_factory=datetime.utcnow, sa_column=Column(DateTime(timezone=False), nullable=False))
 
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable
+
+from fastapi import HTTPException, status
+from sqlmodel import Session
+
+from ..models import Pump
+from ..tasks.compute import PumpEntryKey, load_entry_pumps, pump_entry_key
+
+
+def entry_pumps(session: Session, entries: Iterable[Dict[str, Any]]) -> Dict[PumpEntryKey, Pump]:
+    """Pumps of scenario entries keyed by (id, version); 404 on the first entry that is missing."""
+    entries = list(entries)
+    pumps = load_entry_pumps(session, entries)
+    for entry in entries:
+        if pump_entry_key(entry) not in pumps:
+            version = entry.get("version")
+            label = f"Pump {entry['pump_id']}" + (f" version {version}" if version is not None else "")
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{label} not found")
+    return pumps
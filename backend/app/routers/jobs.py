@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from celery.result import AsyncResult
+
+
+def task_status(async_result: AsyncResult) -> Dict[str, Any]:
+    """State of a queued job: PROGRESS metadata while it runs, then its result or error."""
+    state = async_result.state
+    status: Dict[str, Any] = {"state": state, "progress": {}, "result": None, "error": None}
+    if state == "PROGRESS":
+        status["progress"] = async_result.info or {}
+    elif state == "SUCCESS":
+        status["result"] = async_result.result
+    elif state == "FAILURE":
+        status["error"] = str(async_result.result)
+    return status
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel import Session, select
+
+from ..core.schemas import LifecycleCostRead, LifecycleCostRequest, LifecycleCostStatus
+from ..core.units import convert_array
+from ..db import get_session
+from ..models import Pump, SystemCurve
+from ..tasks.lifecycle import compare_lifecycle_costs
+from .jobs import task_status
+
+router = APIRouter(prefix="/api/lifecycle-costs", tags=["lifecycle costs"])
+
+
+@router.post("", status_code=status.HTTP_202_ACCEPTED)
+def submit_lifecycle_costs(payload: LifecycleCostRequest, session: Session = Depends(get_session)):
+    if not session.get(SystemCurve, payload.system_curve_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="System curve not found")
+    pump_ids = list(dict.fromkeys(payload.pump_ids))
+    found = set(session.exec(select(Pump.id).where(Pump.id.in_(pump_ids))).all())
+    missing = [pump_id for pump_id in pump_ids if pump_id not in found]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Pumps not found: {', '.join(map(str, missing))}"
+        )
+    flow = convert_array([duty_bin.flow for duty_bin in payload.duty], payload.flow_unit, "meter**3/second")
+    options = payload.model_dump(exclude={"pump_ids", "system_curve_id", "duty", "flow_unit"})
+    # Task arguments go through JSON, which only has string keys.
+    options["capital_costs"] = {str(pump_id): cost for pump_id, cost in payload.capital_costs.items()}
+    async_result = compare_lifecycle_costs.delay(
+        pump_ids, payload.system_curve_id, flow.tolist(), [duty_bin.hours for duty_bin in payload.duty], options
+    )
+    return {"task_id": async_result.id, "candidates": len(pump_ids)}
+
+
+@router.get("/{task_id}", response_model=LifecycleCostStatus)
+def get_lifecycle_costs(task_id: str):
+    job = task_status(compare_lifecycle_costs.AsyncResult(task_id))
+    result = LifecycleCostRead(**job["result"]) if job["result"] is not None else None
+    return LifecycleCostStatus(task_id=task_id, state=job["state"], result=result, error=job["error"])
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional
+
+from fastapi import Response
+from sqlalchemy import and_, func
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def latest_versions(statement, model, key_column):
+    """Restrict ``statement`` over ``model`` to the newest version of each key."""
+    latest = select(key_column.label("key"), func.max(model.version).label("version")).group_by(key_column).subquery()
+    return statement.join(latest, and_(key_column == latest.c.key, model.version == latest.c.version))
+
+
+def keyset_page(
+    session: Session, statement, model, limit: int, cursor: Optional[int], response: Response
+) -> List[Any]:
+    """One page of ``statement`` ordered by id, starting after ``cursor``.
+
+    When more rows follow, the id to pass as the next ``cursor`` is returned in the
+    ``X-Next-Cursor`` header; its absence marks the last page.
+    """
+    rows = session.exec(_page_statement(statement, model, limit, cursor)).all()
+    return _trim_page(rows, limit, response)
+
+
+async def keyset_page_async(
+    session: AsyncSession, statement, model, limit: int, cursor: Optional[int], response: Response
+) -> List[Any]:
+    """``keyset_page`` on an async session."""
+    rows = (await session.exec(_page_statement(statement, model, limit, cursor))).all()
+    return _trim_page(rows, limit, response)
+
+
+def _page_statement(statement, model, limit: int, cursor: Optional[int]):
+    if cursor is not None:
+        statement = statement.where(model.id > cursor)
+    # One extra row tells whether another page follows.
+    return statement.order_by(model.id).limit(limit + 1)
+
+
+def _trim_page(rows: List[Any], limit: int, response: Response) -> List[Any]:
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = str(rows[-1].id)
+    return rows
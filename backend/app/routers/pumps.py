@@ -1,16 +1,28 @@
 from __future__ import annotations
 
-from typing import List
+import io
+import zipfile
+from datetime import datetime
+from pathlib import PurePosixPath
+from typing import Any, Iterator, List, Literal, Optional, TextIO, Union
 
 import numpy as np
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Request, Response, UploadFile, status
+from sqlalchemy import func, insert
+from sqlalchemy.orm import defer
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from ..core.schemas import CurvePoint, PumpCreate, PumpRead
-from ..core.units import convert_array
-from ..db import get_session
+from ..core.schemas import CurvePoint, PumpCreate, PumpImportItem, PumpImportRead, PumpRead, PumpSummary, SampledCurve
+from ..core.units import UnitSystem, convert_array
+from ..db import get_async_read_session, get_session, settings
 from ..models import Pump
+from ..services.curves import convert_pump_tables, parse_pump_csv_lines
+from ..services.downsample import DEFAULT_CURVE_POINTS, DENSE_SAMPLES, MAX_CURVE_POINTS, sample_pump_curve, sampled_curve
+from ..services.packing import decode_points, encode_points
+from ..tasks.compute import cached_pump_curve
+from .conditional import make_etag, not_modified
+from .pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page_async, latest_versions
 
 router = APIRouter(prefix="/api/pumps", tags=["pumps"])
 
@@ -53,6 +65,38 @@ def _convert_points(payload: PumpCreate) -> dict:
     }
 
 
+def _stored_curve_points(pump: Pump) -> List[CurvePoint]:
+    points = decode_points(pump.curve_points, pump.curve_blob)
+    efficiency = points.get("efficiency")
+    # Stored points were validated on the way in; skip re-validating them point by point.
+    return [
+        CurvePoint.model_construct(
+            flow=float(flow),
+            head=float(head),
+            efficiency=float(efficiency[idx]) if efficiency is not None and idx < len(efficiency) else None,
+        )
+        for idx, (flow, head) in enumerate(zip(points["flow_si"], points["head_si"], strict=True))
+    ]
+
+
+def _pump_read(pump: Pump) -> PumpRead:
+    return PumpRead(
+        id=pump.id,
+        version=pump.version,
+        name=pump.name,
+        rated_speed_rpm=pump.rated_speed_rpm,
+        unit_system=pump.unit_system,
+        flow_unit=pump.flow_unit,
+        head_unit=pump.head_unit,
+        efficiency_unit=pump.efficiency_unit,
+        power_unit=pump.power_unit,
+        npshr_unit=pump.npshr_unit,
+        curve_points=_stored_curve_points(pump),
+        metadata=pump.metadata_json,
+        created_at=pump.created_at,
+    )
+
+
 @router.post("", response_model=PumpRead, status_code=status.HTTP_201_CREATED)
 def create_pump(payload: PumpCreate, session: Session = Depends(get_session)):
     converted = _convert_points(payload)
@@ -64,6 +108,7 @@ def create_pump(payload: PumpCreate, session: Session = Depends(get_session)):
         max_key = session.exec(select(func.max(Pump.pump_key))).one()[0]
         pump_key = (max_key or 0) + 1
         version = 1
+    curve_points, curve_blob = encode_points(converted, settings.curve_storage)
     pump = Pump(
         pump_key=pump_key,
         version=version,
@@ -76,7 +121,8 @@ def create_pump(payload: PumpCreate, session: Session = Depends(get_session)):
         power_unit=payload.power_unit,
         npshr_unit=payload.npshr_unit,
         metadata_json=payload.metadata or {},
-        curve_points=converted,
+        curve_points=curve_points,
+        curve_blob=curve_blob,
     )
     session.add(pump)
     session.commit()
@@ -98,53 +144,188 @@ def create_pump(payload: PumpCreate, session: Session = Depends(get_session)):
     )
 
 
+def _iter_catalog_files(uploads: List[UploadFile]) -> Iterator[tuple[str, str, TextIO]]:
+    """Yield (source, pump name, text stream) for every CSV in the upload, reading ZIPs member by member."""
+    for upload in uploads:
+        filename = upload.filename or "upload.csv"
+        if filename.lower().endswith(".zip"):
+            with zipfile.ZipFile(upload.file) as archive:
+                for member in archive.infolist():
+                    if member.is_dir() or not member.filename.lower().endswith(".csv"):
+                        continue
+                    with archive.open(member) as raw:
+                        name = PurePosixPath(member.filename).stem
+                        yield f"{filename}:{member.filename}", name, io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+        else:
+            yield filename, PurePosixPath(filename).stem, io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+
+
+def _next_versions(session: Session, names: List[str]) -> List[tuple[int, int]]:
+    """(pump_key, version) for each name, continuing existing version chains like ``create_pump``."""
+    latest: dict[str, tuple[int, int]] = {}
+    rows = session.exec(
+        select(Pump.name, Pump.pump_key, func.max(Pump.version)).where(Pump.name.in_(set(names))).group_by(Pump.name, Pump.pump_key)
+    ).all()
+    for name, pump_key, version in rows:
+        if name not in latest or version > latest[name][1]:
+            latest[name] = (pump_key, version)
+    next_key = (session.exec(select(func.max(Pump.pump_key))).one() or 0) + 1
+    assigned: List[tuple[int, int]] = []
+    for name in names:
+        if name in latest:
+            pump_key, version = latest[name]
+        else:
+            pump_key, version = next_key, 0
+            next_key += 1
+        latest[name] = (pump_key, version + 1)
+        assigned.append(latest[name])
+    return assigned
+
+
+@router.post("/bulk-import", response_model=PumpImportRead, status_code=status.HTTP_201_CREATED)
+def bulk_import_pumps(
+    files: List[UploadFile] = File(...),
+    rated_speed_rpm: float = Form(gt=0),
+    unit_system: UnitSystem = Form("us"),
+    flow_unit: str = Form("gpm"),
+    head_unit: str = Form("ft"),
+    efficiency_unit: Optional[str] = Form(None),
+    power_unit: Optional[str] = Form(None),
+    npshr_unit: Optional[str] = Form(None),
+    session: Session = Depends(get_session),
+):
+    """Import a catalog of pump CSVs, uploaded individually or as ZIP archives.
+
+    Each file becomes one pump named after the file; a ``# units:`` comment in the file
+    overrides the form defaults. Nothing is stored unless every file parses.
+    """
+    defaults = {"flow": flow_unit, "head": head_unit, "efficiency": efficiency_unit, "power": power_unit, "npshr": npshr_unit}
+    sources: List[str] = []
+    names: List[str] = []
+    tables: List[dict[str, np.ndarray]] = []
+    units: List[dict[str, str]] = []
+    errors: List[dict[str, str]] = []
+    try:
+        for source, name, stream in _iter_catalog_files(files):
+            try:
+                table, file_units = parse_pump_csv_lines(stream)
+            except (ValueError, UnicodeDecodeError) as exc:
+                errors.append({"file": source, "error": str(exc)})
+                continue
+            if table["flow"].size < 2:
+                errors.append({"file": source, "error": "CSV must contain at least two curve points"})
+                continue
+            sources.append(source)
+            names.append(name)
+            tables.append(table)
+            units.append({key: value for key, value in {**defaults, **file_units}.items() if value})
+    except zipfile.BadZipFile as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
+    if errors:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=errors)
+    if not tables:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="No CSV files found in upload")
+
+    from pint.errors import DimensionalityError, UndefinedUnitError
+
+    try:
+        converted = convert_pump_tables(tables, units)
+    except (UndefinedUnitError, DimensionalityError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"Unit conversion failed: {exc}"
+        ) from exc
+
+    created_at = datetime.utcnow()
+    rows: List[dict[str, Any]] = []
+    for name, source, file_units, curve, (pump_key, version) in zip(
+        names, sources, units, converted, _next_versions(session, names), strict=True
+    ):
+        curve_points, curve_blob = encode_points(curve, settings.curve_storage)
+        rows.append(
+            {
+                "pump_key": pump_key,
+                "version": version,
+                "name": name,
+                "rated_speed_rpm": rated_speed_rpm,
+                "unit_system": unit_system,
+                "flow_unit": file_units["flow"],
+                "head_unit": file_units["head"],
+                "efficiency_unit": file_units.get("efficiency"),
+                "power_unit": file_units.get("power"),
+                "npshr_unit": file_units.get("npshr"),
+                "metadata_json": {"source": source},
+                "curve_points": curve_points,
+                "curve_blob": curve_blob,
+                "created_at": created_at,
+            }
+        )
+    ids = session.scalars(insert(Pump).returning(Pump.id, sort_by_parameter_order=True), rows).all()
+    session.commit()
+    return PumpImportRead(
+        imported=len(ids),
+        pumps=[
+            PumpImportItem(id=pump_id, name=row["name"], version=row["version"], source=row["metadata_json"]["source"], points=curve["flow_si"].size)
+            for pump_id, row, curve in zip(ids, rows, converted, strict=True)
+        ],
+    )
+
+
 @router.get("/{pump_id}", response_model=PumpRead)
-def get_pump(pump_id: int, session: Session = Depends(get_session)):
-    pump = session.get(Pump, pump_id)
+async def get_pump(pump_id: int, session: AsyncSession = Depends(get_async_read_session)):
+    pump = await session.get(Pump, pump_id)
     if not pump:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pump not found")
-    points = pump.curve_points
-    eff_list = points.get("efficiency") or []
-    curve_points: List[CurvePoint] = []
-    for idx, (flow_si, head_si) in enumerate(zip(points["flow_si"], points["head_si"], strict=True)):
-        eff = eff_list[idx] if idx < len(eff_list) else None
-        curve_points.append(CurvePoint(flow=float(flow_si), head=float(head_si), efficiency=eff))
-    return PumpRead(
-        id=pump.id,
-        version=pump.version,
-        name=pump.name,
-        rated_speed_rpm=pump.rated_speed_rpm,
-        unit_system=pump.unit_system,
-        flow_unit=pump.flow_unit,
-        head_unit=pump.head_unit,
-        efficiency_unit=pump.efficiency_unit,
-        power_unit=pump.power_unit,
-        npshr_unit=pump.npshr_unit,
-        curve_points=curve_points,
-        metadata=pump.metadata_json,
-        created_at=pump.created_at,
-    )
+    return _pump_read(pump)
 
 
+@router.get("/{pump_id}/curve", response_model=SampledCurve)
+def get_pump_curve(
+    pump_id: int,
+    request: Request,
+    response: Response,
+    points: int = Query(DEFAULT_CURVE_POINTS, ge=3, le=MAX_CURVE_POINTS),
+    session: Session = Depends(get_session),
+):
+    """The pump's head, efficiency and power in SI units at ``points`` downsampled flows."""
+    row = session.exec(select(Pump.pump_key, Pump.version, Pump.name).where(Pump.id == pump_id)).first()
+    if not row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pump not found")
+    pump_key, version, name = row
+    # Pump versions are immutable, so the key and version identify the curve.
+    cached = not_modified(request, response, make_etag("pump", pump_key, version, points, DENSE_SAMPLES))
+    if cached is not None:
+        return cached
+    prepared = cached_pump_curve(pump_key, version, lambda: session.get(Pump, pump_id))
+    return sampled_curve(name, "pump", sample_pump_curve(prepared.curve, points))
 
-@router.get("", response_model=list[PumpRead])
-def list_pumps(session: Session = Depends(get_session)):
-    pumps = session.exec(select(Pump)).all()
-    results: list[PumpRead] = []
-    for pump in pumps:
-        points = pump.curve_points
-        curve_points = [
-            CurvePoint(
-                flow=float(flow),
-                head=float(head),
-                efficiency=(points.get("efficiency") or [None] * len(points["flow_si"]))[idx]
-                if points.get("efficiency")
-                else None,
-            )
-            for idx, (flow, head) in enumerate(zip(points["flow_si"], points["head_si"], strict=True))
-        ]
-        results.append(
-            PumpRead(
+
+@router.get("", response_model=Union[List[PumpRead], List[PumpSummary]])
+async def list_pumps(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[int] = Query(None, description="X-Next-Cursor value from the previous page"),
+    name: Optional[str] = Query(None, description="case-insensitive substring of the pump name"),
+    latest_only: bool = False,
+    fields: Literal["full", "summary"] = "full",
+    session: AsyncSession = Depends(get_async_read_session),
+):
+    """One page of pumps in id order.
+
+    Pages hold at most ``limit`` rows (50 by default). When more follow, the response
+    carries an ``X-Next-Cursor`` header to send back as ``cursor``; clients that need the
+    whole catalog follow it until the header is absent.
+    """
+    statement = select(Pump)
+    if name:
+        statement = statement.where(func.lower(Pump.name).contains(name.lower()))
+    if latest_only:
+        statement = latest_versions(statement, Pump, Pump.pump_key)
+    if fields == "summary":
+        statement = statement.options(defer(Pump.curve_points), defer(Pump.curve_blob), defer(Pump.metadata_json))
+    pumps = await keyset_page_async(session, statement, Pump, limit, cursor, response)
+    if fields == "summary":
+        return [
+            PumpSummary(
                 id=pump.id,
                 version=pump.version,
                 name=pump.name,
@@ -152,13 +333,9 @@ def list_pumps(session: Session = Depends(get_session)):
                 unit_system=pump.unit_system,
                 flow_unit=pump.flow_unit,
                 head_unit=pump.head_unit,
-                efficiency_unit=pump.efficiency_unit,
-                power_unit=pump.power_unit,
-                npshr_unit=pump.npshr_unit,
-                curve_points=curve_points,
-                metadata=pump.metadata_json,
                 created_at=pump.created_at,
             )
-        )
-    return results
+            for pump in pumps
+        ]
+    return [_pump_read(pump) for pump in pumps]
 
@@ -1,26 +1,69 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..core.schemas import ResultRead
-from ..db import get_session
+from ..db import get_async_read_session, get_session
 from ..models import Result
+from ..services.export import MEDIA_TYPES, ExportFormat, export_rows
+from ..services.report import RENDER_ERRORS
+from ..tasks.compute import render_result_pdf
 
 router = APIRouter(prefix="/api/results", tags=["results"])
+# Registered ahead of the static /files mount so a PDF that the report queue has not
+# produced yet is rendered on first download instead of returning 404.
+files_router = APIRouter(prefix="/files", tags=["results"])
 
 
-@router.get("/{result_id}", response_model=ResultRead)
-def get_result(result_id: int, session: Session = Depends(get_session)):
-    result = session.get(Result, result_id)
-    if not result:
-        raise HTTPException(status_code=404, detail="Result not found")
+def _result_read(result: Result) -> ResultRead:
     return ResultRead(
         id=result.id,
         scenario_id=result.scenario_id,
         operating_points=result.operating_points,
         csv_path=result.csv_path,
         pdf_path=result.pdf_path,
+        report_status=result.report_status,
         created_at=result.created_at,
     )
 
+
+@router.get("/{result_id}", response_model=ResultRead)
+async def get_result(result_id: int, session: AsyncSession = Depends(get_async_read_session)):
+    result = await session.get(Result, result_id)
+    if not result:
+        raise HTTPException(status_code=404, detail="Result not found")
+    return _result_read(result)
+
+
+@router.get("/{result_id}/export", response_class=StreamingResponse)
+async def export_result(
+    result_id: int, format: ExportFormat = "csv", session: AsyncSession = Depends(get_async_read_session)
+):
+    """Operating points as CSV, NDJSON or Parquet, serialised chunk by chunk as the response is sent."""
+    result = await session.get(Result, result_id)
+    if not result:
+        raise HTTPException(status_code=404, detail="Result not found")
+    try:
+        chunks = export_rows(result.operating_points, format)
+    except ImportError as exc:
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="Parquet export needs pyarrow installed") from exc
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="result_{result_id}.{format}"'},
+    )
+
+
+@files_router.get("/result_{result_id:int}.pdf", response_class=FileResponse)
+def download_report(result_id: int, session: Session = Depends(get_session)):
+    result = session.get(Result, result_id)
+    if not result:
+        raise HTTPException(status_code=404, detail="Result not found")
+    try:
+        path = render_result_pdf(session, result)
+    except RENDER_ERRORS as exc:
+        raise HTTPException(status_code=500, detail="Report rendering failed") from exc
+    return FileResponse(path, media_type="application/pdf", filename=path.name)
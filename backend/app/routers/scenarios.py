@@ -1,14 +1,48 @@
 from __future__ import annotations
 
+import math
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlmodel import Session, select
 
-from ..core.schemas import ResultRead, ScenarioCreate, ScenarioRead
+from ..core.schemas import (
+    SampledCurve,
+    ScenarioCreate,
+    ScenarioCurvesRead,
+    ScenarioRead,
+    SpeedOptimizationOption,
+    SpeedOptimizationRead,
+    SpeedOptimizationRequest,
+    StagingPoint,
+    StagingRead,
+)
+from ..core.units import convert_array
 from ..db import get_session
-from ..models import Pump, Scenario, SystemCurve
-from ..tasks.compute import compute_scenario
+from ..models import Result, Scenario, SystemCurve
+from ..services.cache import input_fingerprint
+from ..services.combine import build_parallel, build_series
+from ..services.downsample import (
+    DEFAULT_CURVE_POINTS,
+    DENSE_SAMPLES,
+    MAX_CURVE_POINTS,
+    sample_downsampled,
+    sample_pump_curve,
+    sampled_curve,
+)
+from ..services.optimize import SPEED_RATIO_BOUNDS, optimize_speed, system_flow_at_head
+from ..services.staging import STAGING_POINTS, StagingGroup, build_staging_table
+from ..services.system import system_curve_from_model
+from ..tasks.compute import (
+    cached_pump_curve,
+    cached_staging_table,
+    compute_scenario,
+    pump_entry_key,
+    result_cache,
+    scenario_fingerprint,
+)
+from .conditional import make_etag, not_modified
+from .entries import entry_pumps
 
 router = APIRouter(prefix="/api/scenarios", tags=["scenarios"])
 
@@ -27,10 +61,7 @@ def create_scenario(payload: ScenarioCreate, session: Session = Depends(get_sess
     system_curve = session.exec(select(SystemCurve).where(SystemCurve.id == payload.system_curve_id)).first()
     if not system_curve:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="System curve not found")
-    for cfg in payload.pumps:
-        pump = session.exec(select(Pump).where(Pump.id == cfg.pump_id)).first()
-        if not pump:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Pump {cfg.pump_id} not found")
+    entry_pumps(session, (cfg.model_dump() for cfg in payload.pumps))
     model = Scenario(
         name=payload.name,
         system_curve_id=payload.system_curve_id,
@@ -62,6 +93,209 @@ def compute(scenario_id: int, session: Session = Depends(get_session)):
     scenario = session.get(Scenario, scenario_id)
     if not scenario:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Scenario not found")
-    async_result = compute_scenario.delay(scenario_id)
-    return {"task_id": async_result.id}
+    system_curve = session.get(SystemCurve, scenario.system_curve_id)
+    if not system_curve:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="System curve not found")
+    pumps = entry_pumps(session, scenario.pumps["items"])
+    fingerprint = scenario_fingerprint(scenario, system_curve, pumps)
+    cached_id = result_cache.get(fingerprint)
+    if cached_id is not None:
+        if session.get(Result, cached_id) is not None:
+            return {"task_id": None, "result_id": cached_id, "cached": True}
+        result_cache.discard(fingerprint)
+    async_result = compute_scenario.delay(scenario_id, fingerprint)
+    return {"task_id": async_result.id, "result_id": None, "cached": False}
+
+
+@router.get("/{scenario_id}/curves", response_model=ScenarioCurvesRead)
+def get_scenario_curves(
+    scenario_id: int,
+    request: Request,
+    response: Response,
+    points: int = Query(DEFAULT_CURVE_POINTS, ge=3, le=MAX_CURVE_POINTS),
+    session: Session = Depends(get_session),
+):
+    """Chart overlay in SI units: each pump at rated speed, every entry's combined curve
+    at each of its VFD speeds, and the system curve across the combined flow range."""
+    scenario = session.get(Scenario, scenario_id)
+    if not scenario:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Scenario not found")
+    system_curve = session.get(SystemCurve, scenario.system_curve_id)
+    if not system_curve:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="System curve not found")
+    pumps = entry_pumps(session, scenario.pumps["items"])
+    etag = make_etag(
+        "scenario", scenario_fingerprint(scenario, system_curve, pumps), system_curve.id, points, DENSE_SAMPLES
+    )
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+
+    pump_curves: List[SampledCurve] = []
+    aggregate_curves: List[SampledCurve] = []
+    seen = set()
+    max_flow = 0.0
+    for entry in scenario.pumps["items"]:
+        pump = pumps[pump_entry_key(entry)]
+        prepared = cached_pump_curve(pump.pump_key, pump.version, lambda pump=pump: pump)
+        if pump.id not in seen:
+            seen.add(pump.id)
+            pump_curves.append(sampled_curve(pump.name, "pump", sample_pump_curve(prepared.curve, points)))
+        count = entry.get("count", 1)
+        arrangement = entry.get("arrangement", "parallel")
+        build = build_series if arrangement == "series" else build_parallel
+        for ratio in entry.get("vfd_speeds", [1.0]):
+            aggregate = build([prepared.curve], [ratio], [count])
+            max_flow = max(max_flow, float(aggregate.flow_domain[1]))
+            aggregate_curves.append(
+                sampled_curve(
+                    f"{pump.name} x{count} {arrangement}",
+                    "aggregate",
+                    sample_downsampled(aggregate.flow_domain, aggregate.head, points),
+                    speed_ratio=float(ratio),
+                )
+            )
+
+    system_domain, system_head = system_curve_from_model(system_curve)
+    if system_curve.csv_points is None and system_curve.csv_blob is None and max_flow > 0:
+        # Formula curves have no flow range of their own; draw them across the pumps' reach.
+        system_domain = (0.0, max_flow)
+    system = sampled_curve(system_curve.name, "system", sample_downsampled(system_domain, system_head, points))
+    return ScenarioCurvesRead(scenario_id=scenario_id, curves=[*pump_curves, *aggregate_curves, system])
 
+
+@router.post("/{scenario_id}/optimize-speed", response_model=SpeedOptimizationRead)
+def optimize_scenario_speed(scenario_id: int, payload: SpeedOptimizationRequest, session: Session = Depends(get_session)):
+    scenario = session.get(Scenario, scenario_id)
+    if not scenario:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Scenario not found")
+    system_curve = session.get(SystemCurve, scenario.system_curve_id)
+    if not system_curve:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="System curve not found")
+    _, system_head = system_curve_from_model(system_curve)
+    bounds = (payload.min_speed_ratio, payload.max_speed_ratio)
+
+    pumps = entry_pumps(session, scenario.pumps["items"])
+    entries = []
+    for entry in scenario.pumps["items"]:
+        pump = pumps[pump_entry_key(entry)]
+        prepared = cached_pump_curve(pump.pump_key, pump.version, lambda pump=pump: pump)
+        entries.append((entry, pump, prepared.curve))
+
+    if payload.target_flow is not None:
+        flow = float(convert_array([payload.target_flow], payload.flow_unit, "meter**3/second")[0])
+    else:
+        head = float(convert_array([payload.target_head], payload.head_unit, "meter")[0])
+        flow_limit = max(float(curve.flow_si[-1]) * entry.get("count", 1) * bounds[1] for entry, _, curve in entries)
+        try:
+            flow = system_flow_at_head(system_head, head, (0.0, flow_limit))
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
+
+    options: List[SpeedOptimizationOption] = []
+    for entry, pump, curve in entries:
+        count = entry.get("count", 1)
+        arrangement = entry.get("arrangement", "parallel")
+        try:
+            selection = optimize_speed(curve, system_head, flow, count, arrangement, bounds)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"Pump {pump.id}: {exc}") from exc
+        if not selection.feasible[0]:
+            continue
+        options.append(
+            SpeedOptimizationOption(
+                pump_id=pump.id,
+                configuration=f"{pump.name} x{count} {arrangement}",
+                running=int(selection.running[0]),
+                speed_ratio=float(selection.speed_ratio[0]),
+                flow=flow,
+                head=float(selection.head[0]),
+                power=float(selection.power[0]),
+                efficiency=_optional(selection.efficiency[0]),
+            )
+        )
+    options.sort(key=lambda option: option.power)
+    return SpeedOptimizationRead(scenario_id=scenario_id, flow=flow, head=float(system_head(flow)), options=options)
+
+
+def _optional(value: float) -> float | None:
+    return None if math.isnan(value) else float(value)
+
+
+@router.get("/{scenario_id}/staging", response_model=StagingRead)
+def get_scenario_staging(
+    scenario_id: int,
+    flow: List[float] = Query(default=[]),
+    flow_unit: str = "meter**3/second",
+    min_speed_ratio: float = Query(SPEED_RATIO_BOUNDS[0], ge=0.3, le=1.2),
+    max_speed_ratio: float = Query(SPEED_RATIO_BOUNDS[1], ge=0.3, le=1.2),
+    session: Session = Depends(get_session),
+):
+    """Which entry, how many pumps and what speed to run for each demand ``flow``.
+
+    Every entry of the scenario is a candidate way to run the station, as in
+    ``optimize-speed``: only one entry runs at a time, with up to ``count`` of its
+    identical pumps. Combinations of different pump models running together are not
+    staged; a mixed station is modelled as one entry per model. The answers come from a
+    staging table precomputed once per scenario content and speed range, so a lookup is
+    a binary search. Without ``flow`` the whole table is returned.
+    """
+    scenario = session.get(Scenario, scenario_id)
+    if not scenario:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Scenario not found")
+    system_curve = session.get(SystemCurve, scenario.system_curve_id)
+    if not system_curve:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="System curve not found")
+    if min_speed_ratio > max_speed_ratio:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="min_speed_ratio must not exceed max_speed_ratio")
+    bounds = (min_speed_ratio, max_speed_ratio)
+    pumps = entry_pumps(session, scenario.pumps["items"])
+    entries = [(entry, pumps[pump_entry_key(entry)]) for entry in scenario.pumps["items"]]
+
+    def build():
+        _, system_head = system_curve_from_model(system_curve)
+        groups = [
+            StagingGroup(
+                curve=cached_pump_curve(pump.pump_key, pump.version, lambda pump=pump: pump).curve,
+                count=entry.get("count", 1),
+                arrangement=entry.get("arrangement", "parallel"),
+            )
+            for entry, pump in entries
+        ]
+        try:
+            return build_staging_table(groups, system_head, bounds)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
+
+    key = input_fingerprint([scenario_fingerprint(scenario, system_curve, pumps), list(bounds), STAGING_POINTS])
+    table = cached_staging_table(key, build)
+
+    if flow:
+        demand = convert_array(flow, flow_unit, "meter**3/second")
+    else:
+        demand = table.flow
+        flow = convert_array(table.flow, "meter**3/second", flow_unit).tolist()
+    staging = table.lookup(demand)
+    points = []
+    for i, value in enumerate(flow):
+        group = int(staging["group"][i])
+        entry, pump = entries[group] if group >= 0 else (None, None)
+        points.append(
+            StagingPoint(
+                flow=float(value),
+                feasible=bool(staging["feasible"][i]),
+                pump_id=pump.id if pump else None,
+                configuration=f"{pump.name} x{entry.get('count', 1)} {entry.get('arrangement', 'parallel')}" if pump else None,
+                running=int(staging["running"][i]),
+                speed_ratio=_optional(staging["speed_ratio"][i]),
+                head=_optional(staging["head"][i]),
+                power=_optional(staging["power"][i]),
+            )
+        )
+    return StagingRead(
+        scenario_id=scenario_id,
+        flow_unit=flow_unit,
+        max_flow=float(convert_array([table.max_flow], "meter**3/second", flow_unit)[0]),
+        table_points=len(table),
+        points=points,
+    )
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import io
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from sqlmodel import Session
+
+from ..core.schemas import SimulationRead, SimulationStatus
+from ..db import get_session
+from ..models import Scenario, SystemCurve
+from ..services.optimize import SPEED_RATIO_BOUNDS
+from ..services.simulation import parse_duty_csv_lines
+from ..tasks.simulation import simulate_scenario
+from .entries import entry_pumps
+from .jobs import task_status
+
+router = APIRouter(prefix="/api/simulations", tags=["simulations"])
+
+# A year of hourly steps with headroom; the series travels in the task message.
+MAX_SIMULATION_STEPS = 100_000
+
+
+@router.post("", status_code=status.HTTP_202_ACCEPTED)
+def submit_simulation(
+    scenario_id: int = Form(...),
+    file: UploadFile = File(..., description="CSV with a demand column and optional level and hours columns"),
+    step_hours: float = Form(1.0, gt=0),
+    min_speed_ratio: float = Form(SPEED_RATIO_BOUNDS[0], ge=0.3, le=1.2),
+    max_speed_ratio: float = Form(SPEED_RATIO_BOUNDS[1], ge=0.3, le=1.2),
+    session: Session = Depends(get_session),
+):
+    scenario = session.get(Scenario, scenario_id)
+    if not scenario:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Scenario not found")
+    if not session.get(SystemCurve, scenario.system_curve_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="System curve not found")
+    entry_pumps(session, scenario.pumps["items"])
+    if min_speed_ratio > max_speed_ratio:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="min_speed_ratio must not exceed max_speed_ratio")
+    try:
+        series = parse_duty_csv_lines(io.TextIOWrapper(file.file, encoding="utf-8"), step_hours)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
+    if len(series) > MAX_SIMULATION_STEPS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"At most {MAX_SIMULATION_STEPS} steps per simulation"
+        )
+    async_result = simulate_scenario.delay(
+        scenario_id,
+        series.demand.tolist(),
+        series.level.tolist(),
+        series.hours.tolist(),
+        (min_speed_ratio, max_speed_ratio),
+    )
+    return {"task_id": async_result.id, "steps": len(series)}
+
+
+@router.get("/{task_id}", response_model=SimulationStatus)
+def get_simulation(task_id: str):
+    """Progress while running (``done`` of ``total`` steps), then the totals or the error."""
+    job = task_status(simulate_scenario.AsyncResult(task_id))
+    if job["result"] is not None:
+        result = SimulationRead(**job["result"])
+        steps = sum(entry.steps for entry in result.entries)
+        return SimulationStatus(task_id=task_id, state=job["state"], done=steps, total=steps, result=result)
+    progress = job["progress"]
+    return SimulationStatus(
+        task_id=task_id,
+        state=job["state"],
+        done=progress.get("done", 0),
+        total=progress.get("total", 0),
+        error=job["error"],
+    )
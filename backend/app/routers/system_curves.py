@@ -1,16 +1,20 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import List, Literal, Optional, Union
 
 import numpy as np
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import func
+from sqlalchemy.orm import defer
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from ..core.schemas import CurvePoint, ExtraSystemTerm, SystemCurveCreate, SystemCurveRead
+from ..core.schemas import CurvePoint, ExtraSystemTerm, SystemCurveCreate, SystemCurveRead, SystemCurveSummary
 from ..core.units import convert_array
-from ..db import get_session
+from ..db import get_async_read_session, get_session, settings
 from ..models import SystemCurve
+from ..services.packing import decode_points, encode_points
+from .pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page_async, latest_versions
 
 router = APIRouter(prefix="/api/system-curves", tags=["system curves"])
 
@@ -26,6 +30,37 @@ def _convert_points(points: Optional[List[CurvePoint]], flow_unit: str, head_uni
     }
 
 
+def _stored_csv_points(model: SystemCurve) -> Optional[List[CurvePoint]]:
+    points = decode_points(model.csv_points, model.csv_blob)
+    if points is None:
+        return None
+    return [
+        CurvePoint.model_construct(flow=float(flow), head=float(head))
+        for flow, head in zip(points["flow_si"], points["head_si"], strict=True)
+    ]
+
+
+def _system_curve_read(model: SystemCurve) -> SystemCurveRead:
+    extra_terms = [
+        ExtraSystemTerm(coefficient=term["coefficient"], exponent=term["exponent"])
+        for term in model.extra_terms.get("terms", [])
+    ]
+    return SystemCurveRead(
+        id=model.id,
+        version=model.version,
+        name=model.name,
+        unit_system=model.unit_system,
+        static_head=model.static_head,
+        static_head_unit=model.static_head_unit,
+        resistance_coefficient=model.resistance_coefficient,
+        flow_unit=model.flow_unit,
+        head_unit=model.head_unit,
+        extra_terms=extra_terms,
+        csv_points=_stored_csv_points(model),
+        created_at=model.created_at,
+    )
+
+
 @router.post("", response_model=SystemCurveRead, status_code=status.HTTP_201_CREATED)
 def create_system_curve(payload: SystemCurveCreate, session: Session = Depends(get_session)):
     converted_points = _convert_points(payload.csv_points, payload.flow_unit, payload.head_unit)
@@ -37,6 +72,7 @@ def create_system_curve(payload: SystemCurveCreate, session: Session = Depends(g
         max_key = session.exec(select(func.max(SystemCurve.curve_key))).one()[0]
         curve_key = (max_key or 0) + 1
         version = 1
+    csv_points, csv_blob = encode_points(converted_points, settings.curve_storage)
     model = SystemCurve(
         curve_key=curve_key,
         version=version,
@@ -48,7 +84,8 @@ def create_system_curve(payload: SystemCurveCreate, session: Session = Depends(g
         flow_unit=payload.flow_unit,
         head_unit=payload.head_unit,
         extra_terms={"terms": [term.model_dump() for term in payload.extra_terms]},
-        csv_points=converted_points,
+        csv_points=csv_points,
+        csv_blob=csv_blob,
     )
     session.add(model)
     session.commit()
@@ -70,67 +107,49 @@ def create_system_curve(payload: SystemCurveCreate, session: Session = Depends(g
 
 
 @router.get("/{curve_id}", response_model=SystemCurveRead)
-def get_system_curve(curve_id: int, session: Session = Depends(get_session)):
-    model = session.get(SystemCurve, curve_id)
+async def get_system_curve(curve_id: int, session: AsyncSession = Depends(get_async_read_session)):
+    model = await session.get(SystemCurve, curve_id)
     if not model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="System curve not found")
-    csv_points = None
-    if model.csv_points:
-        csv_points = [
-            CurvePoint(flow=float(flow), head=float(head))
-            for flow, head in zip(model.csv_points["flow_si"], model.csv_points["head_si"], strict=True)
-        ]
-    extra_terms = [
-        ExtraSystemTerm(coefficient=term["coefficient"], exponent=term["exponent"])
-        for term in model.extra_terms.get("terms", [])
-    ]
-    return SystemCurveRead(
-        id=model.id,
-        version=model.version,
-        name=model.name,
-        unit_system=model.unit_system,
-        static_head=model.static_head,
-        static_head_unit=model.static_head_unit,
-        resistance_coefficient=model.resistance_coefficient,
-        flow_unit=model.flow_unit,
-        head_unit=model.head_unit,
-        extra_terms=extra_terms,
-        csv_points=csv_points,
-        created_at=model.created_at,
-    )
+    return _system_curve_read(model)
 
 
+@router.get("", response_model=Union[List[SystemCurveRead], List[SystemCurveSummary]])
+async def list_system_curves(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[int] = Query(None, description="X-Next-Cursor value from the previous page"),
+    name: Optional[str] = Query(None, description="case-insensitive substring of the curve name"),
+    latest_only: bool = False,
+    fields: Literal["full", "summary"] = "full",
+    session: AsyncSession = Depends(get_async_read_session),
+):
+    """One page of system curves in id order.
 
-@router.get("", response_model=list[SystemCurveRead])
-def list_system_curves(session: Session = Depends(get_session)):
-    models = session.exec(select(SystemCurve)).all()
-    results: list[SystemCurveRead] = []
-    for model in models:
-        csv_points = None
-        if model.csv_points:
-            csv_points = [
-                CurvePoint(flow=float(flow), head=float(head))
-                for flow, head in zip(model.csv_points["flow_si"], model.csv_points["head_si"], strict=True)
-            ]
-        extra_terms = [
-            ExtraSystemTerm(coefficient=term["coefficient"], exponent=term["exponent"])
-            for term in model.extra_terms.get("terms", [])
-        ]
-        results.append(
-            SystemCurveRead(
+    Pages hold at most ``limit`` rows (50 by default). When more follow, the response
+    carries an ``X-Next-Cursor`` header to send back as ``cursor``; clients that need the
+    whole list follow it until the header is absent.
+    """
+    statement = select(SystemCurve)
+    if name:
+        statement = statement.where(func.lower(SystemCurve.name).contains(name.lower()))
+    if latest_only:
+        statement = latest_versions(statement, SystemCurve, SystemCurve.curve_key)
+    if fields == "summary":
+        statement = statement.options(defer(SystemCurve.csv_points), defer(SystemCurve.csv_blob), defer(SystemCurve.extra_terms))
+    models = await keyset_page_async(session, statement, SystemCurve, limit, cursor, response)
+    if fields == "summary":
+        return [
+            SystemCurveSummary(
                 id=model.id,
                 version=model.version,
                 name=model.name,
                 unit_system=model.unit_system,
-                static_head=model.static_head,
-                static_head_unit=model.static_head_unit,
-                resistance_coefficient=model.resistance_coefficient,
                 flow_unit=model.flow_unit,
                 head_unit=model.head_unit,
-                extra_terms=extra_terms,
-                csv_points=csv_points,
                 created_at=model.created_at,
             )
-        )
-    return results
+            for model in models
+        ]
+    return [_system_curve_read(model) for model in models]
 
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import argparse
+
+from sqlmodel import select
+
+from ..db import session_factory
+from ..models import Pump, SystemCurve
+from ..services.packing import decode_points, encode_points
+
+BATCH_SIZE = 500
+
+
+def convert(storage: str) -> tuple[int, int]:
+    """Rewrite every stored curve in ``storage`` format; returns (pumps, system curves) changed."""
+    counts = []
+    for model, json_attr, blob_attr in ((Pump, "curve_points", "curve_blob"), (SystemCurve, "csv_points", "csv_blob")):
+        changed = 0
+        with session_factory() as session:  # type: ignore[call-arg]
+            last_id = 0
+            while True:
+                rows = session.exec(select(model).where(model.id > last_id).order_by(model.id).limit(BATCH_SIZE)).all()
+                if not rows:
+                    break
+                for row in rows:
+                    blob = getattr(row, blob_attr)
+                    if (storage == "binary") == (blob is not None):
+                        continue
+                    points = decode_points(getattr(row, json_attr), blob)
+                    if points is None:
+                        continue
+                    json_points, blob = encode_points(points, storage)
+                    setattr(row, json_attr, json_points)
+                    setattr(row, blob_attr, blob)
+                    session.add(row)
+                    changed += 1
+                session.commit()
+                last_id = rows[-1].id
+        counts.append(changed)
+    return counts[0], counts[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pack stored curve points into float64 blobs, or unpack them to JSON.")
+    parser.add_argument("--unpack", action="store_true", help="convert blobs back to JSON lists")
+    args = parser.parse_args()
+    pumps, system_curves = convert("json" if args.unpack else "binary")
+    print(f"Converted {pumps} pumps and {system_curves} system curves")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,12 @@ from __future__ import annotations
 from pathlib import Path
 
 from .core.schemas import CurvePoint, PumpCreate, SystemCurveCreate
-from .db import session_factory
+from .db import session_factory, settings
 from .models import Pump, SystemCurve
 from .routers.pumps import _convert_points as convert_pump_points
 from .routers.system_curves import _convert_points as convert_system_points
 from .services.curves import load_pump_csv
+from .services.packing import encode_points
 
 SAMPLES = Path(__file__).resolve().parents[2] / "samples"
 
@@ -38,7 +39,7 @@ def seed() -> None:
                 power_unit=units.get("power", "hp"),
                 curve_points=curve_points,
             )
-            converted = convert_pump_points(payload)
+            stored_points, curve_blob = encode_points(convert_pump_points(payload), settings.curve_storage)
             pump = Pump(
                 pump_key=pump_key_counter,
                 version=1,
@@ -51,7 +52,8 @@ def seed() -> None:
                 power_unit=payload.power_unit,
                 npshr_unit=payload.npshr_unit,
                 metadata_json={},
-                curve_points=converted,
+                curve_points=stored_points,
+                curve_blob=curve_blob,
             )
             session.add(pump)
             pump_key_counter += 1
@@ -69,6 +71,7 @@ def seed() -> None:
             csv_points=system_points,
         )
         converted_system = convert_system_points(system_payload.csv_points, system_payload.flow_unit, system_payload.head_unit)
+        csv_points, csv_blob = encode_points(converted_system, settings.curve_storage)
         system_curve = SystemCurve(
             curve_key=1,
             version=1,
@@ -80,7 +83,8 @@ def seed() -> None:
             flow_unit=system_payload.flow_unit,
             head_unit=system_payload.head_unit,
             extra_terms={"terms": []},
-            csv_points=converted_system,
+            csv_points=csv_points,
+            csv_blob=csv_blob,
         )
         session.add(system_curve)
         session.commit()
@@ -3,16 +3,32 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 import numpy as np
-from scipy.interpolate import PchipInterpolator
 
 from .curves import PumpCurve
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScaledPumpCurve:
+    """Affinity-law view of a base curve.
+
+    PCHIP is invariant under uniform scaling of both axes, so the scaled curve is evaluated
+    through the base curve's cached splines: H_s(Q) = r^2 * H(Q / r), P_s(Q) = r^3 * P(Q / r)
+    and eta_s(Q) = eta(Q / r). Bounds are derived from the base endpoints, so a view costs
+    no array copies; ``scaled_*`` materialize the scaled points when they are needed.
+    """
+
     base: PumpCurve
     speed_ratio: float
 
+    @property
+    def flow_range(self) -> tuple[float, float]:
+        return float(self.base.flow_si[0]) * self.speed_ratio, float(self.base.flow_si[-1]) * self.speed_ratio
+
+    @property
+    def head_range(self) -> tuple[float, float]:
+        factor = self.speed_ratio ** 2
+        return float(np.min(self.base.head_si)) * factor, float(np.max(self.base.head_si)) * factor
+
     def scaled_flow(self) -> np.ndarray:
         return self.base.flow_si * self.speed_ratio
 
@@ -24,26 +40,26 @@ class ScaledPumpCurve:
             return None
         return self.base.power * (self.speed_ratio ** 3)
 
+    def _base_flow(self, flow: np.ndarray) -> np.ndarray:
+        return np.asarray(flow, dtype=float) / self.speed_ratio
+
     def head_at(self, flow: np.ndarray) -> np.ndarray:
-        interpolator = PchipInterpolator(self.scaled_flow(), self.scaled_head(), extrapolate=True)
-        return interpolator(flow)
+        return self.base.head_at(self._base_flow(flow)) * (self.speed_ratio ** 2)
+
+    def flow_at_head(self, head: np.ndarray) -> np.ndarray:
+        return self.base.flow_at_head(np.asarray(head, dtype=float) / self.speed_ratio ** 2) * self.speed_ratio
 
     def power_at(self, flow: np.ndarray) -> np.ndarray | None:
-        power = self.scaled_power()
+        power = self.base.power_at(self._base_flow(flow))
         if power is None:
             return None
-        interpolator = PchipInterpolator(self.scaled_flow(), power, extrapolate=True)
-        return interpolator(flow)
+        return power * (self.speed_ratio ** 3)
 
     def efficiency_at(self, flow: np.ndarray):
-        if self.base.efficiency is None:
-            return None
-        interpolator = PchipInterpolator(self.scaled_flow(), self.base.efficiency, extrapolate=True)
-        return interpolator(flow)
+        return self.base.efficiency_at(self._base_flow(flow))
 
 
 def scale_curve(curve: PumpCurve, ratio: float) -> ScaledPumpCurve:
     if ratio <= 0:
         raise ValueError("Speed ratio must be positive")
     return ScaledPumpCurve(base=curve, speed_ratio=ratio)
-
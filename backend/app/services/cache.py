@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+
+def input_fingerprint(payload: Any) -> str:
+    """SHA-256 of the canonical JSON encoding of ``payload``."""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), allow_nan=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LRUCache:
+    """Thread-safe, size-bounded in-process cache with optional per-entry TTL."""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and (self.ttl is None or item[0] > time.monotonic()):
+                self._data.move_to_end(key)
+                self.hits += 1
+                return item[1]
+            if item is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class ResultCache:
+    """Input fingerprint -> Result id, in a local LRU tier backed by Redis.
+
+    Redis is shared by the API and the workers; the local tier answers repeated lookups
+    without a round trip. A Redis outage degrades to local-only caching and is retried
+    after ``retry_after`` seconds rather than on every call.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str],
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        prefix: str = "hydraulic:result:",
+        retry_after: float = 30.0,
+    ):
+        self.local = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.redis_url = redis_url
+        self.ttl = ttl
+        self.prefix = prefix
+        self.retry_after = retry_after
+        self._client: Optional[redis.Redis] = None
+        self._retry_at = 0.0
+
+    def _redis(self) -> Optional[redis.Redis]:
+        if not self.redis_url or time.monotonic() < self._retry_at:
+            return None
+        if self._client is None:
+            self._client = redis.Redis.from_url(self.redis_url, socket_connect_timeout=0.5, socket_timeout=0.5)
+        return self._client
+
+    def _redis_failed(self, exc: Exception) -> None:
+        logger.warning("Result cache Redis tier unavailable: %s", exc)
+        self._retry_at = time.monotonic() + self.retry_after
+
+    def get(self, fingerprint: str) -> Optional[int]:
+        result_id = self.local.get(fingerprint)
+        if result_id is not None:
+            return result_id
+        client = self._redis()
+        if client is None:
+            return None
+        try:
+            value = client.get(self.prefix + fingerprint)
+        except redis.RedisError as exc:
+            self._redis_failed(exc)
+            return None
+        if value is None:
+            return None
+        result_id = int(value)
+        self.local.set(fingerprint, result_id)
+        return result_id
+
+    def set(self, fingerprint: str, result_id: int) -> None:
+        self.local.set(fingerprint, result_id)
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            client.set(self.prefix + fingerprint, result_id, ex=int(self.ttl) if self.ttl else None)
+        except redis.RedisError as exc:
+            self._redis_failed(exc)
+
+    def discard(self, fingerprint: str) -> None:
+        self.local.discard(fingerprint)
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            client.delete(self.prefix + fingerprint)
+        except redis.RedisError as exc:
+            self._redis_failed(exc)
@@ -2,15 +2,21 @@ from __future__ import annotations
 
 import csv
 import io
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, Optional
 
 import numpy as np
-import pandas as pd
-from scipy.interpolate import PchipInterpolator
 
 from ..core.units import convert_array
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from scipy.interpolate import PchipInterpolator
+
+
+CURVE_ARRAYS = ("flow_si", "head_si", "efficiency", "power", "npshr")
+INVERSE_TABLE_POINTS = 1024
+
 
 @dataclass
 class PumpCurve:
@@ -24,21 +30,70 @@ class PumpCurve:
     efficiency_unit: Optional[str]
     power_unit: Optional[str]
     npshr_unit: Optional[str]
+    _splines: dict[str, PchipInterpolator] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _inverse: Optional[tuple[np.ndarray, np.ndarray]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value) -> None:
+        # Splines are built lazily and kept for the lifetime of the curve; reassigning
+        # one of the point arrays drops the splines that depend on it.
+        splines = self.__dict__.get("_splines")
+        if splines and name in CURVE_ARRAYS:
+            if name == "flow_si":
+                splines.clear()
+            else:
+                splines.pop(name, None)
+        if name in ("flow_si", "head_si"):
+            self.__dict__["_inverse"] = None
+        super().__setattr__(name, value)
+
+    def spline(self, name: str) -> Optional[PchipInterpolator]:
+        interpolator = self._splines.get(name)
+        if interpolator is None:
+            values = getattr(self, name)
+            if values is None:
+                return None
+            from scipy.interpolate import PchipInterpolator
+
+            interpolator = PchipInterpolator(self.flow_si, values, extrapolate=True)
+            self._splines[name] = interpolator
+        return interpolator
 
     def head_at(self, flow: np.ndarray) -> np.ndarray:
-        interpolator = PchipInterpolator(self.flow_si, self.head_si, extrapolate=True)
-        return interpolator(flow)
+        return self.spline("head_si")(flow)
+
+    def flow_at_head(self, head: np.ndarray) -> np.ndarray:
+        """Flow delivered against ``head``, read from a monotone inverse table.
+
+        The sampled head is raised to its running maximum from the runout end, so a hooked
+        curve inverts along its stable (falling) branch only: heads up to the peak map onto
+        it and heads above the peak clamp to the peak flow. Heads below the end of the
+        curve clamp to its runout flow.
+        """
+        if self._inverse is None:
+            flows = np.linspace(float(self.flow_si[0]), float(self.flow_si[-1]), INVERSE_TABLE_POINTS)[::-1]
+            heads = np.maximum.accumulate(self.head_at(flows))
+            # Keep the highest flow of every flat run so the table is strictly increasing.
+            rising = np.concatenate([[True], np.diff(heads) > 0])
+            self._inverse = (heads[rising], flows[rising])
+        heads, flows = self._inverse
+        return np.interp(head, heads, flows)
 
     def efficiency_at(self, flow: np.ndarray) -> Optional[np.ndarray]:
-        if self.efficiency is None:
+        interpolator = self.spline("efficiency")
+        if interpolator is None:
             return None
-        interpolator = PchipInterpolator(self.flow_si, self.efficiency, extrapolate=True)
         return interpolator(flow)
 
     def power_at(self, flow: np.ndarray) -> Optional[np.ndarray]:
-        if self.power is None:
+        interpolator = self.spline("power")
+        if interpolator is None:
+            return None
+        return interpolator(flow)
+
+    def npshr_at(self, flow: np.ndarray) -> Optional[np.ndarray]:
+        interpolator = self.spline("npshr")
+        if interpolator is None:
             return None
-        interpolator = PchipInterpolator(self.flow_si, self.power, extrapolate=True)
         return interpolator(flow)
 
 
@@ -56,7 +111,94 @@ def _extract_units_from_comment(comment: str) -> dict[str, str]:
     return mapping
 
 
+def _is_units_comment(row: list[str]) -> bool:
+    return row[0].startswith("#") and "units" in row[0].lower()
+
+
+def read_numeric_csv(lines: Iterable[str]) -> tuple[list[str], np.ndarray, dict[str, str]]:
+    """Read a header row and the numeric rows below it into a float table.
+
+    A ``# units:`` comment anywhere in the file is returned as a column -> unit mapping;
+    rows with a non-numeric cell or the wrong number of cells are dropped, and the rest
+    are kept in file order.
+    """
+    units: dict[str, str] = {}
+    header: list[str] | None = None
+    values: list[list[float]] = []
+    for row in csv.reader(lines):
+        if not row:
+            continue
+        if _is_units_comment(row):
+            units = _extract_units_from_comment(",".join(row))
+            continue
+        if header is None:
+            header = [item.strip().lower() for item in row]
+            continue
+        try:
+            parsed = [float(cell) for cell in row]
+        except ValueError:
+            continue
+        if len(parsed) == len(header):
+            values.append(parsed)
+    if header is None:
+        raise ValueError("CSV must include a header row")
+    return header, np.array(values, dtype=float).reshape(-1, len(header)), units
+
+
+def parse_pump_csv_lines(lines: Iterable[str]) -> tuple[dict[str, np.ndarray], dict[str, str]]:
+    """Parse a pump CSV incrementally into float columns without going through pandas.
+
+    Mirrors ``load_pump_csv``: rows with a non-numeric cell are dropped, points are sorted
+    by flow and flow must be strictly increasing.
+    """
+    header, table, units = read_numeric_csv(lines)
+    if "flow" not in header or "head" not in header:
+        raise ValueError("CSV must include flow and head columns")
+    table = table[~np.isnan(table).any(axis=1)]
+    table = table[np.argsort(table[:, header.index("flow")], kind="stable")]
+    if np.any(np.diff(table[:, header.index("flow")]) <= 0):
+        raise ValueError("Flow values must be strictly increasing")
+    return {name: table[:, idx] for idx, name in enumerate(header)}, units
+
+
+_SI_TARGETS = {"flow": "meter**3/second", "head": "meter", "power": "watt", "npshr": "meter"}
+
+
+def convert_pump_tables(
+    tables: list[dict[str, np.ndarray]], units: list[dict[str, str]]
+) -> list[dict[str, Optional[np.ndarray]]]:
+    """Convert many parsed curves to SI, one conversion per (column, unit) pair.
+
+    Columns sharing a unit are concatenated, converted together and split back, so a
+    catalog of thousands of curves costs a handful of unit conversions. Unit handling
+    matches ``create_pump_curve``; ``units`` must carry a flow and head unit per table.
+    """
+    converted: list[dict[str, Optional[np.ndarray]]] = [
+        {name: None for name in CURVE_ARRAYS} for _ in tables
+    ]
+    for column, target in _SI_TARGETS.items():
+        key = "flow_si" if column == "flow" else "head_si" if column == "head" else column
+        groups: dict[Optional[str], list[int]] = {}
+        for idx, table in enumerate(tables):
+            if column in table:
+                groups.setdefault(units[idx].get(column), []).append(idx)
+        for unit, members in groups.items():
+            values = np.concatenate([tables[idx][column] for idx in members])
+            if unit:
+                values = convert_array(values, unit, target)
+            offsets = np.cumsum([tables[idx][column].size for idx in members])[:-1]
+            for idx, part in zip(members, np.split(values, offsets)):
+                converted[idx][key] = part
+    for idx, table in enumerate(tables):
+        if "efficiency" in table:
+            scale = 0.01 if units[idx].get("efficiency") in {"%", "percent"} else 1.0
+            converted[idx]["efficiency"] = table["efficiency"] * scale
+    return converted
+
+
 def load_pump_csv(content: bytes) -> tuple[pd.DataFrame, dict[str, str]]:
+    import pandas as pd
+
     buffer = io.StringIO(content.decode("utf-8"))
     units: dict[str, str] = {}
     rows = []
@@ -65,8 +207,8 @@ def load_pump_csv(content: bytes) -> tuple[pd.DataFrame, dict[str, str]]:
     for row in reader:
         if not row:
             continue
-        if row[0].startswith("#") and "units" in row[0].lower():
-            units = _extract_units_from_comment(row[0])
+        if _is_units_comment(row):
+            units = _extract_units_from_comment(",".join(row))
             continue
         if header is None:
             header = [item.strip().lower() for item in row]
@@ -141,6 +283,36 @@ def best_efficiency_point(curve: PumpCurve) -> tuple[float, float]:
     return float(curve.flow_si[idx]), float(curve.head_si[idx])
 
 
+@dataclass(frozen=True)
+class PreparedPumpCurve:
+    """A pump curve with its splines built and derived values computed, ready to share."""
+
+    name: str
+    curve: PumpCurve
+    best_efficiency_point: tuple[float, float]
+    flow_domain: tuple[float, float]
+
+
+def prepare_pump_curve(name: str, curve: PumpCurve) -> PreparedPumpCurve:
+    """Build every spline up front and freeze the point arrays.
+
+    Prepared curves are shared between tasks, so nothing may be built lazily under
+    concurrent use or mutated in place afterwards.
+    """
+    for values in (curve.flow_si, curve.head_si, curve.efficiency, curve.power, curve.npshr):
+        if values is not None and values.flags.writeable:
+            values.flags.writeable = False
+    for array_name in CURVE_ARRAYS[1:]:
+        curve.spline(array_name)
+    curve.flow_at_head(float(curve.head_si[0]))
+    return PreparedPumpCurve(
+        name=name,
+        curve=curve,
+        best_efficiency_point=best_efficiency_point(curve),
+        flow_domain=(float(curve.flow_si[0]), float(curve.flow_si[-1])),
+    )
+
+
 def sample_curve(curve: PumpCurve, num: int = 200) -> dict[str, np.ndarray]:
     flows = np.linspace(curve.flow_si.min(), curve.flow_si.max(), num=num)
     return {
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Callable, Mapping, Optional
+
+import numpy as np
+
+from ..core.schemas import SampledCurve
+from .curves import PumpCurve
+from .intersections import HeadFunction
+
+# Curves are evaluated on this many flows before downsampling to the requested size.
+DENSE_SAMPLES = 2048
+DEFAULT_CURVE_POINTS = 200
+MAX_CURVE_POINTS = 2000
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Indices of the points Largest-Triangle-Three-Buckets keeps out of ``(x, y)``.
+
+    The first and last points are always kept; every interior bucket keeps the point
+    forming the largest triangle with the previously kept point and the average of the
+    next bucket. Triangle areas scale uniformly with each axis, so mixed units are fine.
+    """
+    n = x.size
+    if threshold >= n:
+        return np.arange(n)
+    if threshold < 3:
+        return np.array([0, n - 1])[:threshold]
+    edges = np.floor(np.linspace(1, n - 1, threshold - 1)).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    anchor = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < edges.size:
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        area = np.abs((x[anchor] - avg_x) * (y[start:end] - y[anchor]) - (x[anchor] - x[start:end]) * (avg_y - y[anchor]))
+        anchor = start + int(np.argmax(area))
+        selected[bucket + 1] = anchor
+    return selected
+
+
+def sample_downsampled(
+    flow_domain: tuple[float, float],
+    head: HeadFunction,
+    points: int,
+    extra: Optional[Mapping[str, Callable[[np.ndarray], Optional[np.ndarray]]]] = None,
+    dense: int = DENSE_SAMPLES,
+) -> dict[str, Optional[np.ndarray]]:
+    """Evaluate ``head`` densely over ``flow_domain`` and keep ``points`` LTTB-selected flows.
+
+    ``extra`` functions (efficiency, power) are evaluated at the kept flows only.
+    """
+    flows = np.linspace(float(flow_domain[0]), float(flow_domain[1]), max(dense, points))
+    heads = np.broadcast_to(np.asarray(head(flows), dtype=float), flows.shape)
+    keep = lttb_indices(flows, heads, points)
+    sampled: dict[str, Optional[np.ndarray]] = {"flow": flows[keep], "head": heads[keep]}
+    for name, function in (extra or {}).items():
+        values = function(sampled["flow"])
+        sampled[name] = np.asarray(values, dtype=float) if values is not None else None
+    return sampled
+
+
+def sample_pump_curve(curve: PumpCurve, points: int, dense: int = DENSE_SAMPLES) -> dict[str, Optional[np.ndarray]]:
+    """Head, efficiency and power of ``curve`` at ``points`` LTTB-selected flows."""
+    return sample_downsampled(
+        (float(curve.flow_si[0]), float(curve.flow_si[-1])),
+        curve.head_at,
+        points,
+        extra={"efficiency": curve.efficiency_at, "power": curve.power_at},
+        dense=dense,
+    )
+
+
+def sampled_curve(name: str, kind: str, sampled: dict, speed_ratio: Optional[float] = None) -> SampledCurve:
+    """Response model for one ``sample_downsampled``/``sample_pump_curve`` result."""
+    lists = {column: values.tolist() if values is not None else None for column, values in sampled.items()}
+    return SampledCurve(name=name, kind=kind, speed_ratio=speed_ratio, **lists)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import csv
+import io
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Sequence
+
+import orjson
+
+ExportFormat = Literal["csv", "ndjson", "parquet"]
+
+EXPORT_COLUMNS = ("configuration", "speed_ratio", "flow", "head", "efficiency", "power", "unstable")
+MEDIA_TYPES: Dict[str, str] = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+# Rows serialised per yielded chunk (and per Parquet row group).
+CHUNK_ROWS = 2000
+
+
+def _chunks(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    chunk: List[Dict[str, Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_csv(rows: Iterable[Dict[str, Any]], columns: Sequence[str] = EXPORT_COLUMNS) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore", lineterminator="\n")
+    writer.writeheader()
+    for chunk in _chunks(rows, CHUNK_ROWS):
+        writer.writerows(chunk)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # Header only: no rows were exported.
+        yield buffer.getvalue().encode("utf-8")
+
+
+def iter_ndjson(rows: Iterable[Dict[str, Any]], columns: Sequence[str] = EXPORT_COLUMNS) -> Iterator[bytes]:
+    for chunk in _chunks(rows, CHUNK_ROWS):
+        yield b"".join(orjson.dumps({column: row.get(column) for column in columns}) + b"\n" for row in chunk)
+
+
+class _ChunkSink:
+    """Write-only file that hands back what was written since the last ``drain``.
+
+    ``tell`` keeps counting across drains, since the Parquet writer records column chunk
+    offsets from it.
+    """
+
+    def __init__(self) -> None:
+        self._parts: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._parts.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def iter_parquet(rows: Iterable[Dict[str, Any]], columns: Sequence[str] = EXPORT_COLUMNS) -> Iterator[bytes]:
+    """Parquet file bytes, one row group per chunk; needs the optional ``pyarrow``.
+
+    pyarrow is imported before the first row is read, so a missing install raises
+    ``ImportError`` on the call rather than partway through a response.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    types = {"configuration": pa.string(), "unstable": pa.bool_()}
+    schema = pa.schema([(column, types.get(column, pa.float64())) for column in columns])
+    return _parquet_chunks(rows, schema, pa, pq)
+
+
+def _parquet_chunks(rows: Iterable[Dict[str, Any]], schema, pa, pq) -> Iterator[bytes]:
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema) as writer:
+        for chunk in _chunks(rows, CHUNK_ROWS):
+            writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def export_rows(rows: Iterable[Dict[str, Any]], format: ExportFormat) -> Iterator[bytes]:
+    if format == "csv":
+        return iter_csv(rows)
+    if format == "ndjson":
+        return iter_ndjson(rows)
+    return iter_parquet(rows)
@@ -1,32 +1,400 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Callable, Sequence
 
 import numpy as np
-from scipy.optimize import brentq
+
+from .curves import PumpCurve
+
+# Bump whenever a solver change can alter computed operating points; it is part of the
+# result cache key.
+SOLVER_VERSION = 6
+
+# Head functions take a flow array and return a head array of the same shape; plain
+# scalars are accepted too and constant functions may return a scalar.
+HeadFunction = Callable[[np.ndarray], np.ndarray]
 
 
 class IntersectionError(RuntimeError):
     pass
 
 
+# Coarse grid the adaptive scan starts from, and how many times an interval may be halved.
+INITIAL_SAMPLES = 9
+MAX_REFINEMENTS = 6
+
+
+@dataclass
+class Intersection:
+    flow: float
+    head: float
+    pump_slope: float
+    system_slope: float
+
+    @property
+    def unstable(self) -> bool:
+        """On a rising (hooked) part of the pump curve, where the duty can hunt between points."""
+        return self.pump_slope > 0
+
+
+@dataclass
+class IntersectionScan:
+    """Every pump/system crossing in a flow domain, in order of increasing flow.
+
+    ``evaluations`` counts the flow points both head functions were evaluated at and
+    ``calls`` the vectorized calls that took them.
+    """
+
+    intersections: list[Intersection]
+    evaluations: int
+    calls: int
+
+    def operating_point(self) -> Intersection:
+        """Lowest-flow stable crossing, or the lowest-flow crossing if none is stable."""
+        if not self.intersections:
+            raise IntersectionError("No intersection found within provided domain")
+        return next((point for point in self.intersections if not point.unstable), self.intersections[0])
+
+
+# Evaluates pump and system heads for the scans in ``rows`` at ``flow`` (same shape).
+RowHeadFunction = Callable[[np.ndarray, np.ndarray], tuple[np.ndarray, np.ndarray]]
+
+
+def _needs_refinement(residual: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Intervals without a sign change whose ends are too close to zero, for the local
+    curvature, to rule out a pair of crossings hidden between them.
+
+    ``residual`` holds several scans back to back, sorted by flow within each of ``rows``;
+    curvature is never taken across two scans and an interval never spans them.
+    """
+    same = rows[1:] == rows[:-1]
+    if residual.size < 3:
+        return np.zeros(same.size, dtype=bool)
+    interior = np.zeros(residual.size, dtype=bool)
+    interior[1:-1] = same[:-1] & same[1:]
+    local = np.zeros(residual.size)
+    local[1:-1] = np.abs(residual[:-2] - 2.0 * residual[1:-1] + residual[2:])
+    local = np.where(interior, local, 0.0)
+    # The ends of each scan borrow the curvature of their neighbour.
+    curvature = local.copy()
+    first = np.flatnonzero(np.concatenate([[True], ~same]))
+    last = np.flatnonzero(np.concatenate([~same, [True]]))
+    curvature[first] = local[np.minimum(first + 1, residual.size - 1)]
+    curvature[last] = local[np.maximum(last - 1, 0)]
+    bend = np.maximum(curvature[:-1], curvature[1:])
+    nearest = np.minimum(np.abs(residual[:-1]), np.abs(residual[1:]))
+    return same & (residual[:-1] * residual[1:] > 0) & (nearest < bend)
+
+
+@dataclass
+class _Crossings:
+    """Crossings of several scans as flat arrays, sorted by flow within each scan ``row``."""
+
+    row: np.ndarray
+    flow: np.ndarray
+    head: np.ndarray
+    pump_slope: np.ndarray
+    system_slope: np.ndarray
+    evaluations: np.ndarray
+    calls: int
+
+    def intersections(self) -> list[list[Intersection]]:
+        grouped: list[list[Intersection]] = [[] for _ in range(self.evaluations.size)]
+        columns = (self.flow, self.head, self.pump_slope, self.system_slope)
+        for row, *point in zip(self.row.tolist(), *(column.tolist() for column in columns)):
+            grouped[row].append(Intersection(*point))
+        return grouped
+
+    def preferred(self) -> tuple[np.ndarray, np.ndarray]:
+        """Rows with a crossing, and the index of the one ``IntersectionScan.operating_point`` picks."""
+        order = np.lexsort((self.flow, self.pump_slope > 0, self.row))
+        rows, first = np.unique(self.row[order], return_index=True)
+        return rows, order[first]
+
+
+def _scan(
+    heads: RowHeadFunction,
+    low: np.ndarray,
+    high: np.ndarray,
+    samples: int,
+    max_refinements: int,
+    xtol: float,
+    max_iter: int = 100,
+) -> _Crossings:
+    """Adaptive scans of the flow domains [low_i, high_i], all taken in the same calls."""
+    m = low.size
+    evaluations = np.zeros(m, dtype=int)
+    calls = 0
+
+    def evaluate(rows: np.ndarray, flow: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        nonlocal calls
+        evaluations[:] += np.bincount(rows, minlength=m)
+        calls += 1
+        return heads(rows, flow)
+
+    def residual(rows: np.ndarray, flow: np.ndarray) -> np.ndarray:
+        pump, system = evaluate(rows, flow)
+        return pump - system
+
+    # Degenerate domains keep a single point; values are ordered by (row, flow).
+    width = np.where(high > low, samples, 1)
+    rows = np.repeat(np.arange(m), width)
+    position = np.arange(rows.size) - np.repeat(np.cumsum(width) - width, width)
+    fraction = position / np.maximum(np.repeat(width, width) - 1, 1)
+    flow = low[rows] + (high - low)[rows] * fraction
+    values = residual(rows, flow)
+    for _ in range(max_refinements):
+        refine = np.flatnonzero(_needs_refinement(values, rows))
+        if refine.size == 0:
+            break
+        midpoints = 0.5 * (flow[refine] + flow[refine + 1])
+        flow = np.insert(flow, refine + 1, midpoints)
+        values = np.insert(values, refine + 1, residual(rows[refine], midpoints))
+        rows = np.insert(rows, refine + 1, rows[refine])
+
+    exact = values == 0
+    root_rows, roots = rows[exact], flow[exact]
+    brackets = np.flatnonzero((rows[1:] == rows[:-1]) & (values[:-1] * values[1:] < 0))
+    if brackets.size:
+        bracket_rows = rows[brackets]
+        tolerance = xtol * np.maximum(high - low, 1.0)[bracket_rows]
+        refined = illinois(residual, bracket_rows, flow[brackets], flow[brackets + 1], tolerance, max_iter=max_iter)
+        root_rows = np.concatenate([root_rows, bracket_rows])
+        roots = np.concatenate([roots, refined])
+    order = np.lexsort((roots, root_rows))
+    root_rows, roots = root_rows[order], roots[order]
+
+    if roots.size == 0:
+        empty = np.zeros(0)
+        return _Crossings(root_rows, roots, empty, empty, empty, evaluations, calls)
+    step = 1e-6 * np.maximum(high - low, 1e-12)[root_rows]
+    below = np.maximum(roots - step, low[root_rows])
+    above = np.minimum(roots + step, high[root_rows])
+    pump, system = evaluate(np.tile(root_rows, 3), np.concatenate([roots, below, above]))
+    n = roots.size
+    span = np.where(above > below, above - below, 1.0)
+    pump_slope = (pump[2 * n :] - pump[n : 2 * n]) / span
+    system_slope = (system[2 * n :] - system[n : 2 * n]) / span
+    return _Crossings(root_rows, roots, pump[:n], pump_slope, system_slope, evaluations, calls)
+
+
+def find_operating_points(
+    flow_domain: Sequence[float],
+    pump_head: HeadFunction,
+    system_head: HeadFunction,
+    samples: int = INITIAL_SAMPLES,
+    max_refinements: int = MAX_REFINEMENTS,
+    xtol: float = 1e-12,
+) -> IntersectionScan:
+    """All intersections of ``pump_head`` and ``system_head`` over ``flow_domain``.
+
+    The domain is sampled on a coarse grid and only intervals whose residual bends back
+    toward zero are halved, up to ``max_refinements`` times, so monotone curves cost one
+    small grid while hooked curves are searched where a second crossing can hide. Every
+    bracketed crossing is then refined at once with the Illinois method, and pump and
+    system slopes at each root are taken by central differences.
+    """
+    q_min, q_max = float(min(flow_domain)), float(max(flow_domain))
+
+    def heads(rows: np.ndarray, flow: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        pump = np.broadcast_to(np.asarray(pump_head(flow), dtype=float), flow.shape)
+        system = np.broadcast_to(np.asarray(system_head(flow), dtype=float), flow.shape)
+        return pump, system
+
+    crossings = _scan(heads, np.array([q_min]), np.array([q_max]), samples, max_refinements, xtol)
+    return IntersectionScan(crossings.intersections()[0], int(crossings.evaluations[0]), crossings.calls)
+
+
 def find_operating_point(
     flow_domain: Sequence[float],
-    pump_head: Callable[[float], float],
-    system_head: Callable[[float], float],
+    pump_head: HeadFunction,
+    system_head: HeadFunction,
 ) -> tuple[float, float]:
-    q_min, q_max = float(min(flow_domain)), float(max(flow_domain))
-    q_values = np.linspace(q_min, q_max, num=50)
-    diffs = [pump_head(q) - system_head(q) for q in q_values]
-    signs = np.sign(diffs)
-    for i in range(len(signs) - 1):
-        if signs[i] == 0:
-            q = float(q_values[i])
-            return q, float(pump_head(q))
-        if signs[i] * signs[i + 1] < 0:
-            lower = q_values[i]
-            upper = q_values[i + 1]
-            q = brentq(lambda x: pump_head(x) - system_head(x), lower, upper)
-            return float(q), float(pump_head(q))
-    raise IntersectionError("No intersection found within provided domain")
+    """(flow, head) of ``find_operating_points(...).operating_point()``."""
+    point = find_operating_points(flow_domain, pump_head, system_head).operating_point()
+    return point.flow, point.head
+
+
+@dataclass
+class PumpConfiguration:
+    curve: PumpCurve
+    speed_ratio: float = 1.0
+    count: int = 1
+    arrangement: str = "parallel"
+
+
+@dataclass
+class BatchSolution:
+    """Preferred operating point of each configuration, plus every crossing found.
+
+    ``flow``/``head``/``unstable`` describe the point ``IntersectionScan.operating_point``
+    would pick; ``evaluations`` counts flow points per configuration and ``calls`` the
+    vectorized calls the whole batch took.
+    """
+
+    flow: np.ndarray
+    head: np.ndarray
+    found: np.ndarray
+    pump_flow: np.ndarray
+    unstable: np.ndarray
+    intersections: list[list[Intersection]]
+    evaluations: np.ndarray
+    calls: int
+
+
+class _ConfigurationStack:
+    """N identical-pump configurations expressed as transforms of their base curves.
+
+    Affinity and aggregation collapse into H_i(Q) = a_i * H_base(Q / b_i) with
+    b = count * r, a = r^2 for a parallel bank and b = r, a = count * r^2 in series.
+    """
+
+    def __init__(self, configurations: Sequence[PumpConfiguration]):
+        ratios = np.array([cfg.speed_ratio for cfg in configurations], dtype=float)
+        counts = np.array([cfg.count for cfg in configurations], dtype=float)
+        if np.any(ratios <= 0):
+            raise ValueError("Speed ratio must be positive")
+        parallel = np.array([cfg.arrangement != "series" for cfg in configurations])
+        self.flow_scale = np.where(parallel, counts * ratios, ratios)
+        self.head_scale = np.where(parallel, 1.0, counts) * ratios ** 2
+        self.pump_flow_scale = np.where(parallel, counts, 1.0)
+
+        groups: dict[int, tuple[PumpCurve, list[int]]] = {}
+        for i, cfg in enumerate(configurations):
+            groups.setdefault(id(cfg.curve), (cfg.curve, []))[1].append(i)
+        self.groups = [(curve, np.array(rows)) for curve, rows in groups.values()]
+        self.group_of = np.empty(len(configurations), dtype=int)
+        for g, (_, rows) in enumerate(self.groups):
+            self.group_of[rows] = g
+
+        self.low = np.empty(len(configurations))
+        self.high = np.empty(len(configurations))
+        for curve, rows in self.groups:
+            self.low[rows] = float(curve.flow_si[0]) * self.flow_scale[rows]
+            self.high[rows] = float(curve.flow_si[-1]) * self.flow_scale[rows]
+
+    def clip(self, low: float, high: float) -> np.ndarray:
+        """Narrow every flow domain to [low, high]; False where nothing is left."""
+        self.low = np.maximum(self.low, low)
+        self.high = np.minimum(self.high, high)
+        overlap = self.high >= self.low
+        self.high = np.where(overlap, self.high, self.low)
+        return overlap
+
+    def pump_head(self, rows: np.ndarray, flow: np.ndarray) -> np.ndarray:
+        head = np.empty_like(flow)
+        row_groups = self.group_of[rows]
+        for g, (curve, _) in enumerate(self.groups):
+            mask = row_groups == g
+            if not mask.any():
+                continue
+            selected = rows[mask]
+            scale = self.flow_scale[selected].reshape((-1,) + (1,) * (flow.ndim - 1))
+            factor = self.head_scale[selected].reshape(scale.shape)
+            head[mask] = curve.head_at(flow[mask] / scale) * factor
+        return head
+
+
+def illinois(
+    residual: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    rows: np.ndarray,
+    a: np.ndarray,
+    b: np.ndarray,
+    tolerance: np.ndarray | float,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """Refine independent brackets [a_i, b_i] together with the Illinois method.
+
+    ``residual(rows, x)`` evaluates the residuals of the bracket ids in ``rows`` at ``x``;
+    every bracket must have residuals of opposite sign at its ends. Converged brackets
+    drop out of the active set so later iterations only evaluate the stragglers. A bracket
+    whose secant step is undefined (equal end residuals, or a non-finite step) is bisected
+    instead.
+    """
+    root = np.array(b, dtype=float)
+    index = np.arange(len(rows))
+    tolerance = np.broadcast_to(np.asarray(tolerance, dtype=float), index.shape)
+    fa = residual(rows, a)
+    fb = residual(rows, b)
+    for _ in range(max_iter):
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            c = b - fb * (b - a) / (fb - fa)
+        c = np.where((fb == fa) | ~np.isfinite(c), 0.5 * (a + b), c)
+        fc = residual(rows, c)
+        flip = np.sign(fc) * np.sign(fb) < 0
+        a = np.where(flip, b, a)
+        fa = np.where(flip, fb, fa * 0.5)
+        b, fb = c, fc
+        root[index] = c
+        keep = (fc != 0) & (np.abs(b - a) > tolerance)
+        if not keep.any():
+            break
+        index, rows, a, b, fa, fb, tolerance = index[keep], rows[keep], a[keep], b[keep], fa[keep], fb[keep], tolerance[keep]
+    return root
+
+
+def solve_operating_points(
+    configurations: Sequence[PumpConfiguration],
+    system_head: HeadFunction,
+    samples: int = INITIAL_SAMPLES,
+    max_refinements: int = MAX_REFINEMENTS,
+    xtol: float = 1e-12,
+    max_iter: int = 100,
+    system_domain: tuple[float, float] = (0.0, np.inf),
+) -> BatchSolution:
+    """Intersect every configuration with the system curve at once.
+
+    Each configuration is searched where its own flow domain overlaps ``system_domain``
+    (no overlap means no operating point) with the adaptive scan of
+    ``find_operating_points``; every configuration is refined in the same vectorized
+    calls, and all brackets are solved together with the Illinois (modified regula
+    falsi) iteration.
+    """
+    n = len(configurations)
+    if n == 0:
+        empty = np.zeros(0)
+        return BatchSolution(
+            flow=empty,
+            head=empty,
+            found=np.zeros(0, dtype=bool),
+            pump_flow=empty,
+            unstable=np.zeros(0, dtype=bool),
+            intersections=[],
+            evaluations=np.zeros(0, dtype=int),
+            calls=0,
+        )
+    stack = _ConfigurationStack(configurations)
+    active = np.flatnonzero(stack.clip(*system_domain))
+
+    def heads(rows: np.ndarray, flow: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        system = np.broadcast_to(np.asarray(system_head(flow), dtype=float), flow.shape)
+        return stack.pump_head(active[rows], flow), system
+
+    crossings = _scan(heads, stack.low[active], stack.high[active], samples, max_refinements, xtol, max_iter)
+    intersections: list[list[Intersection]] = [[] for _ in range(n)]
+    for row, points in zip(active, crossings.intersections()):
+        intersections[row] = points
+    evaluations = np.zeros(n, dtype=int)
+    evaluations[active] = crossings.evaluations
 
+    rows, pick = crossings.preferred()
+    solved = active[rows]
+    found = np.zeros(n, dtype=bool)
+    found[solved] = True
+    flow = np.full(n, np.nan)
+    flow[solved] = crossings.flow[pick]
+    head = np.full(n, np.nan)
+    head[solved] = crossings.head[pick]
+    unstable = np.zeros(n, dtype=bool)
+    unstable[solved] = crossings.pump_slope[pick] > 0
+    return BatchSolution(
+        flow=flow,
+        head=head,
+        found=found,
+        pump_flow=flow / stack.pump_flow_scale,
+        unstable=unstable,
+        intersections=intersections,
+        evaluations=evaluations,
+        calls=crossings.calls,
+    )
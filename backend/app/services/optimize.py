@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from .curves import PumpCurve
+from .intersections import HeadFunction, illinois
+
+SPEED_RATIO_BOUNDS = (0.3, 1.2)
+WATER_SPECIFIC_WEIGHT = 1000.0 * 9.80665  # N/m^3
+
+
+@dataclass
+class SpeedSelection:
+    flow: np.ndarray
+    head: np.ndarray
+    running: np.ndarray
+    speed_ratio: np.ndarray
+    power: np.ndarray
+    efficiency: np.ndarray
+
+    @property
+    def feasible(self) -> np.ndarray:
+        return self.running > 0
+
+
+def pump_duty(flow: np.ndarray, head: np.ndarray, running: np.ndarray, arrangement: str) -> tuple[np.ndarray, np.ndarray]:
+    """Per-pump flow and head when ``running`` identical pumps share a duty point."""
+    if arrangement == "series":
+        return flow * np.ones_like(running, dtype=float), head / running
+    return flow / running, head * np.ones_like(running, dtype=float)
+
+
+def required_speed(
+    curve: PumpCurve,
+    pump_flow: np.ndarray,
+    pump_head: np.ndarray,
+    ratio_bounds: tuple[float, float] = SPEED_RATIO_BOUNDS,
+    xtol: float = 1e-10,
+) -> np.ndarray:
+    """Speed ratio at which one pump delivers ``pump_flow`` against ``pump_head``.
+
+    Solves r^2 * H(q / r) = h for every element at once. Duties the pump cannot reach
+    inside ``ratio_bounds``, or only by running past the end of its curve, are NaN.
+    """
+    flow, head = np.broadcast_arrays(np.asarray(pump_flow, dtype=float), np.asarray(pump_head, dtype=float))
+    return required_speeds([curve], np.zeros(flow.shape, dtype=int), flow, head, ratio_bounds, xtol)
+
+
+def required_speeds(
+    curves: Sequence[PumpCurve],
+    curve_index: np.ndarray,
+    pump_flow: np.ndarray,
+    pump_head: np.ndarray,
+    ratio_bounds: tuple[float, float] = SPEED_RATIO_BOUNDS,
+    xtol: float = 1e-10,
+) -> np.ndarray:
+    """``required_speed`` for duties on several curves; ``curve_index`` picks each element's curve.
+
+    All elements share one Illinois refinement, so comparing many pumps costs one
+    iteration sequence with a spline call per curve per step.
+    """
+    index, flow, head = np.broadcast_arrays(
+        np.asarray(curve_index, dtype=int), np.asarray(pump_flow, dtype=float), np.asarray(pump_head, dtype=float)
+    )
+    shape = flow.shape
+    index, flow, head = index.ravel(), flow.ravel(), head.ravel()
+    flow_end = np.array([float(curve.flow_si[-1]) for curve in curves])[index]
+    low = np.maximum(ratio_bounds[0], flow / flow_end)
+    high = np.full_like(flow, ratio_bounds[1])
+
+    def residual(rows: np.ndarray, ratio: np.ndarray) -> np.ndarray:
+        base_flow = flow[rows] / ratio
+        if len(curves) == 1:
+            base_head = curves[0].head_at(base_flow)
+        else:
+            base_head = np.empty_like(base_flow)
+            selected = index[rows]
+            for i, curve in enumerate(curves):
+                mask = selected == i
+                if mask.any():
+                    base_head[mask] = curve.head_at(base_flow[mask])
+        return ratio ** 2 * base_head - head[rows]
+
+    rows = np.arange(flow.size)
+    reachable = low <= high
+    f_low = residual(rows, low)
+    f_high = residual(rows, high)
+    ratio = np.full(flow.size, np.nan)
+    ratio[reachable & (f_low == 0)] = low[reachable & (f_low == 0)]
+    ratio[reachable & (f_high == 0)] = high[reachable & (f_high == 0)]
+    bracketed = np.flatnonzero(reachable & (f_low < 0) & (f_high > 0))
+    if bracketed.size:
+        ratio[bracketed] = illinois(residual, bracketed, low[bracketed], high[bracketed], xtol)
+    return ratio.reshape(shape)
+
+
+def pump_power(curve: PumpCurve, pump_flow: np.ndarray, ratio: np.ndarray) -> np.ndarray | None:
+    """Shaft power of one pump at ``ratio``, from the power curve or from head and efficiency."""
+    base_flow = np.asarray(pump_flow, dtype=float) / ratio
+    if curve.power is not None:
+        return curve.power_at(base_flow) * ratio ** 3
+    if curve.efficiency is not None:
+        head = curve.head_at(base_flow) * ratio ** 2
+        efficiency = np.clip(curve.efficiency_at(base_flow), 1e-6, None)
+        return WATER_SPECIFIC_WEIGHT * pump_flow * head / efficiency
+    return None
+
+
+def optimize_speed(
+    curve: PumpCurve,
+    system_head: HeadFunction,
+    flow: float | np.ndarray,
+    max_running: int,
+    arrangement: str = "parallel",
+    ratio_bounds: tuple[float, float] = SPEED_RATIO_BOUNDS,
+) -> SpeedSelection:
+    """Minimum-power number of running pumps and common speed for each target flow.
+
+    Every candidate count 1..``max_running`` is solved for the exact speed that puts the
+    operating point on the system curve at the target flow; the cheapest feasible count
+    wins. Targets no count can reach report ``running == 0``.
+    """
+    flow = np.atleast_1d(np.asarray(flow, dtype=float))
+    head = np.broadcast_to(np.asarray(system_head(flow), dtype=float), flow.shape)
+    return select_speed(curve, flow, head, max_running, arrangement, ratio_bounds)
+
+
+def select_speed(
+    curve: PumpCurve,
+    flow: np.ndarray,
+    head: np.ndarray,
+    max_running: int,
+    arrangement: str = "parallel",
+    ratio_bounds: tuple[float, float] = SPEED_RATIO_BOUNDS,
+) -> SpeedSelection:
+    """``optimize_speed`` for explicit duty points: deliver ``flow[i]`` against ``head[i]``."""
+    return select_speeds([curve], flow, head, max_running, arrangement, ratio_bounds)[0]
+
+
+def select_speeds(
+    curves: Sequence[PumpCurve],
+    flow: np.ndarray,
+    head: np.ndarray,
+    max_running: int,
+    arrangement: str = "parallel",
+    ratio_bounds: tuple[float, float] = SPEED_RATIO_BOUNDS,
+) -> list[SpeedSelection]:
+    """``select_speed`` for every curve over the same duty points, solved together."""
+    flow, head = np.broadcast_arrays(np.atleast_1d(np.asarray(flow, dtype=float)), np.asarray(head, dtype=float))
+    running = np.arange(1, max_running + 1, dtype=float)[:, np.newaxis]
+    per_pump_flow, per_pump_head = pump_duty(flow[np.newaxis, :], head[np.newaxis, :], running, arrangement)
+    curve_index = np.arange(len(curves))[:, np.newaxis, np.newaxis]
+    ratios = required_speeds(curves, curve_index, per_pump_flow, per_pump_head, ratio_bounds)
+
+    selections = []
+    columns = np.arange(flow.size)
+    for curve, ratio in zip(curves, ratios):
+        power = pump_power(curve, per_pump_flow, ratio)
+        if power is None:
+            raise ValueError("Pump curve needs power or efficiency data to rank speeds")
+        total_power = np.where(np.isnan(ratio), np.inf, power * running)
+        best = np.argmin(total_power, axis=0)
+        feasible = np.isfinite(total_power[best, columns])
+        best_ratio = ratio[best, columns]
+        efficiency = np.full(flow.size, np.nan)
+        if curve.efficiency is not None and feasible.any():
+            efficiency[feasible] = curve.efficiency_at(per_pump_flow[best, columns][feasible] / best_ratio[feasible])
+        selections.append(
+            SpeedSelection(
+                flow=flow,
+                head=np.array(head),
+                running=np.where(feasible, best + 1, 0),
+                speed_ratio=np.where(feasible, best_ratio, np.nan),
+                power=np.where(feasible, total_power[best, columns], np.nan),
+                efficiency=efficiency,
+            )
+        )
+    return selections
+
+
+def system_flow_at_head(system_head: HeadFunction, head: float, flow_range: tuple[float, float]) -> float:
+    """Flow at which the system curve requires ``head``."""
+    from scipy.optimize import brentq
+
+    low, high = flow_range
+    if (float(system_head(low)) - head) * (float(system_head(high)) - head) > 0:
+        raise ValueError("Target head is outside the system curve range")
+    return float(brentq(lambda q: float(system_head(q)) - head, low, high))
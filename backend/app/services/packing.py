@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import hashlib
+import struct
+from typing import Any, Mapping, Optional
+
+import numpy as np
+
+# Packed layout: magic, column count (uint16), point count (uint32), comma-separated
+# column names prefixed by their byte length (uint16), zero padding to an 8-byte
+# boundary, then one little-endian float64 block per column.
+MAGIC = b"HCP1"
+_HEADER = struct.Struct("<4sHI")
+_NAMES = struct.Struct("<H")
+_DTYPE = np.dtype("<f8")
+
+
+def pack_arrays(columns: Mapping[str, Any]) -> bytes:
+    """Pack equal-length float columns into one blob; ``None`` columns are left out."""
+    present = {name: np.asarray(values, dtype=_DTYPE) for name, values in columns.items() if values is not None}
+    lengths = {values.size for values in present.values()}
+    if len(lengths) > 1:
+        raise ValueError("Packed columns must have the same length")
+    names = ",".join(present).encode("utf-8")
+    header = _HEADER.pack(MAGIC, len(present), lengths.pop() if lengths else 0) + _NAMES.pack(len(names)) + names
+    padding = b"\0" * (-len(header) % _DTYPE.itemsize)
+    return header + padding + b"".join(values.tobytes() for values in present.values())
+
+
+def unpack_arrays(blob: bytes | memoryview) -> dict[str, np.ndarray]:
+    """Read-only column views over ``blob``; nothing is copied."""
+    magic, count, points = _HEADER.unpack_from(blob, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a packed curve blob")
+    (names_length,) = _NAMES.unpack_from(blob, _HEADER.size)
+    names_start = _HEADER.size + _NAMES.size
+    names = bytes(blob[names_start : names_start + names_length]).decode("utf-8").split(",") if count else []
+    offset = names_start + names_length
+    offset += -offset % _DTYPE.itemsize
+    data = np.frombuffer(blob, dtype=_DTYPE, count=count * points, offset=offset).reshape(count, points)
+    return dict(zip(names, data))
+
+
+def encode_points(points: Optional[Mapping[str, Any]], storage: str) -> tuple[Optional[dict], Optional[bytes]]:
+    """(JSON value, packed blob) to store for ``points`` under the ``storage`` format."""
+    if points is None:
+        return None, None
+    if storage == "binary":
+        return None, pack_arrays(points)
+    return {name: np.asarray(values, dtype=float).tolist() if values is not None else None for name, values in points.items()}, None
+
+
+def decode_points(
+    json_points: Optional[Mapping[str, Any]], blob: Optional[bytes | memoryview]
+) -> Optional[dict[str, Optional[np.ndarray]]]:
+    """Curve columns as float arrays, from the packed blob when present, else from JSON."""
+    if blob is not None:
+        return unpack_arrays(blob)
+    if not json_points:
+        return None
+    return {name: np.asarray(values, dtype=float) if values is not None else None for name, values in json_points.items()}
+
+
+def points_digest(columns: Optional[Mapping[str, Any]]) -> Optional[str]:
+    """Content hash of curve columns that does not depend on how they are stored."""
+    if columns is None:
+        return None
+    return hashlib.sha256(pack_arrays({name: columns[name] for name in sorted(columns)})).hexdigest()
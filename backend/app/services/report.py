@@ -1,20 +1,31 @@
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from weasyprint import HTML
+if TYPE_CHECKING:
+    from jinja2 import Template
 
 TEMPLATE_PATH = Path(__file__).resolve().parent.parent / "templates"
 
+# Errors an otherwise valid render can hit: WeasyPrint or its native libraries missing
+# (ImportError) or failing to load, and the PDF not being writable (OSError).
+RENDER_ERRORS = (ImportError, OSError)
+
+
+@lru_cache(maxsize=1)
+def get_report_template() -> Template:
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
 
-def render_report(data: Dict[str, Any], output_pdf: Path) -> Path:
-    TEMPLATE_PATH.mkdir(parents=True, exist_ok=True)
     env = Environment(loader=FileSystemLoader(str(TEMPLATE_PATH)), autoescape=select_autoescape(["html", "xml"]))
-    template = env.get_template("report.html")
-    html = template.render(**data)
+    return env.get_template("report.html")
+
+
+def render_report(data: Dict[str, Any], output_pdf: Path) -> Path:
+    # WeasyPrint pulls in Pango/cairo bindings; only processes that render pay for them.
+    from weasyprint import HTML
+
+    html = get_report_template().render(**data)
     HTML(string=html).write_pdf(str(output_pdf))
     return output_pdf
-
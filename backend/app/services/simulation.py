@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+
+from ..core.units import convert_array
+from .curves import PumpCurve, read_numeric_csv
+from .intersections import HeadFunction
+from .optimize import SPEED_RATIO_BOUNDS, select_speed
+
+# Steps simulated per pass of the solver: one month of hourly data.
+SIMULATION_CHUNK_STEPS = 744
+
+
+@dataclass
+class DutySeries:
+    """Demand and tank level per time step, in SI units.
+
+    ``level`` is added to the system curve's static head, so a rising tank the pumps fill
+    from below raises the head they work against; ``hours`` is the length of each step.
+    """
+
+    demand: np.ndarray
+    level: np.ndarray
+    hours: np.ndarray
+
+    def __len__(self) -> int:
+        return self.demand.size
+
+    def window(self, start: int, stop: int) -> "DutySeries":
+        return DutySeries(self.demand[start:stop], self.level[start:stop], self.hours[start:stop])
+
+
+def parse_duty_csv_lines(lines: Iterable[str], step_hours: float = 1.0) -> DutySeries:
+    """Read a ``demand`` column with optional ``level`` and ``hours`` columns.
+
+    Units come from a ``# units: demand gpm, level ft`` comment like pump CSVs, with the
+    same US defaults; rows are taken in file order and each lasts ``step_hours`` unless an
+    ``hours`` column says otherwise.
+    """
+    header, table, units = read_numeric_csv(lines)
+    if "demand" not in header:
+        raise ValueError("Duty CSV must include a demand column")
+    if table.shape[0] == 0:
+        raise ValueError("Duty CSV has no numeric rows")
+    if np.isnan(table).any():
+        raise ValueError("Duty CSV contains missing values")
+
+    def column(name: str, default: float) -> np.ndarray:
+        return table[:, header.index(name)] if name in header else np.full(table.shape[0], default)
+
+    demand = convert_array(column("demand", 0.0), units.get("demand", "gpm"), "meter**3/second")
+    level = convert_array(column("level", 0.0), units.get("level", "ft"), "meter")
+    hours = column("hours", step_hours)
+    if np.any(demand < 0) or np.any(hours <= 0):
+        raise ValueError("Demand must be non-negative and step durations positive")
+    return DutySeries(demand=demand, level=level, hours=hours)
+
+
+@dataclass
+class DutySimulation:
+    running: np.ndarray
+    speed_ratio: np.ndarray
+    flow: np.ndarray
+    head: np.ndarray
+    power: np.ndarray
+    efficiency: np.ndarray
+    energy_kwh: np.ndarray
+    hours: np.ndarray
+    unmet: np.ndarray
+
+    @classmethod
+    def concatenate(cls, parts: list["DutySimulation"]) -> "DutySimulation":
+        return cls(**{name: np.concatenate([getattr(part, name) for part in parts]) for name in cls.__dataclass_fields__})
+
+    def totals(self) -> dict[str, Optional[float]]:
+        pumped_m3 = float(np.sum(self.flow * self.hours) * 3600.0)
+        energy_kwh = float(np.sum(self.energy_kwh))
+        return {
+            "steps": int(self.running.size),
+            "energy_kwh": energy_kwh,
+            "pumped_m3": pumped_m3,
+            "specific_energy_kwh_per_m3": energy_kwh / pumped_m3 if pumped_m3 > 0 else None,
+            "peak_power_kw": float(np.max(self.power, initial=0.0)) / 1000.0,
+            "run_hours": float(np.sum(self.hours[self.running > 0])),
+            "unmet_steps": int(np.count_nonzero(self.unmet)),
+            "unmet_hours": float(np.sum(self.hours[self.unmet])),
+        }
+
+    def series(self) -> dict[str, list]:
+        return {name: getattr(self, name).tolist() for name in self.__dataclass_fields__}
+
+
+def simulate_duty(
+    curve: PumpCurve,
+    system_head: HeadFunction,
+    series: DutySeries,
+    max_running: int,
+    arrangement: str = "parallel",
+    ratio_bounds: tuple[float, float] = SPEED_RATIO_BOUNDS,
+) -> DutySimulation:
+    """Staging, speed and energy for every step of ``series`` in one vectorized solve.
+
+    Each step must deliver its demand against the system head at that flow plus the tank
+    level; the cheapest feasible number of running pumps and common speed is picked as
+    in ``optimize_speed``. Zero-demand steps idle, and steps no staging can serve are
+    flagged ``unmet`` and draw no power.
+    """
+    steps = len(series)
+    demand = series.demand
+    head = np.broadcast_to(np.asarray(system_head(demand), dtype=float), demand.shape) + series.level
+    running = np.zeros(steps, dtype=int)
+    speed_ratio = np.full(steps, np.nan)
+    power = np.zeros(steps)
+    efficiency = np.full(steps, np.nan)
+    active = np.flatnonzero(demand > 0)
+    if active.size:
+        selection = select_speed(curve, demand[active], head[active], max_running, arrangement, ratio_bounds)
+        running[active] = selection.running
+        speed_ratio[active] = selection.speed_ratio
+        power[active] = np.nan_to_num(selection.power, nan=0.0)
+        efficiency[active] = selection.efficiency
+    unmet = (demand > 0) & (running == 0)
+    flow = np.where(unmet, 0.0, demand)
+    return DutySimulation(
+        running=running,
+        speed_ratio=speed_ratio,
+        flow=flow,
+        head=np.where(running > 0, head, np.nan),
+        power=power,
+        efficiency=efficiency,
+        energy_kwh=power * series.hours / 1000.0,
+        hours=series.hours,
+        unmet=unmet,
+    )
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Sequence
+
+import numpy as np
+
+from .curves import PumpCurve
+from .intersections import HeadFunction
+from .optimize import SPEED_RATIO_BOUNDS, select_speed
+
+# Demand grid points per staging table; lookups interpolate between them.
+STAGING_POINTS = 1024
+
+
+@dataclass(frozen=True)
+class StagingGroup:
+    """One way to run the station: up to ``count`` identical pumps in ``arrangement``."""
+
+    curve: PumpCurve
+    count: int
+    arrangement: str = "parallel"
+
+    @property
+    def max_flow(self) -> float:
+        """Flow of the whole group at full curve runout, before speed scaling."""
+        flow_end = float(self.curve.flow_si[-1])
+        return flow_end if self.arrangement == "series" else flow_end * self.count
+
+
+@dataclass
+class StagingTable:
+    """Cheapest group, running count and speed for a sorted grid of station demands.
+
+    ``group`` is -1 (and ``running`` 0) where nothing can deliver the demand; row 0 is
+    always the idle zero-flow duty.
+    """
+
+    flow: np.ndarray
+    group: np.ndarray
+    running: np.ndarray
+    speed_ratio: np.ndarray
+    head: np.ndarray
+    power: np.ndarray
+
+    def __len__(self) -> int:
+        return self.flow.size
+
+    @property
+    def max_flow(self) -> float:
+        return float(self.flow[-1])
+
+    def lookup(self, demand: float | np.ndarray) -> Dict[str, np.ndarray]:
+        """Staging for each ``demand`` by binary search; no curve is evaluated.
+
+        Between two grid points with the same group and running count, speed, head and
+        power are interpolated linearly; across a staging change the upper point is used,
+        so the returned staging can always deliver the demand. Demands above the table
+        are infeasible.
+        """
+        demand = np.atleast_1d(np.asarray(demand, dtype=float))
+        upper = np.searchsorted(self.flow, demand, side="left")
+        beyond = upper >= self.flow.size
+        upper = np.minimum(upper, self.flow.size - 1)
+        lower = np.maximum(upper - 1, 0)
+        same = (self.group[lower] == self.group[upper]) & (self.running[lower] == self.running[upper]) & (lower < upper)
+        span = self.flow[upper] - self.flow[lower]
+        weight = (demand - self.flow[lower]) / np.where(span > 0, span, 1.0)
+
+        def blend(column: np.ndarray) -> np.ndarray:
+            values = np.where(same, column[lower] + weight * (column[upper] - column[lower]), column[upper])
+            return np.where(beyond, np.nan, values)
+
+        group = np.where(beyond, -1, self.group[upper])
+        return {
+            "feasible": (group >= 0) | (demand <= 0),
+            "group": group,
+            "running": np.where(beyond, 0, self.running[upper]),
+            "speed_ratio": blend(self.speed_ratio.astype(float)),
+            "head": blend(self.head.astype(float)),
+            "power": blend(self.power.astype(float)),
+        }
+
+    def save(self, path: Path) -> Path:
+        # Written under a temporary name and renamed, so readers never see a partial file.
+        partial = path.with_name(f"{path.name}.{os.getpid()}.partial")
+        with partial.open("wb") as handle:
+            np.savez_compressed(handle, **{name: getattr(self, name) for name in self.__dataclass_fields__})
+        partial.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "StagingTable":
+        with np.load(path) as data:
+            return cls(**{name: data[name] for name in cls.__dataclass_fields__})
+
+
+def build_staging_table(
+    groups: Sequence[StagingGroup],
+    system_head: HeadFunction,
+    ratio_bounds: tuple[float, float] = SPEED_RATIO_BOUNDS,
+    points: int = STAGING_POINTS,
+) -> StagingTable:
+    """Sweep demand from zero to what the largest group can pump and stage every point.
+
+    Each group is solved with ``select_speed`` over the whole grid at once, and the
+    cheapest feasible group wins each point. The grid stops at the last demand any group
+    can serve; speed, head and power are stored as float32 to keep tables small.
+    """
+    flow = np.linspace(0.0, max(group.max_flow for group in groups) * ratio_bounds[1], points)
+    demand = flow[1:]
+    head = np.broadcast_to(np.asarray(system_head(demand), dtype=float), demand.shape)
+    power = np.full((len(groups), demand.size), np.inf)
+    selections = []
+    for i, group in enumerate(groups):
+        selection = select_speed(group.curve, demand, head, group.count, group.arrangement, ratio_bounds)
+        power[i] = np.where(selection.feasible, selection.power, np.inf)
+        selections.append(selection)
+    best = np.argmin(power, axis=0)
+    columns = np.arange(demand.size)
+    feasible = np.isfinite(power[best, columns])
+    served = np.flatnonzero(feasible)
+    # Keep one unserved point past the last served demand so lookups above it fail.
+    stop = served[-1] + 3 if served.size else 1
+
+    def column(name: str, idle: float) -> np.ndarray:
+        values = np.stack([getattr(selection, name) for selection in selections])[best, columns]
+        return np.concatenate([[idle], np.where(feasible, values, np.nan)])[:stop]
+
+    return StagingTable(
+        flow=flow[:stop],
+        group=np.concatenate([[-1], np.where(feasible, best, -1)])[:stop].astype(np.int16),
+        running=np.nan_to_num(column("running", 0.0)).astype(np.int16),
+        speed_ratio=column("speed_ratio", np.nan).astype(np.float32),
+        head=column("head", float(np.asarray(system_head(0.0)))).astype(np.float32),
+        power=column("power", 0.0).astype(np.float32),
+    )
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict
 
+import orjson
+
 UPLOAD_ROOT = Path("data/uploads")
 EXPORT_ROOT = Path("data/exports")
+# Precomputed staging tables; internal, so kept outside the served exports directory.
+STAGING_ROOT = Path("data/staging")
 
 UPLOAD_ROOT.mkdir(parents=True, exist_ok=True)
 EXPORT_ROOT.mkdir(parents=True, exist_ok=True)
+STAGING_ROOT.mkdir(parents=True, exist_ok=True)
 
 
 def save_upload(filename: str, content: bytes) -> Path:
@@ -19,6 +23,16 @@ def save_upload(filename: str, content: bytes) -> Path:
 
 def save_json(filename: str, payload: Dict[str, Any]) -> Path:
     path = EXPORT_ROOT / filename
-    path.write_text(json.dumps(payload, indent=2))
+    path.write_bytes(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY))
     return path
 
+
+
+def prune_files(directory: Path, pattern: str, keep: int) -> int:
+    """Delete all but the ``keep`` most recently modified files matching ``pattern``."""
+    files = sorted(directory.glob(pattern), key=lambda path: path.stat().st_mtime, reverse=True)
+    removed = 0
+    for path in files[keep:]:
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
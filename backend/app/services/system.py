@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .intersections import HeadFunction
+from .packing import decode_points
+
+if TYPE_CHECKING:
+    from scipy.interpolate import PchipInterpolator
+
+    from ..models import SystemCurve
+
+
+# Samples per doubling range when searching a formula curve for its first crossing of a head.
+FLOW_SCAN_SAMPLES = 65
+
+
+@dataclass
+class PolynomialSystemCurve:
+    """H(Q) = static + k * Q^2 + sum(c_i * Q^e_i), evaluated with NumPy broadcasting."""
+
+    static_head: float
+    resistance_coefficient: float
+    coefficients: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    exponents: np.ndarray = field(default_factory=lambda: np.zeros(0))
+
+    def head_at(self, flow: float | np.ndarray) -> float | np.ndarray:
+        q = np.asarray(flow, dtype=float)
+        total = self.static_head + self.resistance_coefficient * q ** 2
+        if self.coefficients.size:
+            total = total + np.sum(self.coefficients * q[..., np.newaxis] ** self.exponents, axis=-1)
+        return total
+
+    def __call__(self, flow: float | np.ndarray) -> float | np.ndarray:
+        return self.head_at(flow)
+
+    def flow_at_head(self, head: float) -> float:
+        """Lowest non-negative flow at which the curve reaches ``head`` (``inf`` if it never does).
+
+        Pure quadratic curves are solved in closed form. With extra terms the curve need not
+        be monotone, so a grid over a doubling range [0, upper] is scanned for the first
+        sample at or above ``head`` and brentq refines that cell; a crossing that starts and
+        ends between two samples can still be missed.
+        """
+        if head <= self.static_head:
+            return 0.0
+        if not self.coefficients.size:
+            if self.resistance_coefficient <= 0:
+                return float("inf")
+            return float(np.sqrt((head - self.static_head) / self.resistance_coefficient))
+        from scipy.optimize import brentq
+
+        upper = 1.0
+        while upper <= 1e6:
+            grid = np.linspace(0.0, upper, FLOW_SCAN_SAMPLES)
+            reached = np.flatnonzero(self.head_at(grid) >= head)
+            if reached.size:
+                i = reached[0]
+                if i == 0:
+                    return 0.0
+                return float(brentq(lambda q: float(self.head_at(q)) - head, grid[i - 1], grid[i]))
+            upper *= 2.0
+        return float("inf")
+
+
+@dataclass
+class TabulatedSystemCurve:
+    flow_si: np.ndarray
+    head_si: np.ndarray
+
+    @cached_property
+    def _spline(self) -> PchipInterpolator:
+        from scipy.interpolate import PchipInterpolator
+
+        return PchipInterpolator(self.flow_si, self.head_si, extrapolate=True)
+
+    def head_at(self, flow: float | np.ndarray) -> float | np.ndarray:
+        return self._spline(flow)
+
+    def __call__(self, flow: float | np.ndarray) -> float | np.ndarray:
+        return self.head_at(flow)
+
+
+def system_curve_from_model(
+    model: SystemCurve, shutoff_head: float | None = None
+) -> tuple[tuple[float, float], HeadFunction]:
+    """(flow domain, head function) of a stored system curve.
+
+    A tabulated curve is only trusted over its data. A formula curve starts at zero flow
+    and, given the highest ``shutoff_head`` any pump can make, ends where the system
+    needs more than that; without it the domain is open-ended.
+    """
+    points = decode_points(model.csv_points, model.csv_blob)
+    if points is not None:
+        curve = TabulatedSystemCurve(flow_si=points["flow_si"], head_si=points["head_si"])
+        return (float(curve.flow_si.min()), float(curve.flow_si.max())), curve.head_at
+
+    extra_terms = model.extra_terms or {}
+    terms = extra_terms.get("terms", [])
+    curve = PolynomialSystemCurve(
+        static_head=model.static_head,
+        resistance_coefficient=model.resistance_coefficient,
+        coefficients=np.array([term["coefficient"] for term in terms], dtype=float),
+        exponents=np.array([term["exponent"] for term in terms], dtype=float),
+    )
+    flow_limit = curve.flow_at_head(shutoff_head) if shutoff_head is not None else float("inf")
+    return (0.0, flow_limit), curve.head_at
@@ -6,10 +6,15 @@ from celery import Celery
 
 from ..db import settings
 
+ALWAYS_EAGER = bool(int(os.getenv("CELERY_ALWAYS_EAGER", "0")))
+
 celery_app = Celery(
     "hydraulic",
     broker=settings.redis_url,
-    backend=settings.redis_url,
+    # Eager runs never touch the broker; an in-memory backend lets the group/chord
+    # results of the compute workflow resolve locally without Redis.
+    backend="cache+memory://" if ALWAYS_EAGER else settings.redis_url,
+    include=["app.tasks.compute", "app.tasks.lifecycle", "app.tasks.simulation"],
 )
 
 celery_app.conf.update(
@@ -18,6 +23,9 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
-    task_always_eager=bool(int(os.getenv("CELERY_ALWAYS_EAGER", "0"))),
+    task_always_eager=ALWAYS_EAGER,
+    # Keep eager results in the backend so task status endpoints also work in eager mode.
+    task_store_eager_result=ALWAYS_EAGER,
+    # PDF rendering is off the compute critical path; a dedicated worker drains this queue.
+    task_routes={"render_result_report": {"queue": "reports"}},
 )
-
@@ -1,32 +1,50 @@
 from __future__ import annotations
 
-import json
+import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
+from celery import chord, group
+from celery.result import allow_join_result
+from celery.worker.control import inspect_command
+from sqlalchemy import or_
+from sqlalchemy.orm import aliased
 from sqlmodel import Session, select
 
-from ..core.schemas import OperatingPoint
 from ..models import Pump, Result, Scenario, SystemCurve
-from ..services.combine import build_parallel, build_series
-from ..services.curves import PumpCurve, best_efficiency_point
-from ..services.intersections import IntersectionError, find_operating_point
-from ..services.report import render_report
-from ..services.storage import save_json
-from ..db import session_factory
+from ..services.curves import PreparedPumpCurve, PumpCurve, prepare_pump_curve
+from ..services.cache import LRUCache, ResultCache, input_fingerprint
+from ..services.packing import decode_points, points_digest
+from ..services.intersections import SOLVER_VERSION, PumpConfiguration, solve_operating_points
+from ..services.report import RENDER_ERRORS, render_report
+from ..services.staging import StagingTable
+from ..services.storage import EXPORT_ROOT, STAGING_ROOT, prune_files, save_json
+from ..services.system import system_curve_from_model
+from ..db import session_factory, settings
 from .celery_app import celery_app
 
+result_cache = ResultCache(
+    settings.redis_url,
+    maxsize=settings.result_cache_size,
+    ttl=settings.result_cache_ttl_seconds,
+)
+# Pump versions are immutable (uq_pump_version), so a prepared curve never goes stale.
+curve_cache = LRUCache(maxsize=settings.curve_cache_size)
+# Staging tables are keyed by content fingerprint, so entries never go stale either.
+staging_cache = LRUCache(maxsize=settings.staging_cache_size)
+
 
 def _pump_curve_from_model(model: Pump) -> PumpCurve:
-    data = model.curve_points
+    data = decode_points(model.curve_points, model.curve_blob)
     return PumpCurve(
-        flow_si=np.array(data["flow_si"], dtype=float),
-        head_si=np.array(data["head_si"], dtype=float),
-        efficiency=np.array(data.get("efficiency"), dtype=float) if data.get("efficiency") is not None else None,
-        power=np.array(data.get("power"), dtype=float) if data.get("power") is not None else None,
-        npshr=np.array(data.get("npshr"), dtype=float) if data.get("npshr") is not None else None,
+        flow_si=data["flow_si"],
+        head_si=data["head_si"],
+        efficiency=data.get("efficiency"),
+        power=data.get("power"),
+        npshr=data.get("npshr"),
         flow_unit=model.flow_unit,
         head_unit=model.head_unit,
         efficiency_unit=model.efficiency_unit,
@@ -35,98 +53,268 @@ def _pump_curve_from_model(model: Pump) -> PumpCurve:
     )
 
 
-def _system_curve_function(model: SystemCurve):
-    if model.csv_points:
-        flow = np.array(model.csv_points["flow_si"], dtype=float)
-        head = np.array(model.csv_points["head_si"], dtype=float)
-        from scipy.interpolate import PchipInterpolator
+def cached_pump_curve(pump_key: int, version: int, load_pump: Callable[[], Pump]) -> PreparedPumpCurve:
+    """Prepared curve for a pump version; ``load_pump`` is only called on a cache miss."""
+    prepared = curve_cache.get((pump_key, version))
+    if prepared is None:
+        pump = load_pump()
+        prepared = prepare_pump_curve(pump.name, _pump_curve_from_model(pump))
+        curve_cache.set((pump_key, version), prepared)
+    return prepared
+
+
+def cached_staging_table(key: str, build: Callable[[], StagingTable]) -> StagingTable:
+    """Staging table for a content key: from memory, else from its ``.npz``, else ``build``.
+
+    Files live in ``STAGING_ROOT``, which is not served; reading one refreshes its mtime
+    and writing one prunes the directory to ``staging_files_max`` files.
+    """
+    table = staging_cache.get(key)
+    if table is None:
+        path = STAGING_ROOT / f"staging_{key}.npz"
+        if path.exists():
+            table = StagingTable.load(path)
+            path.touch()
+        else:
+            table = build()
+            table.save(path)
+            prune_files(STAGING_ROOT, "staging_*.npz", settings.staging_files_max)
+        staging_cache.set(key, table)
+    return table
+
+
+@inspect_command()
+def curve_cache_stats(state) -> Dict[str, int]:
+    """``celery -A app.tasks.celery_app.celery_app inspect curve_cache_stats``"""
+    return curve_cache.stats()
+
+
+PumpEntryKey = Tuple[int, Optional[int]]
+
+
+def pump_entry_key(entry: Dict[str, Any]) -> PumpEntryKey:
+    return entry["pump_id"], entry.get("version")
 
-        interpolator = PchipInterpolator(flow, head, extrapolate=True)
-        return (float(flow.min()), float(flow.max())), lambda q: float(interpolator(q))
 
-    static_head = model.static_head
-    k = model.resistance_coefficient
-    extra_terms = model.extra_terms or {}
-    terms = [(term["coefficient"], term["exponent"]) for term in extra_terms.get("terms", [])]
+def load_entry_pumps(session: Session, entries: Iterable[Dict[str, Any]]) -> Dict[PumpEntryKey, Pump]:
+    """Resolve the pump of every scenario entry with a single query.
 
-    def head_function(flow: float) -> float:
-        total = static_head + k * (flow ** 2)
-        for coeff, exponent in terms:
-            total += coeff * (flow ** exponent)
-        return total
+    An entry names a pump row by ``pump_id``; when it also carries a ``version`` it means
+    that version of the same pump (same ``pump_key``). Unresolvable keys are omitted.
+    """
+    keys = {pump_entry_key(entry) for entry in entries}
+    if not keys:
+        return {}
+    versions = {version for _, version in keys if version is not None}
+    reference = aliased(Pump)
+    wanted = Pump.id == reference.id
+    if versions:
+        wanted = or_(wanted, Pump.version.in_(versions))
+    rows = session.exec(
+        select(reference.id, Pump)
+        .join(reference, Pump.pump_key == reference.pump_key)
+        .where(reference.id.in_({pump_id for pump_id, _ in keys}), wanted)
+    ).all()
+    resolved: Dict[PumpEntryKey, Pump] = {}
+    for reference_id, pump in rows:
+        if pump.id == reference_id:
+            resolved[(reference_id, None)] = pump
+        resolved[(reference_id, pump.version)] = pump
+    return {key: resolved[key] for key in keys if key in resolved}
 
-    return (0.0, 10.0), head_function
+
+def entry_shutoff_head(curve: PumpCurve, entry: Dict[str, Any]) -> float:
+    """Highest head an entry reaches at any of its speeds."""
+    count = entry.get("count", 1) if entry.get("arrangement", "parallel") == "series" else 1
+    return float(np.max(curve.head_si)) * max(entry.get("vfd_speeds", [1.0])) ** 2 * count
+
+
+def scenario_fingerprint(scenario: Scenario, system_curve: SystemCurve, pumps: Dict[PumpEntryKey, Pump]) -> str:
+    """Content hash of everything that determines a scenario's operating points."""
+    entries = []
+    for entry in scenario.pumps["items"]:
+        pump = pumps[pump_entry_key(entry)]
+        entries.append(
+            {
+                "pump": pump.name,
+                "curve": points_digest(decode_points(pump.curve_points, pump.curve_blob)),
+                "count": entry.get("count", 1),
+                "arrangement": entry.get("arrangement", "parallel"),
+                "vfd_speeds": entry.get("vfd_speeds", [1.0]),
+            }
+        )
+    return input_fingerprint(
+        {
+            "solver": SOLVER_VERSION,
+            "scenario_id": scenario.id,
+            "system_curve": {
+                "static_head": system_curve.static_head,
+                "resistance_coefficient": system_curve.resistance_coefficient,
+                "extra_terms": system_curve.extra_terms,
+                "csv_points": points_digest(decode_points(system_curve.csv_points, system_curve.csv_blob)),
+            },
+            "entries": entries,
+        }
+    )
+
+
+def _solve_entry(
+    name: str, curve: PumpCurve, entry: Dict[str, Any], system_head, system_domain: Tuple[float, float]
+) -> List[Dict[str, Any]]:
+    count = entry.get("count", 1)
+    arrangement = entry.get("arrangement", "parallel")
+    speeds = entry.get("vfd_speeds", [1.0])
+    configurations = [
+        PumpConfiguration(curve=curve, speed_ratio=ratio, count=count, arrangement=arrangement) for ratio in speeds
+    ]
+    solution = solve_operating_points(configurations, system_head, system_domain=system_domain)
+
+    ratios = np.asarray(speeds, dtype=float)
+    base_flow = solution.pump_flow / ratios
+    efficiency = curve.efficiency_at(base_flow) if curve.efficiency is not None else None
+    power = curve.power_at(base_flow) * ratios ** 3 * count if curve.power is not None else None
+
+    operating_points: List[Dict[str, Any]] = []
+    for i in np.flatnonzero(solution.found):
+        operating_points.append(
+            {
+                "configuration": f"{name} x{count} {arrangement}",
+                "speed_ratio": speeds[i],
+                "flow": float(solution.flow[i]),
+                "head": float(solution.head[i]),
+                "efficiency": float(efficiency[i]) if efficiency is not None else None,
+                "power": float(power[i]) if power is not None else None,
+                "unstable": bool(solution.unstable[i]),
+                "intersections": [
+                    {"flow": point.flow, "head": point.head, "unstable": point.unstable}
+                    for point in solution.intersections[i]
+                ],
+                "evaluations": int(solution.evaluations[i]),
+                "calls": solution.calls,
+            }
+        )
+    return operating_points
 
 
-@celery_app.task(name="compute_scenario")
-def compute_scenario(scenario_id: int) -> int:
+@celery_app.task(name="solve_pump_entries")
+def solve_pump_entries(
+    system_curve_id: int, pump_ref: Tuple[int, int, int], indexed_entries: List[Tuple[int, Dict[str, Any]]]
+) -> List[Tuple[int, List[Dict[str, Any]]]]:
+    """Solve every scenario entry that uses one pump version.
+
+    ``pump_ref`` is (id, pump_key, version); the pump row is only read when this worker
+    has not prepared that version yet.
+    """
+    pump_id, pump_key, version = pump_ref
     with session_factory() as session:  # type: ignore[call-arg]
-        scenario = session.exec(select(Scenario).where(Scenario.id == scenario_id)).one()
-        system_curve = session.exec(select(SystemCurve).where(SystemCurve.id == scenario.system_curve_id)).one()
-
-        pumps: List[Dict[str, Any]] = scenario.pumps["items"]
-        system_domain, system_head = _system_curve_function(system_curve)
-
-        operating_points: List[Dict[str, Any]] = []
-        for entry in pumps:
-            pump_model = session.exec(select(Pump).where(Pump.id == entry["pump_id"])).one()
-            curve = _pump_curve_from_model(pump_model)
-            count = entry.get("count", 1)
-            arrangement = entry.get("arrangement", "parallel")
-            speeds = entry.get("vfd_speeds", [1.0])
-
-            for ratio in speeds:
-                if arrangement == "series":
-                    aggregate = build_series([curve], [ratio], [count])
-                else:
-                    aggregate = build_parallel([curve], [ratio], [count])
-                try:
-                    q, h = find_operating_point(
-                        flow_domain=np.linspace(aggregate.flow_domain[0], aggregate.flow_domain[1], 200),
-                        pump_head=aggregate.head,
-                        system_head=system_head,
-                    )
-                except IntersectionError:
-                    continue
-                eff = None
-                if curve.efficiency is not None:
-                    from scipy.interpolate import PchipInterpolator
-
-                    eff_interp = PchipInterpolator(curve.flow_si * ratio, curve.efficiency, extrapolate=True)
-                    eff = float(eff_interp(q / count if arrangement == "parallel" else q))
-                power = None
-                if curve.power is not None:
-                    from scipy.interpolate import PchipInterpolator
-
-                    scaled_power = curve.power * (ratio ** 3)
-                    power_interp = PchipInterpolator(curve.flow_si * ratio, scaled_power, extrapolate=True)
-                    power = float(power_interp(q / count if arrangement == "parallel" else q)) * count
-                operating_points.append(
-                    {
-                        "configuration": f"{pump_model.name} x{count} {arrangement}",
-                        "speed_ratio": ratio,
-                        "flow": q,
-                        "head": h,
-                        "efficiency": eff,
-                        "power": power,
-                    }
-                )
-
-        payload = {"operating_points": operating_points, "computed_at": datetime.utcnow().isoformat()}
-        json_path = save_json(f"scenario_{scenario_id}_results.json", payload)
-        pdf_path = render_report(
-            data={"scenario": scenario.name, "results": operating_points},
-            output_pdf=Path(f"data/exports/scenario_{scenario_id}.pdf"),
+        system_curve = session.exec(select(SystemCurve).where(SystemCurve.id == system_curve_id)).one()
+        prepared = cached_pump_curve(
+            pump_key, version, lambda: session.exec(select(Pump).where(Pump.id == pump_id)).one()
         )
+    shutoff = max(entry_shutoff_head(prepared.curve, entry) for _, entry in indexed_entries)
+    system_domain, system_head = system_curve_from_model(system_curve, shutoff)
+    return [
+        (index, _solve_entry(prepared.name, prepared.curve, entry, system_head, system_domain))
+        for index, entry in indexed_entries
+    ]
+
 
+@celery_app.task(name="persist_result")
+def persist_result(
+    group_points: List[List[Tuple[int, List[Dict[str, Any]]]]], scenario_id: int, fingerprint: str | None = None
+) -> int:
+    # Each pump group reports (entry index, points); restore the scenario's entry order.
+    indexed = sorted((index, points) for points_by_entry in group_points for index, points in points_by_entry)
+    operating_points = [point for _, entry_points in indexed for point in entry_points]
+    payload = {"operating_points": operating_points, "computed_at": datetime.utcnow().isoformat()}
+    json_path = save_json(f"scenario_{scenario_id}_results.json", payload)
+    with session_factory() as session:  # type: ignore[call-arg]
         result = Result(
             scenario_id=scenario_id,
             operating_points=operating_points,
             csv_path=f"files/{json_path.name}",
-            pdf_path=f"files/{pdf_path.name}",
+            pdf_path="",
+            report_status="pending",
         )
         session.add(result)
+        session.flush()
+        result.pdf_path = f"files/result_{result.id}.pdf"
+        session.commit()
+        result_id = result.id
+    if fingerprint:
+        result_cache.set(fingerprint, result_id)
+    render_result_report.delay(result_id)
+    return result_id
+
+
+def render_result_pdf(session: Session, result: Result) -> Path:
+    """Return the result's PDF, rendering it first if the report queue has not yet.
+
+    The PDF is rendered to a temporary file beside the target and moved into place, so a
+    download racing the report queue never reads a half-written file.
+    """
+    output = EXPORT_ROOT / Path(result.pdf_path).name
+    if result.report_status == "ready" and output.exists():
+        return output
+    scenario = session.exec(select(Scenario).where(Scenario.id == result.scenario_id)).one()
+    fd, partial = tempfile.mkstemp(dir=output.parent, prefix=f".{output.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        render_report(data={"scenario": scenario.name, "results": result.operating_points}, output_pdf=Path(partial))
+        os.replace(partial, output)
+    except RENDER_ERRORS:
+        result.report_status = "failed"
+        session.add(result)
         session.commit()
-        session.refresh(result)
-        return result.id
+        raise
+    finally:
+        Path(partial).unlink(missing_ok=True)
+    result.report_status = "ready"
+    session.add(result)
+    session.commit()
+    return output
+
 
+@celery_app.task(name="render_result_report")
+def render_result_report(result_id: int) -> int:
+    with session_factory() as session:  # type: ignore[call-arg]
+        result = session.exec(select(Result).where(Result.id == result_id)).one()
+        render_result_pdf(session, result)
+    return result_id
+
+
+def build_compute_workflow(scenario: Scenario, pumps: Dict[PumpEntryKey, Pump], fingerprint: str | None = None):
+    """Fan the pump entries out as a group and persist them through a chord callback.
+
+    Entries resolving to the same pump row share one subtask, so each pump is loaded and
+    decoded once. The chord callback commits the Result and queues its PDF separately,
+    so the workflow finishes as soon as the numbers are stored.
+    """
+    by_pump: Dict[Tuple[int, int, int], List[Tuple[int, Dict[str, Any]]]] = {}
+    for index, entry in enumerate(scenario.pumps["items"]):
+        pump = pumps[pump_entry_key(entry)]
+        by_pump.setdefault((pump.id, pump.pump_key, pump.version), []).append((index, entry))
+    if by_pump:
+        header = group(
+            solve_pump_entries.s(scenario.system_curve_id, pump_ref, indexed_entries)
+            for pump_ref, indexed_entries in by_pump.items()
+        )
+        persist = chord(header, persist_result.s(scenario.id, fingerprint))
+    else:
+        persist = persist_result.si([], scenario.id, fingerprint)
+    return persist
+
+
+@celery_app.task(name="compute_scenario", bind=True)
+def compute_scenario(self, scenario_id: int, fingerprint: str | None = None) -> int:
+    with session_factory() as session:  # type: ignore[call-arg]
+        scenario = session.exec(select(Scenario).where(Scenario.id == scenario_id)).one()
+        pumps = load_entry_pumps(session, scenario.pumps["items"])
+    workflow = build_compute_workflow(scenario, pumps, fingerprint)
+    if self.request.is_eager:
+        # An eager chord joins its header inline, which Celery only permits inside a task
+        # when explicitly allowed.
+        with allow_join_result():
+            return workflow.apply().get()
+    # The workflow inherits this task's id, so callers waiting on it get the Result id.
+    return self.replace(workflow)
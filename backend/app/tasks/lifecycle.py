@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import numpy as np
+from sqlmodel import select
+
+from ..db import session_factory
+from ..models import Pump, SystemCurve
+from ..services.lifecycle import Tariff, lifecycle_costs
+from ..services.system import system_curve_from_model
+from .celery_app import celery_app
+from .compute import cached_pump_curve
+
+
+@celery_app.task(name="compare_lifecycle_costs")
+def compare_lifecycle_costs(
+    pump_ids: List[int],
+    system_curve_id: int,
+    duty_flow: List[float],
+    duty_hours: List[float],
+    options: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Annual energy, cost and NPV of every candidate pump over one duty histogram.
+
+    ``duty_flow`` is in m^3/s; ``options`` carries the tariff, study period and staging
+    fields of ``LifecycleCostRequest``. Curves come from the worker's prepared-curve
+    cache, so only candidates this worker has not seen are read in full.
+    """
+    with session_factory() as session:  # type: ignore[call-arg]
+        system_curve = session.exec(select(SystemCurve).where(SystemCurve.id == system_curve_id)).one()
+        rows = {
+            row.id: row
+            for row in session.exec(
+                select(Pump.id, Pump.pump_key, Pump.version, Pump.name).where(Pump.id.in_(pump_ids))
+            ).all()
+        }
+        candidates = [rows[pump_id] for pump_id in pump_ids]
+        curves = [
+            cached_pump_curve(
+                row.pump_key,
+                row.version,
+                lambda pump_id=row.id: session.exec(select(Pump).where(Pump.id == pump_id)).one(),
+            ).curve
+            for row in candidates
+        ]
+    missing = [row.name for row, curve in zip(candidates, curves) if curve.power is None and curve.efficiency is None]
+    if missing:
+        raise ValueError(f"No power or efficiency data for {', '.join(missing)}")
+    _, system_head = system_curve_from_model(system_curve)
+    capital = np.array([options["capital_costs"].get(str(row.id), 0.0) for row in candidates])
+    costs = lifecycle_costs(
+        curves,
+        system_head,
+        np.asarray(duty_flow, dtype=float),
+        np.asarray(duty_hours, dtype=float),
+        Tariff(options["energy_price"], options["demand_charge"], options["escalation"]),
+        options["years"],
+        options["discount_rate"],
+        capital_costs=capital,
+        max_running=options["max_running"],
+        arrangement=options["arrangement"],
+        ratio_bounds=(options["min_speed_ratio"], options["max_speed_ratio"]),
+    )
+    results = [
+        {
+            "pump_id": row.id,
+            "name": row.name,
+            "version": row.version,
+            "annual_energy_kwh": float(costs.annual_energy_kwh[i]),
+            "peak_power_kw": float(costs.peak_power_kw[i]),
+            "annual_cost": float(costs.annual_cost[i]),
+            "capital_cost": float(capital[i]),
+            "npv": float(costs.npv[i]),
+            "unmet_hours": float(costs.unmet_hours[i]),
+            "feasible": bool(costs.feasible[i]),
+        }
+        for i, row in enumerate(candidates)
+    ]
+    # Candidates that serve the whole duty first, cheapest life-cycle cost first.
+    results.sort(key=lambda item: (not item["feasible"], item["npv"]))
+    return {
+        "system_curve_id": system_curve_id,
+        "years": options["years"],
+        "discount_rate": options["discount_rate"],
+        "candidates": results,
+    }
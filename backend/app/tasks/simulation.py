@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from sqlmodel import select
+
+from ..db import session_factory
+from ..models import Scenario, SystemCurve
+from ..services.simulation import SIMULATION_CHUNK_STEPS, DutySeries, DutySimulation, simulate_duty
+from ..services.storage import save_json
+from ..services.system import system_curve_from_model
+from .celery_app import celery_app
+from .compute import cached_pump_curve, load_entry_pumps, pump_entry_key
+
+
+@celery_app.task(name="simulate_scenario", bind=True)
+def simulate_scenario(
+    self,
+    scenario_id: int,
+    demand: List[float],
+    level: List[float],
+    hours: List[float],
+    ratio_bounds: Tuple[float, float],
+) -> Dict[str, Any]:
+    """Extended-period run of every scenario entry against one demand/level series.
+
+    Each entry's ``count`` is the most pumps it may stage. Steps are solved a chunk at a
+    time, and ``done``/``total`` steps are reported in the PROGRESS state after each chunk.
+    The per-step series are written to a JSON export; the task returns the totals.
+    """
+    with session_factory() as session:  # type: ignore[call-arg]
+        scenario = session.exec(select(Scenario).where(Scenario.id == scenario_id)).one()
+        system_curve = session.exec(select(SystemCurve).where(SystemCurve.id == scenario.system_curve_id)).one()
+        pumps = load_entry_pumps(session, scenario.pumps["items"])
+        entries = []
+        for entry in scenario.pumps["items"]:
+            pump = pumps[pump_entry_key(entry)]
+            entries.append((entry, pump.id, cached_pump_curve(pump.pump_key, pump.version, lambda pump=pump: pump)))
+    _, system_head = system_curve_from_model(system_curve)
+    series = DutySeries(
+        demand=np.asarray(demand, dtype=float), level=np.asarray(level, dtype=float), hours=np.asarray(hours, dtype=float)
+    )
+
+    total = len(entries) * len(series)
+    done = 0
+    summaries: List[Dict[str, Any]] = []
+    exported: List[Dict[str, Any]] = []
+    for entry, pump_id, prepared in entries:
+        count = entry.get("count", 1)
+        arrangement = entry.get("arrangement", "parallel")
+        parts: List[DutySimulation] = []
+        for start in range(0, len(series), SIMULATION_CHUNK_STEPS):
+            window = series.window(start, start + SIMULATION_CHUNK_STEPS)
+            parts.append(simulate_duty(prepared.curve, system_head, window, count, arrangement, tuple(ratio_bounds)))
+            done += len(window)
+            if self.request.id:
+                self.update_state(state="PROGRESS", meta={"done": done, "total": total})
+        simulation = DutySimulation.concatenate(parts)
+        configuration = f"{prepared.name} x{count} {arrangement}"
+        summaries.append({"configuration": configuration, "pump_id": pump_id, **simulation.totals()})
+        exported.append({"configuration": configuration, "pump_id": pump_id, "series": simulation.series()})
+
+    suffix = f"_{self.request.id}" if self.request.id else ""
+    path = save_json(f"scenario_{scenario_id}_simulation{suffix}.json", {"scenario_id": scenario_id, "entries": exported})
+    return {"scenario_id": scenario_id, "steps": len(series), "series_path": f"files/{path.name}", "entries": summaries}
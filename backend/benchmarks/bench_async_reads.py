@@ -0,0 +1,143 @@
+"""Load test of the read routes on the async session versus the threadpool/sync path.
+
+The async routes are served by ``app.main``; the sync baseline mounts the same handlers
+as plain ``def`` routes on ``get_session``, which FastAPI runs in its threadpool. Both
+are driven in-process through ``httpx.ASGITransport`` with ``--concurrency`` clients,
+so the numbers compare the two database paths rather than the network.
+
+Run from ``backend/`` with ``python -m benchmarks.bench_async_reads`` against the
+configured ``APP_DATABASE_URL`` / ``APP_SYNC_DATABASE_URL``; sample data is seeded when
+the tables are empty.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import httpx
+import numpy as np
+from fastapi import Depends, FastAPI, HTTPException, Response
+from sqlmodel import Session, select
+
+from app.db import get_session, init_db, session_factory
+from app.main import app
+from app.models import Pump, Result, Scenario, SystemCurve
+from app.routers.pagination import keyset_page
+from app.routers.pumps import _pump_read
+from app.routers.results import _result_read
+from app.routers.system_curves import _system_curve_read
+from app.seed import seed
+
+
+def _sync_app() -> FastAPI:
+    sync_app = FastAPI()
+
+    @sync_app.get("/api/pumps/{pump_id}")
+    def get_pump(pump_id: int, session: Session = Depends(get_session)):
+        pump = session.get(Pump, pump_id)
+        if not pump:
+            raise HTTPException(status_code=404)
+        return _pump_read(pump)
+
+    @sync_app.get("/api/pumps")
+    def list_pumps(limit: int = 50, session: Session = Depends(get_session)):
+        return [_pump_read(pump) for pump in keyset_page(session, select(Pump), Pump, limit, None, Response())]
+
+    @sync_app.get("/api/system-curves/{curve_id}")
+    def get_system_curve(curve_id: int, session: Session = Depends(get_session)):
+        model = session.get(SystemCurve, curve_id)
+        if not model:
+            raise HTTPException(status_code=404)
+        return _system_curve_read(model)
+
+    @sync_app.get("/api/results/{result_id}")
+    def get_result(result_id: int, session: Session = Depends(get_session)):
+        result = session.get(Result, result_id)
+        if not result:
+            raise HTTPException(status_code=404)
+        return _result_read(result)
+
+    return sync_app
+
+
+def _ensure_data() -> dict[str, str]:
+    with session_factory() as session:  # type: ignore[call-arg]
+        if session.exec(select(Pump.id)).first() is None:
+            seed()
+        pump_id = session.exec(select(Pump.id)).first()
+        curve_id = session.exec(select(SystemCurve.id)).first()
+        result_id = session.exec(select(Result.id)).first()
+        if result_id is None:
+            scenario = Scenario(
+                name="bench",
+                system_curve_id=curve_id,
+                pumps={"items": []},
+                unit_system="si",
+                por_default_low=0.7,
+                por_default_high=1.2,
+                aor_default_low=0.5,
+                aor_default_high=1.2,
+            )
+            session.add(scenario)
+            session.flush()
+            points = [
+                {"configuration": "bench", "speed_ratio": 1.0, "flow": 0.01 * i, "head": 40.0 - i, "efficiency": 0.7, "power": 1e4}
+                for i in range(20)
+            ]
+            result = Result(scenario_id=scenario.id, operating_points=points, csv_path="", pdf_path="", report_status="ready")
+            session.add(result)
+            session.commit()
+            result_id = result.id
+    return {
+        "get_pump": f"/api/pumps/{pump_id}",
+        "list_pumps": "/api/pumps?limit=50",
+        "get_system_curve": f"/api/system-curves/{curve_id}",
+        "get_result": f"/api/results/{result_id}",
+    }
+
+
+async def _load(target: FastAPI, path: str, requests: int, concurrency: int) -> tuple[float, np.ndarray]:
+    """(requests per second, per-request latencies in ms) for ``requests`` GETs of ``path``."""
+    latencies: list[float] = []
+    remaining = iter(range(requests))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=target), base_url="http://bench") as client:
+
+        async def worker() -> None:
+            for _ in remaining:
+                started = time.perf_counter()
+                response = await client.get(path)
+                latencies.append((time.perf_counter() - started) * 1000.0)
+                response.raise_for_status()
+
+        await client.get(path)
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return requests / elapsed, np.asarray(latencies)
+
+
+async def _run(requests: int, concurrency: int) -> None:
+    await init_db()
+    paths = _ensure_data()
+    targets = {"sync": _sync_app(), "async": app}
+    print(f"{requests} requests, {concurrency} concurrent clients")
+    print(f"{'route':<18}{'path':<7}{'req/s':>9}{'p50 (ms)':>10}{'p99 (ms)':>10}")
+    for route, path in paths.items():
+        for label, target in targets.items():
+            throughput, latencies = await _load(target, path, requests, concurrency)
+            p50, p99 = np.percentile(latencies, [50, 99])
+            print(f"{route:<18}{label:<7}{throughput:>9.0f}{p50:>10.1f}{p99:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+    asyncio.run(_run(args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
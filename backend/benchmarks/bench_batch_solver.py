@@ -0,0 +1,52 @@
+"""Speed sweep: one aggregate + ``find_operating_point`` per ratio vs the batch solver.
+
+Run from ``backend/`` with ``python -m benchmarks.bench_batch_solver``.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.services.combine import build_parallel
+from app.services.curves import create_pump_curve, load_pump_csv
+from app.services.intersections import IntersectionError, PumpConfiguration, find_operating_point, solve_operating_points
+from app.services.system import PolynomialSystemCurve
+
+SAMPLES = Path(__file__).resolve().parents[2] / "samples"
+
+
+def main() -> None:
+    curve = create_pump_curve(*load_pump_csv((SAMPLES / "pump_A.csv").read_bytes()))
+    system = PolynomialSystemCurve(static_head=15.0, resistance_coefficient=2500.0)
+    ratios = np.linspace(0.5, 1.1, 120)
+    count = 3
+
+    start = time.perf_counter()
+    loop_flows = []
+    for ratio in ratios:
+        aggregate = build_parallel([curve], [ratio], [count])
+        try:
+            q, _ = find_operating_point(aggregate.flow_domain, aggregate.head, system)
+        except IntersectionError:
+            q = np.nan
+        loop_flows.append(q)
+    loop_s = time.perf_counter() - start
+
+    configurations = [PumpConfiguration(curve, float(ratio), count, "parallel") for ratio in ratios]
+    start = time.perf_counter()
+    solution = solve_operating_points(configurations, system)
+    batch_s = time.perf_counter() - start
+
+    error = np.nanmax(np.abs(np.asarray(loop_flows) - solution.flow) / solution.flow)
+    print(f"{len(ratios)} ratios, {count} pumps in parallel")
+    print(f"per-ratio loop : {loop_s * 1e3:9.2f} ms")
+    print(f"batch solver   : {batch_s * 1e3:9.2f} ms")
+    print(f"speedup        : {loop_s / batch_s:9.1f}x")
+    print(f"max rel dQ     : {error:.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Cold import time of the API and worker entry points, with budget assertions.
+
+Each target is imported in a fresh interpreter under ``python -X importtime``; the
+cumulative time of the target module is compared against its budget, and modules that
+must stay lazy (PDF rendering, pandas, scipy, pint) must not be loaded at all.
+
+Run from ``backend/`` with ``python -m benchmarks.bench_import_time``. Pass
+``--scale 2`` to loosen the budgets on slow machines.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parents[1]
+
+# target module -> (budget in ms, modules that must not be imported)
+TARGETS = {
+    "app.main": (1500.0, ("weasyprint", "jinja2", "pandas", "scipy", "pint")),
+    "app.tasks.compute": (1200.0, ("weasyprint", "jinja2", "pandas", "scipy", "pint")),
+}
+REPEAT = 3
+
+
+def import_profile(module: str) -> dict[str, tuple[int, int, int]]:
+    """name -> (self us, cumulative us, nesting depth) for one cold import of ``module``."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise SystemExit(f"import {module} failed:\n{completed.stderr[-2000:]}")
+    profile: dict[str, tuple[int, int, int]] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        profile[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return profile
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget by this factor")
+    args = parser.parse_args()
+
+    failures: list[str] = []
+    for module, (budget_ms, forbidden) in TARGETS.items():
+        profiles = [import_profile(module) for _ in range(REPEAT)]
+        best = min(profiles, key=lambda profile: profile[module][1])
+        total_ms = best[module][1] / 1000.0
+        print(f"{module}: {total_ms:.0f} ms (budget {budget_ms * args.scale:.0f} ms)")
+        packages = sorted(
+            ((cumulative, name) for name, (_, cumulative, _) in best.items() if "." not in name and name != module),
+            reverse=True,
+        )
+        for cumulative, name in packages[:8]:
+            print(f"    {cumulative / 1000.0:8.1f} ms  {name}")
+        if total_ms > budget_ms * args.scale:
+            failures.append(f"{module} took {total_ms:.0f} ms, over its {budget_ms * args.scale:.0f} ms budget")
+        eager = sorted(name for name in forbidden if name in best)
+        if eager:
+            failures.append(f"{module} imports {', '.join(eager)} at startup")
+    if failures:
+        raise SystemExit("\n".join(failures))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Head-function evaluations per intersection: fixed 50-point grid vs adaptive scan.
+
+The fixed grid is the scan ``find_operating_point`` used before adaptive bracketing:
+50 samples, first sign change, then ``brentq``. Cases are the sample pumps at several
+VFD speeds in parallel against a polynomial system curve, plus a synthetic hooked
+curve with two crossings. Run from ``backend/`` with
+``python -m benchmarks.bench_intersections``.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy.optimize import brentq
+
+from app.services.combine import build_parallel
+from app.services.curves import PumpCurve, create_pump_curve, load_pump_csv
+from app.services.intersections import find_operating_points
+from app.services.system import PolynomialSystemCurve
+
+SAMPLES = Path(__file__).resolve().parents[2] / "samples"
+
+
+class Counted:
+    def __init__(self, head):
+        self.head = head
+        self.evaluations = 0
+
+    def __call__(self, flow):
+        self.evaluations += np.size(flow)
+        return self.head(flow)
+
+
+def fixed_grid(flow_domain, pump_head, system_head) -> list[float]:
+    q = np.linspace(min(flow_domain), max(flow_domain), 50)
+    signs = np.sign(pump_head(q) - system_head(q))
+    candidates = np.flatnonzero((signs[:-1] == 0) | (signs[:-1] * signs[1:] < 0))
+    if candidates.size == 0:
+        return []
+    i = int(candidates[0])
+    return [brentq(lambda x: float(pump_head(x) - system_head(x)), q[i], q[i + 1])]
+
+
+def cases():
+    system = PolynomialSystemCurve(static_head=15.0, resistance_coefficient=2500.0)
+    for name in ("pump_A.csv", "pump_B.csv"):
+        curve = create_pump_curve(*load_pump_csv((SAMPLES / name).read_bytes()))
+        for ratio in (0.6, 0.8, 1.0):
+            aggregate = build_parallel([curve], [ratio], [3])
+            yield f"{name[:-4]} x3 @ {ratio:.1f}", aggregate.flow_domain, aggregate.head, system
+    hooked = PumpCurve(
+        flow_si=np.array([0.0, 0.005, 0.01, 0.015, 0.02, 0.025, 0.03]),
+        head_si=np.array([40.0, 44.0, 45.5, 45.0, 42.0, 36.0, 27.0]),
+        efficiency=None,
+        power=None,
+        npshr=None,
+        flow_unit="gpm",
+        head_unit="ft",
+        efficiency_unit=None,
+        power_unit=None,
+        npshr_unit=None,
+    )
+    yield "hooked", (0.0, 0.03), hooked.head_at, PolynomialSystemCurve(static_head=42.5, resistance_coefficient=2000.0)
+
+
+def main() -> None:
+    print(f"{'case':<20}{'grid evals':>11}{'roots':>7}{'adaptive evals':>16}{'roots':>7}{'unstable':>10}{'ms':>8}")
+    totals = [0, 0]
+    for name, domain, pump_head, system_head in cases():
+        legacy = Counted(pump_head)
+        legacy_roots = fixed_grid(domain, legacy, system_head)
+        start = time.perf_counter()
+        scan = find_operating_points(domain, pump_head, system_head)
+        elapsed = (time.perf_counter() - start) * 1e3
+        unstable = sum(point.unstable for point in scan.intersections)
+        totals[0] += legacy.evaluations
+        totals[1] += scan.evaluations
+        print(
+            f"{name:<20}{legacy.evaluations:>11}{len(legacy_roots):>7}"
+            f"{scan.evaluations:>16}{len(scan.intersections):>7}{unstable:>10}{elapsed:>8.2f}"
+        )
+    print(f"{'total':<20}{totals[0]:>11}{'':>7}{totals[1]:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Parallel aggregation: nested-brentq reference vs the inverse-table engine.
+
+Builds a 6-pump station (pump_A/pump_B samples) at 10 VFD speeds and evaluates the
+aggregate head over a 50-point flow grid, the fixed grid ``solve_operating_points``
+sampled before its adaptive scan. Run from ``backend/`` with ``python -m benchmarks.bench_parallel``.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy.optimize import brentq
+
+from app.services.affinity import ScaledPumpCurve
+from app.services.combine import build_parallel
+from app.services.curves import create_pump_curve, load_pump_csv
+
+SAMPLES = Path(__file__).resolve().parents[2] / "samples"
+# The inverse-table engine has to beat the nested root-find by at least this factor.
+MIN_SPEEDUP = 50.0
+
+
+def reference_parallel_head(curves, ratios, counts):
+    """The original nested root-find, kept here as the accuracy and speed baseline."""
+    scaled = [ScaledPumpCurve(base, ratio) for base, ratio in zip(curves, ratios, strict=True)]
+    min_flow = sum(float(np.min(c.scaled_flow())) * n for c, n in zip(scaled, counts, strict=True))
+    max_flow = sum(float(np.max(c.scaled_flow())) * n for c, n in zip(scaled, counts, strict=True))
+
+    def total_flow_at_head(head: float) -> float:
+        total = 0.0
+        for curve, count in zip(scaled, counts, strict=True):
+            flow_values = curve.scaled_flow()
+            low_flow, high_flow = float(flow_values[0]), float(flow_values[-1])
+            if head >= curve.head_at(low_flow):
+                flow_at_head = low_flow
+            elif head <= curve.head_at(high_flow):
+                flow_at_head = high_flow
+            else:
+                flow_at_head = brentq(lambda q: float(curve.head_at(q) - head), low_flow, high_flow)
+            total += flow_at_head * count
+        return total
+
+    def head_function(flow: float) -> float:
+        low_head = min(float(np.min(c.scaled_head())) for c in scaled)
+        high_head = max(float(np.max(c.scaled_head())) for c in scaled)
+        if flow <= min_flow:
+            return high_head
+        if flow >= max_flow:
+            return low_head
+        return brentq(lambda h: total_flow_at_head(h) - flow, low_head, high_head)
+
+    return (min_flow, max_flow), head_function
+
+
+def main() -> None:
+    pump_a = create_pump_curve(*load_pump_csv((SAMPLES / "pump_A.csv").read_bytes()))
+    pump_b = create_pump_curve(*load_pump_csv((SAMPLES / "pump_B.csv").read_bytes()))
+    curves = [pump_a, pump_b, pump_a, pump_b, pump_a, pump_b]
+    counts = [1] * len(curves)
+    speeds = np.linspace(0.6, 1.05, 10)
+
+    start = time.perf_counter()
+    reference = []
+    for ratio in speeds:
+        domain, head = reference_parallel_head(curves, [ratio] * len(curves), counts)
+        flows = np.linspace(domain[0], domain[1], 50)
+        reference.append([head(float(q)) for q in flows])
+    reference_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = []
+    for ratio in speeds:
+        aggregate = build_parallel(curves, [ratio] * len(curves), counts)
+        flows = np.linspace(aggregate.flow_domain[0], aggregate.flow_domain[1], 50)
+        vectorized.append(aggregate.head(flows))
+    vectorized_s = time.perf_counter() - start
+
+    error = np.max(np.abs(np.asarray(reference) - np.asarray(vectorized)))
+    scale = np.max(np.abs(reference))
+    print(f"nested brentq : {reference_s * 1e3:9.2f} ms")
+    print(f"inverse table : {vectorized_s * 1e3:9.2f} ms")
+    print(f"speedup       : {reference_s / vectorized_s:9.1f}x")
+    print(f"max |dH|      : {error:.2e} m ({error / scale:.1e} relative)")
+    if reference_s / vectorized_s < MIN_SPEEDUP:
+        raise SystemExit(f"speedup below the required {MIN_SPEEDUP:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""Scenario-level throughput of the compute pipeline over a grid of synthetic scenarios.
+
+Scenarios are built from ``samples/pump_A.csv`` / ``pump_B.csv``: 1 to 12 pumps split
+between the two models, parallel or series, 1 to 200 VFD speed ratios, against the
+CSV demo system curve or a polynomial one. Three stages are timed per scenario:
+
+* ``aggregate`` - ``combine.build_parallel``/``build_series`` + ``find_operating_point``
+  per speed ratio, the path the curve and optimisation endpoints use;
+* ``batch``     - ``intersections.solve_operating_points`` over every entry and speed,
+  as the compute task does;
+* ``pipeline``  - ``compute_scenario`` end to end on SQLite with eager Celery (PDF
+  rendering runs on its own queue in production and is left out).
+
+Each row reports the median latency, the cost per attempted intersection and the
+tracemalloc peak of one extra run. ``--save FILE`` stores the medians as a baseline and
+``--compare FILE`` fails when a stage is slower than ``--tolerance`` times its baseline
+(and by more than ``--noise-ms``, so sub-millisecond jitter does not trip it).
+
+Run from ``backend/`` with ``python -m benchmarks.bench_scenarios`` (``--quick`` for a
+smaller grid). Everything runs offline in a temporary directory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+from unittest import mock
+
+import numpy as np
+
+from app.core.units import convert_array
+from app.services.combine import build_parallel, build_series
+from app.services.curves import PumpCurve, create_pump_curve, load_pump_csv, parse_pump_csv_lines
+from app.services.intersections import IntersectionError, PumpConfiguration, find_operating_point, solve_operating_points
+from app.services.system import PolynomialSystemCurve, TabulatedSystemCurve
+
+SAMPLES = Path(__file__).resolve().parents[2] / "samples"
+
+PUMP_COUNTS = (1, 2, 4, 8, 12)
+SPEED_COUNTS = (1, 10, 50, 200)
+QUICK_PUMP_COUNTS = (1, 12)
+QUICK_SPEED_COUNTS = (1, 200)
+ARRANGEMENTS = ("parallel", "series")
+SYSTEMS = ("csv", "polynomial")
+POLYNOMIAL = {"static_head": 15.0, "resistance_coefficient": 2500.0}
+
+
+@dataclass(frozen=True)
+class Case:
+    pumps: int
+    arrangement: str
+    speeds: int
+    system: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.pumps}x{self.arrangement}/{self.speeds} speeds/{self.system}"
+
+    def ratios(self) -> list[float]:
+        return [1.0] if self.speeds == 1 else np.linspace(0.6, 1.05, self.speeds).tolist()
+
+    def counts(self) -> list[int]:
+        """Pumps per model: the station alternates pump_A and pump_B."""
+        return [count for count in ((self.pumps + 1) // 2, self.pumps // 2) if count]
+
+
+def _system_head(case: Case, csv_system: TabulatedSystemCurve) -> Callable:
+    if case.system == "csv":
+        return csv_system.head_at
+    return PolynomialSystemCurve(**POLYNOMIAL).head_at
+
+
+def _aggregate_stage(case: Case, curves: list[PumpCurve], system_head: Callable) -> Callable[[], int]:
+    counts = case.counts()
+    build = build_series if case.arrangement == "series" else build_parallel
+
+    def run() -> int:
+        for ratio in case.ratios():
+            aggregate = build(curves[: len(counts)], [ratio] * len(counts), counts)
+            try:
+                find_operating_point(aggregate.flow_domain, aggregate.head, system_head)
+            except IntersectionError:
+                pass
+        return case.speeds
+
+    return run
+
+
+def _batch_stage(case: Case, curves: list[PumpCurve], system_head: Callable) -> Callable[[], int]:
+    configurations = [
+        PumpConfiguration(curve=curve, speed_ratio=ratio, count=count, arrangement=case.arrangement)
+        for curve, count in zip(curves, case.counts())
+        for ratio in case.ratios()
+    ]
+
+    def run() -> int:
+        solve_operating_points(configurations, system_head)
+        return len(configurations)
+
+    return run
+
+
+def _offline_environment() -> Path:
+    """Point the app at a throwaway SQLite database with eager Celery; call before importing ``app.db``."""
+    workdir = Path(tempfile.mkdtemp(prefix="hydraulic-bench-"))
+    os.environ["APP_SYNC_DATABASE_URL"] = f"sqlite:///{workdir / 'bench.db'}"
+    os.environ["APP_DATABASE_URL"] = f"sqlite+aiosqlite:///{workdir / 'bench.db'}"
+    os.environ["CELERY_ALWAYS_EAGER"] = "1"
+    # Result JSON files are written relative to the working directory.
+    os.chdir(workdir)
+    return workdir
+
+
+class _Pipeline:
+    def __init__(self) -> None:
+        from sqlmodel import SQLModel
+
+        from app.db import session_factory, sync_engine
+        from app.models import SystemCurve
+        from app.seed import seed
+        from app.tasks import compute
+
+        SQLModel.metadata.create_all(sync_engine)
+        seed()
+        with session_factory() as session:  # type: ignore[call-arg]
+            polynomial = SystemCurve(
+                curve_key=2,
+                version=1,
+                name="Bench polynomial",
+                unit_system="si",
+                static_head=POLYNOMIAL["static_head"],
+                static_head_unit="meter",
+                resistance_coefficient=POLYNOMIAL["resistance_coefficient"],
+                flow_unit="meter**3/second",
+                head_unit="meter",
+                extra_terms={"terms": []},
+            )
+            session.add(polynomial)
+            session.commit()
+            self.system_ids = {"csv": 1, "polynomial": polynomial.id}
+        self.session_factory = session_factory
+        self.compute = compute
+
+    def stage(self, case: Case) -> Callable[[], int]:
+        from app.models import Scenario
+
+        items = [
+            {"pump_id": pump_id, "count": count, "arrangement": case.arrangement, "vfd_speeds": case.ratios()}
+            for pump_id, count in zip((1, 2), case.counts())
+        ]
+        with self.session_factory() as session:  # type: ignore[call-arg]
+            scenario = Scenario(
+                name=case.key,
+                system_curve_id=self.system_ids[case.system],
+                pumps={"unit_system": "si", "items": items, "por": (0.7, 1.2), "aor": (0.5, 1.2)},
+                unit_system="si",
+                por_default_low=0.7,
+                por_default_high=1.2,
+                aor_default_low=0.5,
+                aor_default_high=1.2,
+            )
+            session.add(scenario)
+            session.commit()
+            scenario_id = scenario.id
+
+        def run() -> int:
+            with mock.patch.object(self.compute.render_result_report, "delay"):
+                self.compute.compute_scenario.apply(args=(scenario_id,)).get()
+            return len(items) * case.speeds
+
+        return run
+
+
+def _measure(run: Callable[[], int], repeat: int) -> tuple[float, float, float]:
+    """(median ms, us per intersection, tracemalloc peak KiB) of ``run``."""
+    intersections = run()  # warm-up: splines, inverse tables, curve cache
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    median = statistics.median(timings)
+    return median * 1e3, median * 1e6 / max(intersections, 1), peak / 1024.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="1 and 12 pumps at 1 and 200 speeds only")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--stages", default="aggregate,batch,pipeline", help="comma-separated stages to run")
+    parser.add_argument("--save", type=Path, help="write the median latencies to this JSON baseline")
+    parser.add_argument("--compare", type=Path, help="fail if a stage is slower than this baseline allows")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="allowed slowdown factor for --compare")
+    parser.add_argument("--noise-ms", type=float, default=1.0, help="ignore slowdowns smaller than this for --compare")
+    args = parser.parse_args()
+    stages = args.stages.split(",")
+    baseline_path = args.compare.resolve() if args.compare else None
+    save_path = args.save.resolve() if args.save else None
+
+    curves = [create_pump_curve(*load_pump_csv((SAMPLES / name).read_bytes())) for name in ("pump_A.csv", "pump_B.csv")]
+    system_table, units = parse_pump_csv_lines((SAMPLES / "system_demo.csv").read_text().splitlines())
+    csv_system = TabulatedSystemCurve(
+        flow_si=convert_array(system_table["flow"], units.get("flow", "gpm"), "meter**3/second"),
+        head_si=convert_array(system_table["head"], units.get("head", "ft"), "meter"),
+    )
+    pipeline = None
+    if "pipeline" in stages:
+        _offline_environment()
+        pipeline = _Pipeline()
+
+    pump_counts, speed_counts = (QUICK_PUMP_COUNTS, QUICK_SPEED_COUNTS) if args.quick else (PUMP_COUNTS, SPEED_COUNTS)
+    results: dict[str, float] = {}
+    print(f"{'scenario':<40}{'stage':<11}{'median ms':>11}{'us/int':>9}{'peak KiB':>10}")
+    for pumps, arrangement, speeds, system in itertools.product(pump_counts, ARRANGEMENTS, speed_counts, SYSTEMS):
+        case = Case(pumps, arrangement, speeds, system)
+        system_head = _system_head(case, csv_system)
+        runners = {
+            "aggregate": lambda: _aggregate_stage(case, curves, system_head),
+            "batch": lambda: _batch_stage(case, curves, system_head),
+            "pipeline": lambda: pipeline.stage(case),
+        }
+        for stage in stages:
+            median_ms, per_intersection_us, peak_kib = _measure(runners[stage](), args.repeat)
+            results[f"{case.key}/{stage}"] = median_ms
+            print(f"{case.key:<40}{stage:<11}{median_ms:>11.2f}{per_intersection_us:>9.1f}{peak_kib:>10.0f}")
+
+    if save_path:
+        save_path.write_text(json.dumps(results, indent=2, sort_keys=True))
+        print(f"baseline written to {save_path}")
+    if baseline_path:
+        baseline = json.loads(baseline_path.read_text())
+        regressions = [
+            f"{key}: {value:.2f} ms vs {baseline[key]:.2f} ms"
+            for key, value in results.items()
+            if key in baseline and value > baseline[key] * args.tolerance and value - baseline[key] > args.noise_ms
+        ]
+        if regressions:
+            raise SystemExit("slower than baseline x{}:\n  {}".format(args.tolerance, "\n  ".join(regressions)))
+        print(f"no stage slower than {args.tolerance}x its baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Per-call latency of ``head_at`` with and without the cached spline.
+
+Run from ``backend/`` with ``python -m benchmarks.bench_spline_cache``.
+"""
+
+from __future__ import annotations
+
+import timeit
+from pathlib import Path
+
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+
+from app.services.affinity import scale_curve
+from app.services.curves import create_pump_curve, load_pump_csv
+
+SAMPLES = Path(__file__).resolve().parents[2] / "samples"
+
+
+def _uncached_head_at(curve, flow):
+    # The pre-cache implementation: a new spline for every call.
+    return PchipInterpolator(curve.flow_si, curve.head_si, extrapolate=True)(flow)
+
+
+def _uncached_scaled_head_at(scaled, flow):
+    return PchipInterpolator(scaled.scaled_flow(), scaled.scaled_head(), extrapolate=True)(flow)
+
+
+def _per_call_us(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    df, units = load_pump_csv((SAMPLES / "pump_A.csv").read_bytes())
+    curve = create_pump_curve(df, units)
+    scaled = scale_curve(curve, 0.85)
+    scalar = float(curve.flow_si.mean())
+    array = np.linspace(curve.flow_si.min(), curve.flow_si.max(), 10_000)
+
+    cases = [
+        ("PumpCurve scalar", lambda: _uncached_head_at(curve, scalar), lambda: curve.head_at(scalar), 20_000),
+        ("PumpCurve 10k array", lambda: _uncached_head_at(curve, array), lambda: curve.head_at(array), 500),
+        ("ScaledPumpCurve scalar", lambda: _uncached_scaled_head_at(scaled, scalar), lambda: scaled.head_at(scalar), 20_000),
+        ("ScaledPumpCurve 10k array", lambda: _uncached_scaled_head_at(scaled, array), lambda: scaled.head_at(array), 500),
+    ]
+    print(f"{'case':<28}{'before (us)':>14}{'after (us)':>14}{'speedup':>10}")
+    for name, before, after, number in cases:
+        before_us = _per_call_us(before, number)
+        after_us = _per_call_us(after, number)
+        print(f"{name:<28}{before_us:>14.2f}{after_us:>14.2f}{before_us / after_us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""``convert_array`` through the cached conversion factors versus a full pint round trip.
+
+Run from ``backend/`` with ``python -m benchmarks.bench_units``.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+import numpy as np
+
+from app.core.units import convert, convert_array, ensure_quantity
+
+PAIRS = [("gpm", "meter**3/second"), ("ft", "meter"), ("hp", "watt")]
+
+
+def _pint_convert(values, from_unit, to_unit):
+    # The pre-cache implementation: list(values) into a Quantity, then Quantity.to.
+    return np.asarray(convert(ensure_quantity(values, from_unit), to_unit).magnitude, dtype=float)
+
+
+def _per_call_us(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    print(f"{'conversion':<26}{'size':>8}{'pint (us)':>12}{'cached (us)':>13}{'speedup':>9}")
+    for size in (5, 1_000, 100_000):
+        values = np.random.default_rng(0).uniform(0.0, 2000.0, size)
+        for from_unit, to_unit in PAIRS:
+            np.testing.assert_allclose(convert_array(values, from_unit, to_unit), _pint_convert(values, from_unit, to_unit))
+            number = 20 if size > 10_000 else 200
+            slow = _per_call_us(lambda: _pint_convert(values, from_unit, to_unit), number)
+            fast = _per_call_us(lambda: convert_array(values, from_unit, to_unit), number)
+            print(f"{from_unit + ' -> ' + to_unit:<26}{size:>8}{slow:>12.1f}{fast:>13.1f}{slow / fast:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
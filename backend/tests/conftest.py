@@ -0,0 +1,10 @@
+import os
+import tempfile
+from pathlib import Path
+
+# Router tests run the app against a throwaway SQLite database with eager Celery; the
+# settings are read when app.db is first imported, so they are set before collection.
+_DATABASE = Path(tempfile.mkdtemp(prefix="hydraulic-tests-")) / "test.db"
+os.environ.setdefault("APP_SYNC_DATABASE_URL", f"sqlite:///{_DATABASE}")
+os.environ.setdefault("APP_DATABASE_URL", f"sqlite+aiosqlite:///{_DATABASE}")
+os.environ.setdefault("CELERY_ALWAYS_EAGER", "1")
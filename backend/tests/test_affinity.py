@@ -1,4 +1,5 @@
 import numpy as np
+from scipy.interpolate import PchipInterpolator
 
 from app.services.affinity import scale_curve
 from app.services.curves import PumpCurve
@@ -26,3 +27,33 @@ def test_affinity_scaling_flow():
     np.testing.assert_allclose(scaled.scaled_head(), curve.head_si * 0.64)
     np.testing.assert_allclose(scaled.scaled_power(), curve.power * 0.512)
 
+
+def test_curve_reuses_splines_until_arrays_change():
+    curve = build_curve()
+    first = curve.spline("head_si")
+    assert curve.spline("head_si") is first
+    curve.head_si = np.array([45.0, 32.0, 12.0])
+    assert curve.spline("head_si") is not first
+    assert float(curve.head_at(0.0)) == 45.0
+
+
+def test_scaled_curve_matches_respline():
+    curve = build_curve()
+    scaled = scale_curve(curve, 0.8)
+    flows = np.linspace(0.0, 0.016, 9)
+    expected_head = PchipInterpolator(scaled.scaled_flow(), scaled.scaled_head())(flows)
+    expected_power = PchipInterpolator(scaled.scaled_flow(), scaled.scaled_power())(flows)
+    expected_eff = PchipInterpolator(scaled.scaled_flow(), curve.efficiency)(flows)
+    np.testing.assert_allclose(scaled.head_at(flows), expected_head)
+    np.testing.assert_allclose(scaled.power_at(flows), expected_power)
+    np.testing.assert_allclose(scaled.efficiency_at(flows), expected_eff)
+
+
+def test_scaled_view_inverts_without_copying_arrays():
+    curve = build_curve()
+    scaled = scale_curve(curve, 0.9)
+    assert not hasattr(scaled, "__dict__")
+    assert scaled.flow_range == (0.0, 0.02 * 0.9)
+    assert scaled.head_range == (10.0 * 0.81, 40.0 * 0.81)
+    flows = np.linspace(0.001, 0.017, 5)
+    np.testing.assert_allclose(scaled.flow_at_head(scaled.head_at(flows)), flows, rtol=1e-4)
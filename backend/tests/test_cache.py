@@ -0,0 +1,61 @@
+import time
+
+import numpy as np
+import pytest
+
+from app.services.cache import LRUCache, ResultCache, input_fingerprint
+from app.services.curves import PumpCurve, prepare_pump_curve
+
+
+def test_fingerprint_ignores_key_order():
+    assert input_fingerprint({"a": 1, "b": [1.0, 2.0]}) == input_fingerprint({"b": [1.0, 2.0], "a": 1})
+    assert input_fingerprint({"a": 1}) != input_fingerprint({"a": 2})
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_expires_entries():
+    cache = LRUCache(maxsize=4, ttl=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_result_cache_works_without_redis():
+    cache = ResultCache(redis_url=None, maxsize=8)
+    cache.set("abc", 42)
+    assert cache.get("abc") == 42
+    cache.discard("abc")
+    assert cache.get("abc") is None
+
+
+def test_prepared_curve_is_frozen_and_warm():
+    curve = PumpCurve(
+        flow_si=np.array([0.0, 0.05, 0.1]),
+        head_si=np.array([40.0, 35.0, 25.0]),
+        efficiency=np.array([0.0, 0.75, 0.6]),
+        power=None,
+        npshr=None,
+        flow_unit="m**3/s",
+        head_unit="m",
+        efficiency_unit=None,
+        power_unit=None,
+        npshr_unit=None,
+    )
+    prepared = prepare_pump_curve("P1", curve)
+    assert set(curve._splines) == {"head_si", "efficiency"}
+    assert curve._inverse is not None
+    assert prepared.best_efficiency_point == (0.05, 35.0)
+    assert prepared.flow_domain == (0.0, 0.1)
+    with pytest.raises(ValueError):
+        curve.head_si[0] = 1.0
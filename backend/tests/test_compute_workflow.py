@@ -0,0 +1,99 @@
+import pytest
+from sqlmodel import SQLModel, select
+
+from app.db import session_factory, sync_engine
+from app.models import Pump, Result, Scenario, SystemCurve
+from app.services import storage
+from app.tasks import compute
+
+CURVES = {
+    "P1": {"flow_si": [0.0, 0.01, 0.02, 0.03], "head_si": [50.0, 46.0, 38.0, 25.0]},
+    "P2": {"flow_si": [0.0, 0.02, 0.04, 0.06], "head_si": [30.0, 28.0, 22.0, 12.0]},
+}
+
+
+@pytest.fixture()
+def database(monkeypatch, tmp_path):
+    SQLModel.metadata.drop_all(sync_engine)
+    SQLModel.metadata.create_all(sync_engine)
+    compute.curve_cache.clear()
+    monkeypatch.setattr(storage, "EXPORT_ROOT", tmp_path)
+    monkeypatch.setattr(compute, "EXPORT_ROOT", tmp_path)
+    monkeypatch.setattr(compute, "render_report", lambda data, output_pdf: output_pdf.write_bytes(b"%PDF"))
+
+
+def store_scenario(entries):
+    with session_factory() as session:
+        pumps = {}
+        for pump_key, (name, points) in enumerate(CURVES.items(), start=1):
+            pumps[name] = Pump(
+                pump_key=pump_key,
+                name=name,
+                rated_speed_rpm=1750,
+                unit_system="si",
+                flow_unit="m**3/s",
+                head_unit="m",
+                curve_points=points,
+            )
+            session.add(pumps[name])
+        curve = SystemCurve(
+            curve_key=1,
+            name="Main",
+            unit_system="si",
+            static_head=10.0,
+            static_head_unit="m",
+            resistance_coefficient=2e4,
+            flow_unit="m**3/s",
+            head_unit="m",
+            extra_terms={"terms": []},
+        )
+        session.add(curve)
+        session.flush()
+        scenario = Scenario(
+            name="Station",
+            system_curve_id=curve.id,
+            pumps={"items": [{**entry, "pump_id": pumps[entry["pump_id"]].id} for entry in entries]},
+            unit_system="si",
+            por_default_low=0.7,
+            por_default_high=1.2,
+            aor_default_low=0.5,
+            aor_default_high=1.3,
+        )
+        session.add(scenario)
+        session.commit()
+        return scenario.id
+
+
+ENTRIES = [
+    {"pump_id": "P1", "count": 1, "arrangement": "parallel", "vfd_speeds": [1.0, 0.9]},
+    {"pump_id": "P2", "count": 2, "arrangement": "series", "vfd_speeds": [1.0]},
+    {"pump_id": "P1", "count": 2, "arrangement": "parallel", "vfd_speeds": [0.95]},
+]
+
+
+def test_workflow_groups_entries_by_pump_version(database):
+    scenario_id = store_scenario(ENTRIES)
+    with session_factory() as session:
+        scenario = session.get(Scenario, scenario_id)
+        pumps = compute.load_entry_pumps(session, scenario.pumps["items"])
+    workflow = compute.build_compute_workflow(scenario, pumps)
+    assert [task.args[2] for task in workflow.tasks] == [
+        [(0, scenario.pumps["items"][0]), (2, scenario.pumps["items"][2])],
+        [(1, scenario.pumps["items"][1])],
+    ]
+
+
+def test_compute_scenario_keeps_entries_in_scenario_order(database):
+    scenario_id = store_scenario(ENTRIES)
+    result_id = compute.compute_scenario.apply(args=(scenario_id,)).get()
+
+    with session_factory() as session:
+        result = session.exec(select(Result).where(Result.scenario_id == scenario_id)).one()
+    assert result_id == result.id
+    assert [(point["configuration"], point["speed_ratio"]) for point in result.operating_points] == [
+        ("P1 x1 parallel", 1.0),
+        ("P1 x1 parallel", 0.9),
+        ("P2 x2 series", 1.0),
+        ("P1 x2 parallel", 0.95),
+    ]
+    assert result.report_status == "ready"
@@ -1,6 +1,15 @@
+import io
+
+import numpy as np
 import pandas as pd
 
-from app.services.curves import create_pump_curve, load_pump_csv
+from app.services.curves import (
+    convert_pump_tables,
+    create_pump_curve,
+    load_pump_csv,
+    parse_pump_csv_lines,
+    read_numeric_csv,
+)
 
 
 PUMP_CSV = b"""# units: flow gpm, head ft, efficiency %, power hp\nflow,head,efficiency,power\n0,150,55,100\n500,140,70,120\n1000,120,75,160\n"""
@@ -14,3 +23,32 @@ def test_load_pump_csv():
     assert curve.flow_si.shape[0] == 3
     assert curve.head_si[0] > curve.head_si[-1]
 
+
+def test_parse_pump_csv_lines_matches_pandas_loader():
+    df, units = load_pump_csv(PUMP_CSV)
+    columns, stream_units = parse_pump_csv_lines(io.StringIO(PUMP_CSV.decode()))
+    assert stream_units == units == {"flow": "gpm", "head": "ft", "efficiency": "%", "power": "hp"}
+    for name in df.columns:
+        np.testing.assert_array_equal(columns[name], df[name].to_numpy(dtype=float))
+
+
+def test_read_numeric_csv_keeps_numeric_rows_in_file_order():
+    lines = ["demand,level", "30,1", "oops,2", "10,3,4", "", "# units: demand L/s, level m", "20,nan"]
+    header, table, units = read_numeric_csv(lines)
+    assert header == ["demand", "level"]
+    np.testing.assert_array_equal(table, [[30.0, 1.0], [20.0, np.nan]])
+    assert units == {"demand": "L/s", "level": "m"}
+
+
+def test_convert_pump_tables_matches_single_curve():
+    df, units = load_pump_csv(PUMP_CSV)
+    columns, _ = parse_pump_csv_lines(io.StringIO(PUMP_CSV.decode()))
+    metric = {"flow": columns["flow"] * 0.06, "head": columns["head"] * 0.3}
+    converted = convert_pump_tables([columns, metric, columns], [units, {"flow": "m**3/hour", "head": "m"}, units])
+    curve = create_pump_curve(df, units)
+    for result in (converted[0], converted[2]):
+        np.testing.assert_allclose(result["flow_si"], curve.flow_si)
+        np.testing.assert_allclose(result["efficiency"], curve.efficiency)
+        np.testing.assert_allclose(result["power"], curve.power)
+    np.testing.assert_allclose(converted[1]["flow_si"], metric["flow"] / 3600.0)
+    assert converted[1]["efficiency"] is None
@@ -0,0 +1,27 @@
+import numpy as np
+
+from app.services.downsample import lttb_indices, sample_downsampled
+
+
+def test_lttb_keeps_endpoints_and_spike():
+    x = np.linspace(0.0, 1.0, 1000)
+    y = np.zeros_like(x)
+    y[437] = 5.0
+    keep = lttb_indices(x, y, 20)
+    assert keep.size == 20
+    assert keep[0] == 0 and keep[-1] == 999
+    assert 437 in keep
+    assert np.all(np.diff(keep) > 0)
+
+
+def test_lttb_returns_everything_below_threshold():
+    x = np.arange(5.0)
+    assert lttb_indices(x, x, 10).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_sample_downsampled_tracks_curve():
+    sampled = sample_downsampled((0.0, 2.0), lambda q: 10.0 - q**2, 40, extra={"power": lambda q: q * 3.0})
+    assert sampled["flow"].size == 40
+    assert sampled["flow"][0] == 0.0 and sampled["flow"][-1] == 2.0
+    np.testing.assert_allclose(sampled["head"], 10.0 - sampled["flow"] ** 2)
+    np.testing.assert_allclose(sampled["power"], sampled["flow"] * 3.0)
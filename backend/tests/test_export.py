@@ -0,0 +1,40 @@
+import csv
+import io
+
+import orjson
+import pytest
+
+from app.services import export
+from app.services.export import export_rows
+
+ROWS = [
+    {"configuration": "pump_A x2 parallel", "speed_ratio": 0.8 + i * 1e-4, "flow": 0.01 * i, "head": 40.0 - i * 1e-3, "efficiency": None, "power": 1e4, "unstable": False}
+    for i in range(5)
+]
+
+
+def test_csv_streams_in_chunks(monkeypatch):
+    monkeypatch.setattr(export, "CHUNK_ROWS", 2)
+    chunks = list(export_rows(iter(ROWS), "csv"))
+    assert len(chunks) == 3
+    parsed = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+    assert [float(row["flow"]) for row in parsed] == [row["flow"] for row in ROWS]
+    assert parsed[0]["efficiency"] == ""
+
+
+def test_csv_without_rows_has_header():
+    assert b"".join(export_rows([], "csv")).decode().strip() == ",".join(export.EXPORT_COLUMNS)
+
+
+def test_ndjson_round_trips():
+    lines = b"".join(export_rows(ROWS, "ndjson")).splitlines()
+    assert [orjson.loads(line) for line in lines] == ROWS
+
+
+def test_parquet_round_trips(monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr(export, "CHUNK_ROWS", 2)
+    table = pq.read_table(io.BytesIO(b"".join(export_rows(ROWS, "parquet"))))
+    assert table.num_rows == 5
+    assert table.column("head").to_pylist() == [row["head"] for row in ROWS]
+    assert table.column("unstable").to_pylist() == [False] * 5
@@ -0,0 +1,15 @@
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parents[1]
+
+
+def test_service_imports_defer_heavy_modules():
+    code = (
+        "import sys\n"
+        "import app.core.units, app.services.curves, app.services.report, app.services.optimize\n"
+        "print(','.join(m for m in ('pint', 'pandas', 'scipy', 'jinja2', 'weasyprint') if m in sys.modules))\n"
+    )
+    loaded = subprocess.run([sys.executable, "-c", code], cwd=BACKEND, capture_output=True, text=True, check=True)
+    assert loaded.stdout.strip() == ""
@@ -1,4 +1,18 @@
-from app.services.intersections import IntersectionError, find_operating_point
+import numpy as np
+import pytest
+
+from app.services.combine import build_parallel, build_series
+from app.services.curves import PumpCurve
+from app.services.intersections import (
+    INITIAL_SAMPLES,
+    IntersectionError,
+    PumpConfiguration,
+    find_operating_point,
+    find_operating_points,
+    illinois,
+    solve_operating_points,
+)
+from app.services.system import PolynomialSystemCurve
 
 
 def test_intersection_basic():
@@ -27,3 +41,162 @@ def test_no_intersection():
     else:
         raise AssertionError("Expected IntersectionError")
 
+
+def test_polynomial_system_curve_is_array_native():
+    curve = PolynomialSystemCurve(
+        static_head=10.0,
+        resistance_coefficient=2.0,
+        coefficients=np.array([1.0]),
+        exponents=np.array([1.85]),
+    )
+    flows = np.array([0.0, 0.5, 2.0])
+    expected = [10.0 + 2.0 * q ** 2 + q ** 1.85 for q in flows]
+    np.testing.assert_allclose(curve(flows), expected)
+    assert float(curve(2.0)) == expected[-1]
+
+
+def test_grid_is_evaluated_in_one_call():
+    calls = []
+
+    def pump_head(flow):
+        calls.append(flow)
+        return 50 - 10 * flow
+
+    def system_head(flow):
+        return 10 + 5 * flow
+
+    find_operating_point([0.0, 4.0], pump_head, system_head)
+    assert getattr(calls[0], "shape", None) == (INITIAL_SAMPLES,)
+
+
+def test_batch_solver_matches_single_solves():
+    curve = PumpCurve(
+        flow_si=np.array([0.0, 0.01, 0.02, 0.03]),
+        head_si=np.array([50.0, 46.0, 38.0, 25.0]),
+        efficiency=None,
+        power=None,
+        npshr=None,
+        flow_unit="gpm",
+        head_unit="ft",
+        efficiency_unit=None,
+        power_unit=None,
+        npshr_unit=None,
+    )
+    system = PolynomialSystemCurve(static_head=20.0, resistance_coefficient=4e4)
+    configurations = [
+        PumpConfiguration(curve, 1.0, 1, "parallel"),
+        PumpConfiguration(curve, 0.8, 2, "parallel"),
+        PumpConfiguration(curve, 0.9, 2, "series"),
+        PumpConfiguration(curve, 0.3, 1, "parallel"),
+    ]
+    solution = solve_operating_points(configurations, system)
+    assert solution.found.tolist() == [True, True, True, False]
+    for i, cfg in enumerate(configurations[:3]):
+        build = build_series if cfg.arrangement == "series" else build_parallel
+        aggregate = build([curve], [cfg.speed_ratio], [cfg.count])
+        q, h = find_operating_point(aggregate.flow_domain, aggregate.head, system)
+        assert solution.flow[i] == pytest.approx(q, rel=1e-4)
+        assert solution.head[i] == pytest.approx(h, rel=1e-4)
+    assert solution.pump_flow[1] == pytest.approx(solution.flow[1] / 2)
+
+
+def build_hooked_curve():
+    return PumpCurve(
+        flow_si=np.array([0.0, 0.005, 0.01, 0.015, 0.02, 0.025, 0.03]),
+        head_si=np.array([40.0, 44.0, 45.5, 45.0, 42.0, 36.0, 27.0]),
+        efficiency=None,
+        power=None,
+        npshr=None,
+        flow_unit="gpm",
+        head_unit="ft",
+        efficiency_unit=None,
+        power_unit=None,
+        npshr_unit=None,
+    )
+
+
+def test_adaptive_scan_reports_every_crossing():
+    curve = build_hooked_curve()
+    system = PolynomialSystemCurve(static_head=45.2, resistance_coefficient=0.0)
+    scan = find_operating_points((0.0, 0.03), curve.head_at, system)
+    assert len(scan.intersections) == 2
+    low, high = scan.intersections
+    assert low.unstable and not high.unstable
+    for point in scan.intersections:
+        assert float(curve.head_at(point.flow)) == pytest.approx(45.2, abs=1e-8)
+    assert find_operating_point((0.0, 0.03), curve.head_at, system)[0] == pytest.approx(high.flow)
+
+
+def test_adaptive_scan_stays_cheap_on_monotone_curves():
+    scan = find_operating_points([0.0, 4.0], lambda q: 50 - 10 * q, lambda q: 10 + 5 * q)
+    assert len(scan.intersections) == 1
+    assert scan.evaluations < 50
+
+
+def test_batch_solver_prefers_stable_crossing():
+    curve = build_hooked_curve()
+    system = PolynomialSystemCurve(static_head=42.5, resistance_coefficient=2000.0)
+    solution = solve_operating_points([PumpConfiguration(curve)], system)
+    q, _ = find_operating_point((0.0, 0.03), curve.head_at, system)
+    assert solution.flow[0] == pytest.approx(q, rel=1e-6)
+    assert q > 0.01
+
+
+def test_batch_solver_reports_every_crossing_per_configuration():
+    curve = build_hooked_curve()
+    system = PolynomialSystemCurve(static_head=45.2, resistance_coefficient=0.0)
+    configurations = [PumpConfiguration(curve, speed_ratio=ratio) for ratio in (1.0, 0.9, 1.1)]
+    solution = solve_operating_points(configurations, system)
+    assert not solution.found[1]
+    assert solution.intersections[1] == []
+    for i in (0, 2):
+        ratio = configurations[i].speed_ratio
+        scan = find_operating_points((0.0, 0.03 * ratio), lambda q: ratio ** 2 * curve.head_at(q / ratio), system)
+        assert [point.flow for point in solution.intersections[i]] == pytest.approx(
+            [point.flow for point in scan.intersections], rel=1e-9
+        )
+        assert [point.unstable for point in solution.intersections[i]] == [point.unstable for point in scan.intersections]
+        assert not solution.unstable[i]
+        assert solution.evaluations[i] == scan.evaluations
+    assert len(solution.intersections[0]) == 2
+    assert solution.calls < sum(solution.evaluations)
+
+
+def test_illinois_bisects_when_the_secant_step_is_undefined():
+    def residual(rows, x):
+        x = np.asarray(x, dtype=float)
+        with np.errstate(invalid="ignore"):
+            return np.where(x > 0.9, np.inf, x - 0.4) * (rows + 1)
+
+    rows = np.arange(2)
+    with np.errstate(all="raise"):
+        root = illinois(residual, rows, np.zeros(2), np.ones(2), 1e-12)
+    assert root == pytest.approx([0.4, 0.4], abs=1e-9)
+
+
+def test_polynomial_flow_at_head():
+    quadratic = PolynomialSystemCurve(static_head=10.0, resistance_coefficient=4e4)
+    assert quadratic.flow_at_head(5.0) == 0.0
+    assert quadratic.flow_at_head(50.0) == pytest.approx(np.sqrt(40.0 / 4e4))
+    assert quadratic.flow_at_head(50.0) < 10.0 / 100
+    extra = PolynomialSystemCurve(10.0, 2e4, coefficients=np.array([500.0]), exponents=np.array([1.85]))
+    assert float(extra(extra.flow_at_head(50.0))) == pytest.approx(50.0)
+    assert PolynomialSystemCurve(10.0, 0.0).flow_at_head(50.0) == float("inf")
+    wavy = PolynomialSystemCurve(0.0, -30.0, coefficients=np.array([12.0, 20.0]), exponents=np.array([1.0, 3.0]))
+    assert wavy.flow_at_head(1.0) == pytest.approx(0.5 - np.sqrt(0.15), rel=1e-9)
+
+
+def test_batch_solver_searches_only_the_system_domain():
+    curve = build_hooked_curve()
+    system = PolynomialSystemCurve(static_head=42.5, resistance_coefficient=2000.0)
+    configurations = [PumpConfiguration(curve)]
+    full = solve_operating_points(configurations, system)
+    low = solve_operating_points(configurations, system, system_domain=(0.0, 0.015))
+    past = solve_operating_points(configurations, system, system_domain=(0.019, 0.05))
+    tight = solve_operating_points(configurations, system, system_domain=(0.015, 0.019))
+    beyond = solve_operating_points(configurations, system, system_domain=(0.05, 0.1))
+    assert full.flow[0] == pytest.approx(0.0185, abs=5e-4)
+    assert low.found[0] and low.flow[0] < 0.005
+    assert not past.found[0]
+    assert tight.flow[0] == pytest.approx(full.flow[0], rel=1e-9)
+    assert not beyond.found[0] and beyond.evaluations[0] == 0
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from app.services.curves import PumpCurve
+from app.services.lifecycle import Tariff, lifecycle_costs, present_value_factor
+from app.services.optimize import SPEED_RATIO_BOUNDS, required_speed, required_speeds, select_speed
+from app.services.system import PolynomialSystemCurve
+
+
+def build_curve(scale=1.0):
+    return PumpCurve(
+        flow_si=np.array([0.0, 0.01, 0.02, 0.03]) * scale,
+        head_si=np.array([50.0, 46.0, 38.0, 25.0]),
+        efficiency=np.array([0.3, 0.65, 0.78, 0.7]),
+        power=np.array([4000.0, 7000.0, 9500.0, 10500.0]) * scale,
+        npshr=None,
+        flow_unit="gpm",
+        head_unit="ft",
+        efficiency_unit="%",
+        power_unit="hp",
+        npshr_unit=None,
+    )
+
+
+def test_present_value_factor():
+    assert present_value_factor(3, 0.0) == pytest.approx(3.0)
+    assert present_value_factor(2, 0.1) == pytest.approx(1 / 1.1 + 1 / 1.21)
+    assert present_value_factor(2, 0.1, escalation=0.1) == pytest.approx(2 / 1.1)
+
+
+def test_required_speeds_matches_single_curve_solves():
+    curves = [build_curve(), build_curve(1.3), build_curve(0.8)]
+    flow = np.array([0.01, 0.015, 0.02, 0.01])
+    head = np.array([30.0, 35.0, 40.0, 20.0])
+    index = np.array([0, 1, 2, 1])
+    batched = required_speeds(curves, index, flow, head)
+    for i, curve_index in enumerate(index):
+        single = required_speed(curves[curve_index], flow[i : i + 1], head[i : i + 1])
+        np.testing.assert_allclose(batched[i], single[0], rtol=1e-6, equal_nan=True)
+
+
+def test_lifecycle_costs_match_per_candidate_selection():
+    curves = [build_curve(), build_curve(1.3)]
+    system = PolynomialSystemCurve(static_head=15.0, resistance_coefficient=8000.0)
+    flow = np.array([0.0, 0.012, 0.03, 0.09])
+    hours = np.array([1000.0, 4000.0, 3000.0, 500.0])
+    tariff = Tariff(energy_price=0.1, demand_charge=50.0)
+    costs = lifecycle_costs(
+        curves, system, flow, hours, tariff, years=10, discount_rate=0.05, capital_costs=np.array([1000.0, 2000.0]), max_running=2
+    )
+    for i, curve in enumerate(curves):
+        selection = select_speed(curve, flow[1:], np.asarray(system(flow[1:])), 2, "parallel", SPEED_RATIO_BOUNDS)
+        served = np.isfinite(selection.power)
+        energy = np.sum(selection.power[served] * hours[1:][served]) / 1000.0
+        assert costs.annual_energy_kwh[i] == pytest.approx(energy)
+        assert costs.peak_power_kw[i] == pytest.approx(np.max(selection.power[served]) / 1000.0)
+        assert costs.unmet_hours[i] == pytest.approx(np.sum(hours[1:][~served]))
+    np.testing.assert_allclose(
+        costs.npv, [1000.0, 2000.0] + costs.annual_cost * present_value_factor(10, 0.05)
+    )
+    assert costs.unmet_hours[0] == pytest.approx(500.0)
+    np.testing.assert_array_equal(costs.feasible, costs.unmet_hours == 0)
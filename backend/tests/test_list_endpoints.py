@@ -0,0 +1,54 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel
+
+from app.db import session_factory, sync_engine
+from app.main import app
+from app.models import SystemCurve
+
+
+@pytest.fixture()
+def client():
+    SQLModel.metadata.drop_all(sync_engine)
+    SQLModel.metadata.create_all(sync_engine)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def store_system_curves(rows):
+    with session_factory() as session:
+        for curve_key, version, name in rows:
+            session.add(
+                SystemCurve(
+                    curve_key=curve_key,
+                    version=version,
+                    name=name,
+                    unit_system="si",
+                    static_head=10.0,
+                    static_head_unit="m",
+                    resistance_coefficient=0.5,
+                    flow_unit="m**3/s",
+                    head_unit="m",
+                    extra_terms={"terms": []},
+                )
+            )
+        session.commit()
+
+
+def test_system_curve_pages_follow_the_next_cursor(client):
+    store_system_curves([(1, 1, "A"), (2, 1, "B"), (1, 2, "A"), (3, 1, "C"), (4, 1, "D")])
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor is not None else {})}
+        response = client.get("/api/system-curves", params=params)
+        assert response.status_code == 200
+        seen.append([curve["id"] for curve in response.json()])
+        cursor = response.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+    assert seen == [[1, 2], [3, 4], [5]]
+
+    latest = client.get("/api/system-curves", params={"latest_only": True, "name": "a", "fields": "summary"}).json()
+    assert [(curve["name"], curve["version"]) for curve in latest] == [("A", 2)]
+    assert "static_head" not in latest[0]
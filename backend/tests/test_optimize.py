@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from app.services.curves import PumpCurve
+from app.services.optimize import optimize_speed, pump_power, required_speed
+from app.services.system import PolynomialSystemCurve
+
+
+def build_curve():
+    return PumpCurve(
+        flow_si=np.array([0.0, 0.01, 0.02, 0.03]),
+        head_si=np.array([50.0, 46.0, 38.0, 25.0]),
+        efficiency=np.array([0.3, 0.65, 0.78, 0.7]),
+        power=np.array([4000.0, 7000.0, 9500.0, 10500.0]),
+        npshr=None,
+        flow_unit="gpm",
+        head_unit="ft",
+        efficiency_unit="%",
+        power_unit="hp",
+        npshr_unit=None,
+    )
+
+
+def test_required_speed_lands_on_duty():
+    curve = build_curve()
+    flows = np.array([0.005, 0.015, 0.02])
+    heads = np.array([30.0, 25.0, 35.0])
+    ratio = required_speed(curve, flows, heads)
+    np.testing.assert_allclose(ratio ** 2 * curve.head_at(flows / ratio), heads, rtol=1e-8)
+    assert np.isnan(required_speed(curve, 0.01, 200.0))
+
+
+def test_optimize_speed_matches_brute_force():
+    curve = build_curve()
+    system = PolynomialSystemCurve(static_head=15.0, resistance_coefficient=8000.0)
+    target = np.array([0.012, 0.03, 0.045])
+    selection = optimize_speed(curve, system, target, max_running=3)
+    assert selection.feasible.all()
+
+    for j, flow in enumerate(target):
+        head = float(system(flow))
+        best = np.inf
+        for running in range(1, 4):
+            ratios = np.linspace(0.3, 1.2, 20001)
+            pump_flow = flow / running
+            residual = np.abs(ratios ** 2 * curve.head_at(pump_flow / ratios) - head)
+            ratio = ratios[np.argmin(residual)]
+            if residual.min() > 0.05 or pump_flow / ratio > curve.flow_si[-1]:
+                continue
+            best = min(best, float(pump_power(curve, pump_flow, ratio)) * running)
+        assert selection.power[j] == pytest.approx(best, rel=1e-3)
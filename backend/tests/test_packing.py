@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from app.services.packing import decode_points, encode_points, pack_arrays, points_digest, unpack_arrays
+
+POINTS = {
+    "flow_si": [0.0, 0.025, 0.05, 0.075],
+    "head_si": [47.2, 45.1, 40.8, 35.9],
+    "efficiency": [0.55, 0.68, 0.75, 0.73],
+    "power": None,
+    "npshr": None,
+}
+
+
+def test_pack_round_trip_is_zero_copy():
+    blob = pack_arrays(POINTS)
+    columns = unpack_arrays(blob)
+    assert list(columns) == ["flow_si", "head_si", "efficiency"]
+    np.testing.assert_array_equal(columns["head_si"], POINTS["head_si"])
+    assert np.shares_memory(columns["flow_si"], np.frombuffer(blob, dtype=np.uint8))
+    assert len(blob) < len(str(POINTS))
+
+
+def test_dual_read_matches_across_formats():
+    json_points, json_blob = encode_points(POINTS, "json")
+    packed_points, blob = encode_points(POINTS, "binary")
+    assert json_blob is None and packed_points is None
+    from_json = decode_points(json_points, None)
+    from_blob = decode_points(None, blob)
+    for name in ("flow_si", "head_si", "efficiency"):
+        np.testing.assert_array_equal(from_json[name], from_blob[name])
+    assert from_blob.get("power") is None and from_json["power"] is None
+    assert points_digest(from_json) == points_digest(from_blob)
+
+
+def test_pack_rejects_ragged_columns():
+    with pytest.raises(ValueError):
+        pack_arrays({"flow_si": [0.0, 1.0], "head_si": [1.0]})
+    with pytest.raises(ValueError):
+        unpack_arrays(b"JSON" + bytes(16))
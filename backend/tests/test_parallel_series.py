@@ -1,5 +1,6 @@
 import numpy as np
 import pytest
+from scipy.optimize import brentq
 
 from app.services.affinity import scale_curve
 from app.services.combine import build_parallel, build_series
@@ -37,3 +38,62 @@ def test_series_combination_increases_head():
     head = aggregate.head(0.01)
     assert head > float(curve.head_si[1])
 
+
+def test_parallel_matches_per_pump_inversion():
+    base = sample_curve()
+    steep = PumpCurve(
+        flow_si=np.array([0.0, 0.008, 0.016]),
+        head_si=np.array([45.0, 38.0, 22.0]),
+        efficiency=None,
+        power=None,
+        npshr=None,
+        flow_unit="gpm",
+        head_unit="ft",
+        efficiency_unit=None,
+        power_unit=None,
+        npshr_unit=None,
+    )
+    ratios = [0.9, 1.0]
+    counts = [2, 1]
+    aggregate = build_parallel([base, steep], ratios, counts)
+    flows = np.linspace(0.005, 0.04, 8)
+    heads = aggregate.head(flows)
+    assert heads.shape == flows.shape
+
+    scaled = [scale_curve(curve, ratio) for curve, ratio in zip([base, steep], ratios)]
+    for flow, head in zip(flows, heads):
+        total = 0.0
+        for curve, count in zip(scaled, counts):
+            low, high = float(curve.scaled_flow()[0]), float(curve.scaled_flow()[-1])
+            if head >= curve.head_at(low):
+                total += low * count
+            elif head <= curve.head_at(high):
+                total += high * count
+            else:
+                total += brentq(lambda q: float(curve.head_at(q)) - head, low, high) * count
+        assert total == pytest.approx(flow, rel=1e-4)
+
+
+def test_hooked_curve_inverts_along_falling_branch():
+    hooked = PumpCurve(
+        flow_si=np.array([0.0, 0.01, 0.02, 0.03, 0.04]),
+        head_si=np.array([40.0, 46.0, 44.0, 35.0, 20.0]),
+        efficiency=None,
+        power=None,
+        npshr=None,
+        flow_unit="gpm",
+        head_unit="ft",
+        efficiency_unit=None,
+        power_unit=None,
+        npshr_unit=None,
+    )
+    flows = np.array([0.015, 0.02, 0.03, 0.035])
+    np.testing.assert_allclose(hooked.flow_at_head(hooked.head_at(flows)), flows, rtol=1e-3)
+    # Above shutoff but below the peak: the stable branch, not the shutoff flow.
+    assert float(hooked.flow_at_head(44.0)) == pytest.approx(0.02, rel=1e-3)
+    assert float(hooked.flow_at_head(50.0)) == pytest.approx(0.01, rel=1e-2)
+
+    single = build_parallel([hooked], [1.0], [1])
+    np.testing.assert_allclose(single.head(flows), hooked.head_at(flows), rtol=1e-3)
+    pair = build_parallel([hooked], [1.0], [2])
+    np.testing.assert_allclose(pair.head(2 * flows), hooked.head_at(flows), rtol=1e-3)
@@ -0,0 +1,87 @@
+import io
+import zipfile
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel, select
+
+from app.db import session_factory, sync_engine
+from app.main import app
+from app.models import Pump
+
+PUMP_CSV = b"flow,head,efficiency,power\n0,150,55,100\n500,140,70,120\n1000,120,75,160\n"
+METRIC_CSV = b"# units: flow m^3/hour, head m\nflow,head\n0,45\n100,40\n200,30\n"
+
+
+@pytest.fixture()
+def client():
+    SQLModel.metadata.drop_all(sync_engine)
+    SQLModel.metadata.create_all(sync_engine)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def bulk_import(client, files):
+    return client.post("/api/pumps/bulk-import", data={"rated_speed_rpm": "1750"}, files=[("files", item) for item in files])
+
+
+def stored_pumps():
+    with session_factory() as session:
+        return session.exec(select(Pump).order_by(Pump.id)).all()
+
+
+def zip_bytes(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+def test_bulk_import_csv_files_and_chains_versions(client):
+    response = bulk_import(client, [("P1.csv", PUMP_CSV), ("P2.csv", METRIC_CSV)])
+    assert response.status_code == 201
+    body = response.json()
+    assert body["imported"] == 2
+    assert [(pump["name"], pump["version"], pump["points"]) for pump in body["pumps"]] == [("P1", 1, 3), ("P2", 1, 3)]
+
+    again = bulk_import(client, [("P1.csv", PUMP_CSV)]).json()
+    assert again["pumps"][0]["version"] == 2
+    pumps = {(pump.name, pump.version): pump for pump in stored_pumps()}
+    assert pumps[("P1", 2)].pump_key == pumps[("P1", 1)].pump_key != pumps[("P2", 1)].pump_key
+    assert pumps[("P1", 1)].flow_unit == "gpm"
+    assert pumps[("P2", 1)].flow_unit == "m^3/hour"
+
+
+def test_bulk_import_reads_csv_members_of_zip(client):
+    archive = zip_bytes({"catalog/A.csv": PUMP_CSV, "catalog/B.CSV": METRIC_CSV, "catalog/readme.txt": b"notes"})
+    response = bulk_import(client, [("catalog.zip", archive)])
+    assert response.status_code == 201
+    assert [(pump["name"], pump["source"]) for pump in response.json()["pumps"]] == [
+        ("A", "catalog.zip:catalog/A.csv"),
+        ("B", "catalog.zip:catalog/B.CSV"),
+    ]
+
+
+def test_bulk_import_rejects_everything_when_one_file_fails(client):
+    response = bulk_import(client, [("good.csv", PUMP_CSV), ("bad.csv", b"flow,head\n0,10\n")])
+    assert response.status_code == 422
+    assert [error["file"] for error in response.json()["detail"]] == ["bad.csv"]
+    assert stored_pumps() == []
+
+
+def test_bulk_import_rejects_corrupt_zip(client):
+    response = bulk_import(client, [("catalog.zip", b"not a zip archive")])
+    assert response.status_code == 422
+    assert stored_pumps() == []
+
+
+@pytest.mark.parametrize(
+    "units_comment", ["# units: flow blorp/hour, head m", "# units: flow m^3/hour, head second"]
+)
+def test_bulk_import_rejects_bad_units(client, units_comment):
+    csv = f"{units_comment}\nflow,head\n0,45\n100,40\n".encode()
+    response = bulk_import(client, [("P1.csv", PUMP_CSV), ("P2.csv", csv)])
+    assert response.status_code == 422
+    assert response.json()["detail"].startswith("Unit conversion failed")
+    assert stored_pumps() == []
@@ -0,0 +1,123 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel
+
+from app.db import session_factory, sync_engine
+from app.main import app
+from app.models import Result, Scenario, SystemCurve
+from app.tasks import compute
+
+
+@pytest.fixture()
+def client():
+    SQLModel.metadata.drop_all(sync_engine)
+    SQLModel.metadata.create_all(sync_engine)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture()
+def exports(monkeypatch, tmp_path):
+    monkeypatch.setattr(compute, "EXPORT_ROOT", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture()
+def renders(monkeypatch):
+    calls = []
+
+    def fake_render(data, output_pdf):
+        calls.append(data["scenario"])
+        output_pdf.write_bytes(b"%PDF-1.7 report")
+        return output_pdf
+
+    monkeypatch.setattr(compute, "render_report", fake_render)
+    return calls
+
+
+def failing_render(data, output_pdf):
+    output_pdf.write_bytes(b"%PDF-1.7 trunc")
+    raise OSError("cannot load library 'libpango-1.0-0'")
+
+
+def pending_result():
+    with session_factory() as session:
+        curve = SystemCurve(
+            curve_key=1,
+            name="Main",
+            unit_system="si",
+            static_head=10.0,
+            static_head_unit="m",
+            resistance_coefficient=0.5,
+            flow_unit="m**3/s",
+            head_unit="m",
+            extra_terms={"terms": []},
+        )
+        session.add(curve)
+        session.flush()
+        scenario = Scenario(
+            name="Station",
+            system_curve_id=curve.id,
+            pumps={"items": []},
+            unit_system="si",
+            por_default_low=0.7,
+            por_default_high=1.2,
+            aor_default_low=0.5,
+            aor_default_high=1.3,
+        )
+        session.add(scenario)
+        session.flush()
+        result = Result(scenario_id=scenario.id, operating_points=[], csv_path="", pdf_path="", report_status="pending")
+        session.add(result)
+        session.flush()
+        result.pdf_path = f"files/result_{result.id}.pdf"
+        session.commit()
+        return result.id
+
+
+def report_status(result_id):
+    with session_factory() as session:
+        return session.get(Result, result_id).report_status
+
+
+def test_report_queue_marks_result_ready(client, exports, renders):
+    result_id = pending_result()
+    assert report_status(result_id) == "pending"
+    assert compute.render_result_report(result_id) == result_id
+    assert report_status(result_id) == "ready"
+    assert (exports / f"result_{result_id}.pdf").read_bytes() == b"%PDF-1.7 report"
+    assert [path.name for path in exports.iterdir()] == [f"result_{result_id}.pdf"]
+
+
+def test_report_queue_marks_result_failed_without_partial_file(client, exports, monkeypatch):
+    monkeypatch.setattr(compute, "render_report", failing_render)
+    result_id = pending_result()
+    with pytest.raises(OSError):
+        compute.render_result_report(result_id)
+    assert report_status(result_id) == "failed"
+    assert list(exports.iterdir()) == []
+
+
+def test_download_renders_pending_report_once(client, exports, renders):
+    result_id = pending_result()
+    for _ in range(2):
+        response = client.get(f"/files/result_{result_id}.pdf")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/pdf"
+        assert response.content == b"%PDF-1.7 report"
+    assert renders == ["Station"]
+    assert report_status(result_id) == "ready"
+
+
+def test_download_reports_rendering_failure(client, exports, monkeypatch):
+    monkeypatch.setattr(compute, "render_report", failing_render)
+    result_id = pending_result()
+    response = client.get(f"/files/result_{result_id}.pdf")
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Report rendering failed"
+    assert report_status(result_id) == "failed"
+    assert list(exports.iterdir()) == []
+
+
+def test_download_unknown_result(client):
+    assert client.get("/files/result_999.pdf").status_code == 404
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from app.services.curves import PumpCurve
+from app.services.optimize import optimize_speed
+from app.services.simulation import DutySeries, DutySimulation, parse_duty_csv_lines, simulate_duty
+from app.services.system import PolynomialSystemCurve
+
+
+def build_curve():
+    return PumpCurve(
+        flow_si=np.array([0.0, 0.01, 0.02, 0.03]),
+        head_si=np.array([50.0, 46.0, 38.0, 25.0]),
+        efficiency=np.array([0.3, 0.65, 0.78, 0.7]),
+        power=np.array([4000.0, 7000.0, 9500.0, 10500.0]),
+        npshr=None,
+        flow_unit="gpm",
+        head_unit="ft",
+        efficiency_unit="%",
+        power_unit="hp",
+        npshr_unit=None,
+    )
+
+
+def test_parse_duty_csv_converts_units():
+    lines = ["# units: demand m^3/s, level m", "hour,demand,level", "0,0.01,1.5", "1,0.02,2.0", "2,x,1.0"]
+    series = parse_duty_csv_lines(lines, step_hours=0.5)
+    np.testing.assert_allclose(series.demand, [0.01, 0.02])
+    np.testing.assert_allclose(series.level, [1.5, 2.0])
+    np.testing.assert_allclose(series.hours, [0.5, 0.5])
+    with pytest.raises(ValueError):
+        parse_duty_csv_lines(["flow,head", "1,2"])
+
+
+def test_simulate_duty_matches_optimize_speed_with_level():
+    curve = build_curve()
+    system = PolynomialSystemCurve(static_head=15.0, resistance_coefficient=8000.0)
+    demand = np.array([0.012, 0.03, 0.045, 0.02])
+    level = np.array([0.0, 2.0, 4.0, 6.0])
+    simulation = simulate_duty(curve, system, DutySeries(demand, level, np.ones(4)), max_running=3)
+    for step in range(demand.size):
+        shifted = PolynomialSystemCurve(static_head=15.0 + level[step], resistance_coefficient=8000.0)
+        expected = optimize_speed(curve, shifted, demand[step], max_running=3)
+        assert simulation.running[step] == expected.running[0]
+        np.testing.assert_allclose(simulation.speed_ratio[step], expected.speed_ratio[0], rtol=1e-8)
+        np.testing.assert_allclose(simulation.power[step], expected.power[0], rtol=1e-8)
+    np.testing.assert_allclose(simulation.energy_kwh, simulation.power / 1000.0)
+
+
+def test_idle_and_unmet_steps_draw_no_power():
+    curve = build_curve()
+    system = PolynomialSystemCurve(static_head=15.0, resistance_coefficient=8000.0)
+    series = DutySeries(np.array([0.0, 0.01, 1.0]), np.zeros(3), np.full(3, 2.0))
+    simulation = simulate_duty(curve, system, series, max_running=2)
+    assert simulation.running.tolist()[0] == 0 and simulation.running[1] > 0
+    assert simulation.unmet.tolist() == [False, False, True]
+    assert simulation.power[0] == 0.0 and simulation.power[2] == 0.0
+    totals = simulation.totals()
+    assert totals["unmet_hours"] == 2.0 and totals["run_hours"] == 2.0
+    np.testing.assert_allclose(totals["pumped_m3"], 0.01 * 2 * 3600)
+
+
+def test_chunks_concatenate_to_single_pass():
+    curve = build_curve()
+    system = PolynomialSystemCurve(static_head=15.0, resistance_coefficient=8000.0)
+    hours = np.arange(50)
+    series = DutySeries(0.02 + 0.015 * np.sin(hours / 4.0), 3.0 * np.cos(hours / 7.0), np.ones(50))
+    whole = simulate_duty(curve, system, series, max_running=3)
+    parts = [simulate_duty(curve, system, series.window(start, start + 16), max_running=3) for start in range(0, 50, 16)]
+    chunked = DutySimulation.concatenate(parts)
+    np.testing.assert_allclose(chunked.power, whole.power)
+    assert chunked.totals() == whole.totals()
@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+
+from app.services.curves import PumpCurve
+from app.services.optimize import optimize_speed
+from app.services.staging import StagingGroup, StagingTable, build_staging_table
+from app.services.storage import prune_files
+from app.services.system import PolynomialSystemCurve
+from app.tasks import compute
+
+
+def build_curve(scale=1.0):
+    return PumpCurve(
+        flow_si=np.array([0.0, 0.01, 0.02, 0.03]) * scale,
+        head_si=np.array([50.0, 46.0, 38.0, 25.0]),
+        efficiency=np.array([0.3, 0.65, 0.78, 0.7]),
+        power=np.array([4000.0, 7000.0, 9500.0, 10500.0]) * scale,
+        npshr=None,
+        flow_unit="gpm",
+        head_unit="ft",
+        efficiency_unit="%",
+        power_unit="hp",
+        npshr_unit=None,
+    )
+
+
+def test_staging_lookup_matches_optimize_speed():
+    system = PolynomialSystemCurve(static_head=15.0, resistance_coefficient=8000.0)
+    groups = [StagingGroup(build_curve(), 3), StagingGroup(build_curve(1.5), 2)]
+    table = build_staging_table(groups, system, points=512)
+    demand = np.array([0.005, 0.025, 0.045])
+    staging = table.lookup(demand)
+    assert staging["feasible"].all()
+    for i, flow in enumerate(demand):
+        selections = [optimize_speed(group.curve, system, flow, group.count) for group in groups]
+        best = int(np.argmin([selection.power[0] for selection in selections]))
+        assert staging["group"][i] == best
+        assert staging["running"][i] == selections[best].running[0]
+        np.testing.assert_allclose(staging["speed_ratio"][i], selections[best].speed_ratio[0], rtol=1e-3)
+        np.testing.assert_allclose(staging["power"][i], selections[best].power[0], rtol=1e-3)
+
+
+def test_staging_lookup_idle_and_out_of_range(tmp_path):
+    system = PolynomialSystemCurve(static_head=15.0, resistance_coefficient=8000.0)
+    table = build_staging_table([StagingGroup(build_curve(), 2)], system, points=128)
+    staging = table.lookup([0.0, table.max_flow * 2])
+    np.testing.assert_array_equal(staging["feasible"], [True, False])
+    np.testing.assert_array_equal(staging["running"], [0, 0])
+    assert staging["power"][0] == 0.0 and np.isnan(staging["power"][1])
+
+    loaded = StagingTable.load(table.save(tmp_path / "table.npz"))
+    for name in StagingTable.__dataclass_fields__:
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(table, name))
+
+
+def test_prune_files_keeps_most_recent(tmp_path):
+    for i in range(4):
+        path = tmp_path / f"staging_{i}.npz"
+        path.write_bytes(b"x")
+        os.utime(path, (i, i))
+    (tmp_path / "other.npz").write_bytes(b"x")
+    assert prune_files(tmp_path, "staging_*.npz", keep=2) == 2
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["other.npz", "staging_2.npz", "staging_3.npz"]
+
+
+def test_cached_staging_table_persists_outside_exports(tmp_path, monkeypatch):
+    monkeypatch.setattr(compute, "STAGING_ROOT", tmp_path)
+    compute.staging_cache.clear()
+    system = PolynomialSystemCurve(static_head=15.0, resistance_coefficient=8000.0)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return build_staging_table([StagingGroup(build_curve(), 2)], system, points=64)
+
+    table = compute.cached_staging_table("abc", build)
+    assert (tmp_path / "staging_abc.npz").exists()
+    compute.staging_cache.clear()
+    reloaded = compute.cached_staging_table("abc", build)
+    assert len(builds) == 1
+    np.testing.assert_array_equal(reloaded.flow, table.flow)
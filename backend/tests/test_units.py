@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+from pint.errors import DimensionalityError
+
+from app.core.units import COMMON_CONVERSIONS, conversion_factors, convert, convert_array, ensure_quantity
+
+
+@pytest.mark.parametrize(
+    "from_unit,to_unit",
+    [("gpm", "meter**3/second"), ("ft", "meter"), ("hp", "watt"), ("%", "dimensionless"), ("degF", "degC")],
+)
+def test_fast_path_matches_pint(from_unit, to_unit):
+    values = np.linspace(0.0, 2000.0, 11)
+    expected = convert(ensure_quantity(values, from_unit), to_unit).magnitude
+    np.testing.assert_allclose(convert_array(values, from_unit, to_unit), expected, rtol=1e-12, atol=1e-9)
+
+
+def test_conversion_factors_are_cached_and_checked():
+    conversion_factors.cache_clear()
+    convert_array([1.0, 2.0], "ft", "meter")
+    convert_array(np.arange(5.0), "ft", "meter")
+    assert conversion_factors.cache_info().hits == 1
+    with pytest.raises(DimensionalityError):
+        convert_array([1.0], "gpm", "meter")
+
+
+@pytest.mark.parametrize("from_unit,to_unit", sorted(COMMON_CONVERSIONS))
+def test_common_conversion_table_matches_pint(from_unit, to_unit):
+    scale, offset = COMMON_CONVERSIONS[(from_unit, to_unit)]
+    expected = convert(ensure_quantity([0.0, 1.0], from_unit), to_unit).magnitude
+    np.testing.assert_allclose([offset, scale + offset], expected, rtol=1e-12, atol=0.0)
@@ -1,4 +1,4 @@
-import api from "@/lib/api";
+import api, { getPumpCurve } from "@/lib/api";
 import { CurveChart } from "@/components/curve-chart";
 
 async function fetchPump(id: string) {
@@ -7,12 +7,12 @@ async function fetchPump(id: string) {
 }
 
 export default async function PumpDetailPage({ params }: { params: { id: string } }) {
-  const pump = await fetchPump(params.id);
+  const [pump, curve] = await Promise.all([fetchPump(params.id), getPumpCurve(params.id)]);
   const trace = {
     name: pump.name,
-    x: pump.curve_points.map((p: any) => p.flow),
-    y: pump.curve_points.map((p: any) => p.head),
-    mode: "lines"
+    x: curve.flow,
+    y: curve.head,
+    mode: "lines" as const
   };
   return (
     <main className="mx-auto max-w-5xl space-y-6 py-10">
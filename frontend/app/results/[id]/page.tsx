@@ -1,4 +1,4 @@
-import api from "@/lib/api";
+import api, { resultExportUrl } from "@/lib/api";
 import { CurveChart } from "@/components/curve-chart";
 
 async function fetchResult(id: string) {
@@ -38,7 +38,10 @@ export default async function ResultPage({ params }: { params: { id: string } })
           <tbody>
             {result.operating_points.map((point: any, idx: number) => (
               <tr key={idx} className="border-t">
-                <td className="p-2">{point.configuration}</td>
+                <td className="p-2">
+                  {point.configuration}
+                  {point.unstable ? <span className="ml-2 text-amber-600">unstable</span> : null}
+                </td>
                 <td className="p-2">{point.speed_ratio.toFixed(2)}</td>
                 <td className="p-2">{point.flow.toFixed(3)}</td>
                 <td className="p-2">{point.head.toFixed(2)}</td>
@@ -52,6 +55,12 @@ export default async function ResultPage({ params }: { params: { id: string } })
           <a className="rounded bg-brand px-3 py-2 text-sm text-white" href={`/${result.csv_path}`}>
             Download data (JSON)
           </a>
+          <a className="rounded bg-brand px-3 py-2 text-sm text-white" href={resultExportUrl(params.id, "csv")}>
+            Export CSV
+          </a>
+          <a className="rounded bg-brand px-3 py-2 text-sm text-white" href={resultExportUrl(params.id, "parquet")}>
+            Export Parquet
+          </a>
           <a className="rounded bg-brand px-3 py-2 text-sm text-white" href={`/${result.pdf_path}`}>
             Download PDF
           </a>
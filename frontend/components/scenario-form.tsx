@@ -4,7 +4,7 @@ import { useForm, useFieldArray } from "react-hook-form";
 import { z } from "zod";
 import { zodResolver } from "@hookform/resolvers/zod";
 import { useMutation, useQuery } from "@tanstack/react-query";
-import api, { createScenario } from "@/lib/api";
+import { createScenario, listAll } from "@/lib/api";
 import { useState } from "react";
 
 const pumpConfigSchema = z.object({
@@ -43,10 +43,13 @@ export function ScenarioForm() {
     onError: (error) => setMessage(`Error: ${(error as Error).message}`)
   });
 
-  const { data: pumps } = useQuery({ queryKey: ["pumps"], queryFn: () => api.get("/api/pumps").then((res) => res.data) });
+  const { data: pumps } = useQuery({
+    queryKey: ["pumps", "summary"],
+    queryFn: () => listAll("/api/pumps", { fields: "summary", latest_only: true })
+  });
   const { data: systemCurves } = useQuery({
-    queryKey: ["system-curves"],
-    queryFn: () => api.get("/api/system-curves").then((res) => res.data)
+    queryKey: ["system-curves", "summary"],
+    queryFn: () => listAll("/api/system-curves", { fields: "summary", latest_only: true })
   });
 
   return (
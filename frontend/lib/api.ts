@@ -27,8 +27,66 @@ export async function createPump(payload: PumpInput) {
   return api.post("/api/pumps", payload).then((res) => res.data);
 }
 
-export async function listPumps() {
-  return api.get("/api/pumps").then((res) => res.data);
+export interface PumpImportDefaults {
+  rated_speed_rpm: number;
+  unit_system?: "us" | "si";
+  flow_unit?: string;
+  head_unit?: string;
+  efficiency_unit?: string;
+  power_unit?: string;
+  npshr_unit?: string;
+}
+
+export async function bulkImportPumps(files: File[], defaults: PumpImportDefaults) {
+  const form = new FormData();
+  files.forEach((file) => form.append("files", file));
+  Object.entries(defaults).forEach(([key, value]) => {
+    if (value !== undefined) form.append(key, String(value));
+  });
+  return api.post("/api/pumps/bulk-import", form).then((res) => res.data);
+}
+
+export interface ListParams {
+  limit?: number;
+  cursor?: number;
+  name?: string;
+  latest_only?: boolean;
+  fields?: "full" | "summary";
+}
+
+export async function listPumps(params: ListParams = {}) {
+  return api.get("/api/pumps", { params }).then((res) => res.data);
+}
+
+// Follows the X-Next-Cursor header until the last page.
+export async function listAll(path: string, params: ListParams = {}) {
+  const items: any[] = [];
+  let cursor: number | undefined;
+  do {
+    const res = await api.get(path, { params: { limit: 500, ...params, cursor } });
+    items.push(...res.data);
+    const next = res.headers["x-next-cursor"];
+    cursor = next ? Number(next) : undefined;
+  } while (cursor !== undefined);
+  return items;
+}
+
+export interface SampledCurve {
+  name: string;
+  kind: "pump" | "system" | "aggregate";
+  speed_ratio: number | null;
+  flow: number[];
+  head: number[];
+  efficiency: number[] | null;
+  power: number[] | null;
+}
+
+export async function getPumpCurve(id: number | string, points = 200): Promise<SampledCurve> {
+  return api.get(`/api/pumps/${id}/curve`, { params: { points } }).then((res) => res.data);
+}
+
+export async function getScenarioCurves(id: number | string, points = 200): Promise<SampledCurve[]> {
+  return api.get(`/api/scenarios/${id}/curves`, { params: { points } }).then((res) => res.data.curves);
 }
 
 export async function createScenario(payload: ScenarioInput) {
@@ -39,8 +97,75 @@ export async function computeScenario(id: number) {
   return api.post(`/api/scenarios/${id}/compute`).then((res) => res.data);
 }
 
+export interface SpeedOptimizationInput {
+  target_flow?: number;
+  target_head?: number;
+  flow_unit?: string;
+  head_unit?: string;
+  min_speed_ratio?: number;
+  max_speed_ratio?: number;
+}
+
+export async function optimizeScenarioSpeed(id: number, payload: SpeedOptimizationInput) {
+  return api.post(`/api/scenarios/${id}/optimize-speed`, payload).then((res) => res.data);
+}
+
+export async function getScenarioStaging(id: number | string, flows: number[] = [], flowUnit = "meter**3/second") {
+  const params = new URLSearchParams({ flow_unit: flowUnit });
+  flows.forEach((flow) => params.append("flow", String(flow)));
+  return api.get(`/api/scenarios/${id}/staging`, { params }).then((res) => res.data);
+}
+
+export interface SimulationOptions {
+  step_hours?: number;
+  min_speed_ratio?: number;
+  max_speed_ratio?: number;
+}
+
+// Demand CSV: a demand column, optional level and hours columns, "# units:" comment.
+export async function submitSimulation(scenarioId: number, file: File, options: SimulationOptions = {}) {
+  const form = new FormData();
+  form.append("scenario_id", String(scenarioId));
+  form.append("file", file);
+  Object.entries(options).forEach(([key, value]) => {
+    if (value !== undefined) form.append(key, String(value));
+  });
+  return api.post("/api/simulations", form).then((res) => res.data);
+}
+
+export async function getSimulation(taskId: string) {
+  return api.get(`/api/simulations/${taskId}`).then((res) => res.data);
+}
+
+export interface LifecycleCostInput {
+  pump_ids: number[];
+  system_curve_id: number;
+  duty: { flow: number; hours: number }[];
+  flow_unit?: string;
+  max_running?: number;
+  arrangement?: "parallel" | "series";
+  energy_price: number;
+  demand_charge?: number;
+  escalation?: number;
+  discount_rate?: number;
+  years?: number;
+  capital_costs?: Record<number, number>;
+}
+
+export async function submitLifecycleCosts(payload: LifecycleCostInput) {
+  return api.post("/api/lifecycle-costs", payload).then((res) => res.data);
+}
+
+export async function getLifecycleCosts(taskId: string) {
+  return api.get(`/api/lifecycle-costs/${taskId}`).then((res) => res.data);
+}
+
 export async function getResult(id: number) {
   return api.get(`/api/results/${id}`).then((res) => res.data);
 }
 
+export function resultExportUrl(id: number | string, format: "csv" | "ndjson" | "parquet") {
+  return `${api.defaults.baseURL}/api/results/${id}/export?format=${format}`;
+}
+
 export default api;